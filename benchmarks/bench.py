@@ -0,0 +1,291 @@
+"""
+Offline benchmarks for mlbdatatools.
+
+Responses are replayed from a local HTTP server so runs are repeatable and
+need no network. benchmarks/fixtures holds a small default set (three game
+feeds, their schedule and one savant page) in the statsapi and savant
+formats, so results can be compared between revisions out of the box:
+
+    # run against the default fixtures and save the results
+    python benchmarks/bench.py run --output results.json
+
+    # record other fixtures from the live APIs and run against them
+    python benchmarks/bench.py --fixtures my_fixtures record --games 747060 747061 --schedule 2024-03-28 2024-04-03 --players 660271
+    python benchmarks/bench.py --fixtures my_fixtures run
+
+    # compare against results from another version, exits 1 on regressions
+    python benchmarks/bench.py run --compare results.json --threshold 0.1
+
+Reported metrics: gamefeed parse throughput (pitches/sec, games/sec) with and
+without the local HTTP round trip, schedule and savant page parse time,
+DataFrame conversion time, peak memory of a gamefeeds call, and render time
+of each mlbplot chart.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'mlbdatatools'))
+
+import requests
+from requests.adapters import HTTPAdapter
+from datatypes import EntryList
+import utils
+import ratelimit
+import mlbfetch
+
+DEFAULT_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+MANIFEST = 'manifest.json'
+
+
+def _fixture_name(url: str) -> str:
+    return hashlib.sha256(url.encode('utf-8')).hexdigest()[:24] + '.gz'
+
+def _load_manifest(fixtures: str) -> dict:
+    path = os.path.join(fixtures, MANIFEST)
+    if not os.path.exists(path):
+        raise SystemExit(f"no fixtures in {fixtures}, record them first with: bench.py record ...")
+    with open(path) as f:
+        return json.load(f)
+
+
+# recording
+
+def record(args):
+    os.makedirs(args.fixtures, exist_ok=True)
+    urls: dict[str, str] = {}
+
+    def save(r, *_, **__):
+        name = _fixture_name(r.url)
+        with gzip.open(os.path.join(args.fixtures, name), 'wb') as f:
+            f.write(r.content)
+        urls[r.url] = name
+
+    session = utils.make_session()
+    session.hooks['response'].append(save)
+    utils.set_session(session)
+    utils.set_cache(None)
+    for game_id in args.games:
+        mlbfetch.gamefeed(game_id)
+    if args.schedule:
+        mlbfetch.schedule(*args.schedule)
+    for player_id in args.players:
+        mlbfetch.savant_batter_page(player_id)
+    manifest = {
+        'games': args.games,
+        'schedule': args.schedule,
+        'players': args.players,
+        'urls': urls,
+    }
+    with open(os.path.join(args.fixtures, MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    print(f"recorded {len(urls)} responses to {args.fixtures}")
+
+
+# replaying
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    fixtures = ''
+    urls: dict[str, str] = {}
+
+    def do_GET(self):
+        # the original url is the request path without the leading slash
+        name = self.urls.get(self.path[1:])
+        if name is None:
+            self.send_error(404, f"no fixture for {self.path[1:]}")
+            return
+        with gzip.open(os.path.join(self.fixtures, name), 'rb') as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class _LocalAdapter(HTTPAdapter):
+    # send every request to the local fixture server, keeping the original url in the path
+    def __init__(self, base: str, **kwargs):
+        self.base = base
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        request.url = self.base + '/' + request.url
+        return super().send(request, **kwargs)
+
+def serve_fixtures(fixtures: str, manifest: dict) -> ThreadingHTTPServer:
+    handler = type('Handler', (_FixtureHandler,), {'fixtures': fixtures, 'urls': manifest['urls']})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    session = requests.Session()
+    adapter = _LocalAdapter(f"http://127.0.0.1:{server.server_address[1]}", pool_maxsize=32)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    utils.set_session(session)
+    utils.set_cache(None)
+    ratelimit.set_scheduler(None) # the local server has no limits
+    return server
+
+def _fixture_json(fixtures: str, manifest: dict, fragment: str):
+    for url, name in manifest['urls'].items():
+        if fragment in url:
+            with gzip.open(os.path.join(fixtures, name), 'rb') as f:
+                return f.read().decode('utf-8')
+    raise KeyError(fragment)
+
+
+# measuring
+
+def _timeit(func, repeat: int) -> float:
+    # median wall time in seconds
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+def run(args) -> dict:
+    manifest = _load_manifest(args.fixtures)
+    server = serve_fixtures(args.fixtures, manifest)
+    results: dict[str, float] = {}
+    try:
+        games = manifest['games']
+        raw_feeds = {g: _fixture_json(args.fixtures, manifest, f"/game/{g}/feed/live") for g in games}
+        n_pitches = sum(len(mlbfetch._parse_gamefeed(json.loads(t), g).pitches) for g, t in raw_feeds.items())
+
+        def parse_feeds():
+            for g, text in raw_feeds.items():
+                mlbfetch._parse_gamefeed(json.loads(text), g)
+        parse_time = _timeit(parse_feeds, args.repeat)
+        results['gamefeed_parse_games_per_sec'] = len(games) / parse_time
+        results['gamefeed_parse_pitches_per_sec'] = n_pitches / parse_time
+
+        fetch_time = _timeit(lambda: mlbfetch.gamefeeds(games), args.repeat)
+        results['gamefeeds_local_games_per_sec'] = len(games) / fetch_time
+        results['gamefeeds_local_pitches_per_sec'] = n_pitches / fetch_time
+
+        tracemalloc.start()
+        response = mlbfetch.gamefeeds(games)
+        results['gamefeeds_peak_memory_mb'] = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+        tracemalloc.stop()
+
+        # scale the pitch table up so conversion times are measurable
+        pitches = EntryList(list(response.pitches) * args.scale)
+        columns = pitches.to_columns()
+        results['pitches_rows'] = len(pitches)
+        results['to_pandas_sec'] = _timeit(pitches.to_pandas, args.repeat)
+        results['to_polars_sec'] = _timeit(pitches.to_polars, args.repeat)
+        results['to_columns_sec'] = _timeit(pitches.to_columns, args.repeat)
+        results['columns_to_pandas_sec'] = _timeit(columns.to_pandas, args.repeat)
+
+        if manifest.get('schedule'):
+            results['schedule_sec'] = _timeit(lambda: mlbfetch.schedule(*manifest['schedule']), args.repeat)
+        savant_pages = []
+        if manifest.get('players'):
+            def fetch_pages():
+                # replaced on every repeat, the plots only need one set of pages
+                savant_pages[:] = [mlbfetch.savant_batter_page(p) for p in manifest['players']]
+            results['savant_batter_page_sec'] = _timeit(fetch_pages, args.repeat) / len(manifest['players'])
+
+        if not args.skip_plots:
+            results.update(_plot_benchmarks(response.pitches.to_pandas(), savant_pages, args.repeat))
+    finally:
+        server.shutdown()
+    return results
+
+def _plot_benchmarks(pitches_df, savant_pages, repeat: int) -> dict:
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import mlbplot
+
+    def render(func, *func_args):
+        def draw():
+            fig = func(*func_args, show=False)
+            fig.canvas.draw()
+            plt.close(fig)
+        return _timeit(draw, repeat)
+
+    results = {
+        'plot_pitch_locations_sec': render(mlbplot.pitch_locations, pitches_df),
+        'plot_pitch_movements_sec': render(mlbplot.pitch_movements, pitches_df),
+        'plot_spray_chart_sec': render(mlbplot.spray_chart, pitches_df),
+    }
+    seasons = [s for page in savant_pages for s in page.savant_seasons]
+    if seasons:
+        results['plot_savant_percentile_chart_sec'] = render(mlbplot.plot_savant_percentile_chart_dynamic, seasons[0])
+    return results
+
+
+# reporting
+
+# metrics where a larger value is better, everything else is a time or size
+HIGHER_IS_BETTER = ('_per_sec',)
+
+def compare(current: dict, baseline: dict, threshold: float) -> bool:
+    regressed = False
+    print(f"{'metric':40} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, value in current.items():
+        if name not in baseline or name == 'pitches_rows' or not baseline[name]:
+            continue
+        change = value / baseline[name] - 1
+        worse = -change if name.endswith(HIGHER_IS_BETTER) else change
+        flag = ' REGRESSION' if worse > threshold else ''
+        regressed |= bool(flag)
+        print(f"{name:40} {baseline[name]:12.4g} {value:12.4g} {change:+8.1%}{flag}")
+    return regressed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES, help="directory of recorded responses")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = commands.add_parser('record', help="record fixtures from the live APIs")
+    record_parser.add_argument('--games', type=int, nargs='+', required=True)
+    record_parser.add_argument('--schedule', nargs=2, metavar=('START_DATE', 'END_DATE'))
+    record_parser.add_argument('--players', type=int, nargs='*', default=[])
+
+    run_parser = commands.add_parser('run', help="run the benchmarks against recorded fixtures")
+    run_parser.add_argument('--repeat', type=int, default=5)
+    run_parser.add_argument('--scale', type=int, default=20, help="copies of the fixture pitches used for conversion benchmarks")
+    run_parser.add_argument('--skip-plots', action='store_true')
+    run_parser.add_argument('--output', help="write results as JSON")
+    run_parser.add_argument('--compare', help="results JSON from another version")
+    run_parser.add_argument('--threshold', type=float, default=0.1, help="relative slowdown reported as a regression")
+
+    args = parser.parse_args()
+    if args.command == 'record':
+        record(args)
+        return
+    results = run(args)
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+    else:
+        for name, value in results.items():
+            print(f"{name:40} {value:12.4g}")
+
+if __name__ == '__main__':
+    main()
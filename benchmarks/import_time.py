@@ -0,0 +1,68 @@
+"""
+Startup time of mlbdatatools modules.
+
+Each import runs in a fresh interpreter so nothing is cached between runs.
+Reports the median wall time of the import and which heavy dependencies it
+pulled in:
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 20 --output import_times.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'mlbdatatools')
+
+# statements timed, from what a fetch-only worker needs to everything
+IMPORTS = {
+    'utils': 'import utils',
+    'mlbfetch': 'import mlbfetch',
+    'mlbfetch+schedule_parse': 'import mlbfetch; mlbfetch._parse_schedule({"dates": []})',
+    'datatypes': 'import datatypes',
+    'datatypes+to_pandas': 'import datatypes; datatypes.EntryList().to_pandas()',
+    'mlbplot': 'import mlbplot',
+}
+HEAVY_MODULES = ('numpy', 'pandas', 'polars', 'matplotlib', 'bs4', 'aiohttp', 'pyarrow')
+
+SCRIPT = """
+import sys, time, json
+sys.path.insert(0, {path!r})
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'loaded': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+def time_import(statement: str, repeat: int) -> tuple[float, list[str]]:
+    script = SCRIPT.format(path=PACKAGE_DIR, statement=statement, heavy=HEAVY_MODULES)
+    times = []
+    loaded = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True).stdout
+        result = json.loads(out.strip().splitlines()[-1])
+        times.append(result['seconds'])
+        loaded = result['loaded']
+    return statistics.median(times), loaded
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--output', help="write results as JSON")
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'import':28} {'ms':>8}  heavy dependencies loaded")
+    for name, statement in IMPORTS.items():
+        seconds, loaded = time_import(statement, args.repeat)
+        results[f'import_{name}_sec'] = seconds
+        print(f"{name:28} {seconds * 1000:8.1f}  {', '.join(loaded) or '-'}")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'python': sys.version.split()[0], 'results': results}, f, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,18 @@
-from . import mlbfetch
-from . import mlbplot
-from . import datatypes
\ No newline at end of file
+"""
+Submodules are imported on first access, so e.g. a worker that only uses
+mlbfetch never imports matplotlib (mlbplot) or pandas/polars (until it
+converts a list to a DataFrame).
+"""
+import importlib
+
+__all__ = ['mlbfetch', 'mlbplot', 'datatypes']
+
+def __getattr__(name: str):
+    if name in __all__:
+        module = importlib.import_module(f'.{name}', __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,242 @@
+"""
+Async versions of the mlbfetch endpoints, reachable as mlbfetch.aio.
+
+Requests go through a shared aiohttp session with a connection limit, and
+responses are parsed with the same code as the blocking functions in mlbfetch.
+Requires aiohttp (pip install aiohttp).
+"""
+from datatypes import (
+    EntryList, Game, Player, Team, Venue, DefensePlay,
+    GamefeedResponse, GamefeedsResponse, SavantBatterPage, SavantBatterPagesResponse
+)
+from utils import cache_lookup, cache_store, get_cache, Ttl, RETRY_STATUSES
+from metrics import RequestEvent
+from urllib.parse import urlsplit
+import mlbfetch
+import metrics
+import ratelimit
+import asyncio
+import json
+import random
+import time
+from typing import Any, Callable, Iterable
+
+_session = None
+_session_loop: asyncio.AbstractEventLoop | None = None
+_limit = 100 # connections open at once
+_limit_per_host = 50
+_timeout = 30 # seconds per request
+_max_retries = 5
+_backoff_factor = 0.5
+_backoff_jitter = 0.5
+
+
+def configure(
+    limit: int = 100,
+    limit_per_host: int = 50,
+    timeout: float = 30,
+    max_retries: int = 5,
+    backoff_factor: float = 0.5,
+    backoff_jitter: float = 0.5,
+):
+    """
+    Sets connection limits and retry behaviour for the async client. Takes effect
+    for sessions created afterwards, call close() first to replace an open one.
+
+    Parameters:
+        limit (int): Maximum connections open at once.
+        limit_per_host (int): Maximum connections open to a single host.
+        timeout (float): Total seconds allowed per request.
+        max_retries (int): Retries for connection errors and 429/5xx responses.
+        backoff_factor (float): Exponential backoff base, sleeps backoff_factor * 2 ** retry seconds.
+        backoff_jitter (float): Maximum random seconds added to each backoff.
+    """
+    global _limit, _limit_per_host, _timeout, _max_retries, _backoff_factor, _backoff_jitter
+    _limit = limit
+    _limit_per_host = limit_per_host
+    _timeout = timeout
+    _max_retries = max_retries
+    _backoff_factor = backoff_factor
+    _backoff_jitter = backoff_jitter
+
+async def get_session():
+    # a session is bound to the event loop it was created on
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        try:
+            import aiohttp
+        except ImportError as e:
+            raise ImportError("mlbfetch.aio requires aiohttp: pip install aiohttp") from e
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=_limit, limit_per_host=_limit_per_host),
+            timeout=aiohttp.ClientTimeout(total=_timeout),
+        )
+        _session_loop = loop
+    return _session
+
+async def close():
+    # close the shared session, call before the event loop shuts down
+    global _session, _session_loop
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+async def _get(url: str, params: dict | None, ttl: Ttl, decode: Callable[[str], Any], endpoint: str | None):
+    import aiohttp
+    instrumented = metrics.enabled()
+    endpoint = endpoint or urlsplit(url).path
+    start = time.perf_counter()
+    # a DiskCache reads and writes files under a lock, so it runs on a worker
+    # thread instead of blocking the event loop
+    cacheable = bool(ttl) and get_cache() is not None
+    cached = await asyncio.to_thread(cache_lookup, url, params, ttl) if cacheable else None
+    if cached is not None:
+        looked_up = time.perf_counter()
+        value = decode(cached)
+        if instrumented:
+            metrics.emit(RequestEvent(
+                endpoint, url, None, looked_up - start, time.perf_counter() - looked_up,
+                len(cached), 0, cache_hit=True
+            ))
+        return value
+    session = await get_session()
+    host = urlsplit(url).hostname
+    queued = 0
+    query = {k: str(v) for k, v in params.items()} if params else None
+    for attempt in range(_max_retries + 1):
+        delay = _backoff_factor * 2 ** attempt + random.uniform(0, _backoff_jitter)
+        waited = await ratelimit.acquire_async(host)
+        queued += waited
+        start += waited
+        try:
+            async with session.get(url, params=query) as r:
+                if r.status in RETRY_STATUSES and attempt < _max_retries:
+                    retry_after = r.headers.get('Retry-After', '')
+                    if retry_after.isdigit():
+                        delay = max(delay, int(retry_after))
+                else:
+                    body = await r.read()
+                    fetched = time.perf_counter()
+                    text = body.decode(r.get_encoding())
+                    error = None
+                    try:
+                        value = decode(text)
+                    except Exception as e:
+                        error = repr(e)
+                        raise
+                    finally:
+                        if instrumented:
+                            metrics.emit(RequestEvent(
+                                endpoint, str(r.url), r.status, fetched - start, time.perf_counter() - fetched,
+                                len(body), attempt, False, error=error, queue_time=queued
+                            ))
+                    if r.status < 400 and cacheable:
+                        await asyncio.to_thread(cache_store, url, params, ttl, text, value)
+                    return value
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            if attempt == _max_retries:
+                if instrumented:
+                    metrics.emit(RequestEvent(
+                        endpoint, url, None, time.perf_counter() - start, 0, 0, attempt, False,
+                        error=repr(e), queue_time=queued
+                    ))
+                raise
+        await asyncio.sleep(delay)
+
+async def get_request_json(url: str, params: dict | None = None, ttl: Ttl = 0, endpoint: str | None = None):
+    return await _get(url, params, ttl, json.loads, endpoint)
+
+async def get_request_text(url: str, params: dict | None = None, ttl: Ttl = 0, endpoint: str | None = None):
+    return await _get(url, params, ttl, lambda text: text, endpoint)
+
+async def _reference(endpoint: str, request: tuple[str, dict | None, Ttl], parse: Callable[[dict], EntryList], refresh: bool) -> EntryList:
+    # mlbfetch._reference, sharing its in-process cache
+    cached = None if refresh else mlbfetch._cached_reference(request)
+    if cached is not None:
+        return cached
+    data = await get_request_json(*request, endpoint=endpoint)
+    return mlbfetch._store_reference(request, metrics.parse(endpoint, parse, data))
+
+async def players(sport_id: int = 1, season: int = 2024, refresh: bool = False) -> EntryList[Player]:
+    """Async version of mlbfetch.players, sharing its in-process cache."""
+    return EntryList(await _reference('players', mlbfetch._players_request(sport_id, season), mlbfetch._parse_players, refresh))
+
+async def teams(season: int = 2024, refresh: bool = False) -> EntryList[Team]:
+    """Async version of mlbfetch.teams, sharing its in-process cache."""
+    return EntryList(await _reference('teams', mlbfetch._teams_request(season), mlbfetch._parse_teams, refresh))
+
+async def venues(refresh: bool = False) -> EntryList[Venue]:
+    """Async version of mlbfetch.venues, sharing its in-process cache."""
+    return EntryList(await _reference('venues', mlbfetch._venues_request(), mlbfetch._parse_venues, refresh))
+
+async def defense_plays(entity_id: int, start_year: int, end_year: int | None) -> EntryList[DefensePlay]:
+    """Async version of mlbfetch.defense_plays."""
+    request = mlbfetch._defense_plays_request(entity_id, start_year, end_year)
+    data = await get_request_json(*request, endpoint='defense_plays')
+    return metrics.parse('defense_plays', mlbfetch._parse_defense_plays, data)
+
+async def gamefeed(game_id: int) -> GamefeedResponse:
+    """Async version of mlbfetch.gamefeed."""
+    data = await get_request_json(*mlbfetch._gamefeed_request(game_id), endpoint='gamefeed')
+    return metrics.parse('gamefeed', mlbfetch._parse_gamefeed, data, game_id)
+
+async def gamefeeds(game_ids: list[int]) -> GamefeedsResponse:
+    """
+    Async version of mlbfetch.gamefeeds. All feeds are requested at once, the
+    number in flight is bounded by the session's connection limit.
+    """
+    results = await asyncio.gather(*(gamefeed(g_id) for g_id in game_ids), return_exceptions=True)
+    responses: list[GamefeedResponse | None] = []
+    errors: dict[int, Exception] = {}
+    for g_id, result in zip(game_ids, results):
+        if isinstance(result, Exception):
+            errors[g_id] = result
+            responses.append(None)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            responses.append(result)
+    return mlbfetch._merge_gamefeeds(responses, errors)
+
+async def schedule(
+    start_date: str,
+    end_date: str | None = None,
+    sport_id: int = 1,
+    hydrate: Iterable[str] = mlbfetch.SCHEDULE_HYDRATE,
+    chunk_days: int | None = None,
+) -> EntryList[Game]:
+    """Async version of mlbfetch.schedule, chunks are all requested at once."""
+    if chunk_days is not None and chunk_days < 1:
+        raise ValueError(f"chunk_days must be at least 1, got {chunk_days}")
+    hydrate = tuple(hydrate)
+    chunks = mlbfetch._schedule_chunks(start_date, end_date or start_date, chunk_days)
+    games: EntryList[Game] = EntryList()
+    for chunk_games in await asyncio.gather(*(_schedule_chunk(chunk, sport_id, hydrate) for chunk in chunks)):
+        games.extend(chunk_games)
+    return games
+
+async def _schedule_chunk(chunk: tuple[str, str], sport_id: int, hydrate: tuple[str, ...]) -> EntryList[Game]:
+    request = mlbfetch._schedule_request(chunk[0], chunk[1], sport_id, hydrate)
+    data = await get_request_json(*request, endpoint='schedule')
+    return metrics.parse('schedule', mlbfetch._parse_schedule, data)
+
+async def savant_batter_page(player_id: int) -> SavantBatterPage:
+    """Async version of mlbfetch.savant_batter_page."""
+    request = mlbfetch._savant_batter_page_request(player_id)
+    data = await get_request_text(*request, endpoint='savant_batter_page')
+    return metrics.parse('savant_batter_page', mlbfetch._parse_savant_batter_page, data, player_id)
+
+async def savant_batter_pages(player_ids: list[int]) -> SavantBatterPagesResponse:
+    """Async version of mlbfetch.savant_batter_pages, paced by the baseballsavant.mlb.com rate limit."""
+    results = await asyncio.gather(*(savant_batter_page(p_id) for p_id in player_ids), return_exceptions=True)
+    response = SavantBatterPagesResponse({})
+    for p_id, result in zip(player_ids, results):
+        if isinstance(result, Exception):
+            response.errors[p_id] = result
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            response.pages[p_id] = result
+    return response
@@ -0,0 +1,195 @@
+"""
+Per-pitcher, per-pitch type arsenal summaries that are updated one game at a
+time.
+
+An ArsenalAggregator keeps running counts, sums and sums of squares for
+each (pitcher, pitch_type). Adding a game only touches that game's pitches,
+and two aggregators (e.g. built by separate workers) merge by adding their
+totals. Means, standard deviations and rates are derived when a summary is
+requested:
+
+    arsenal = ArsenalAggregator.load("arsenal_2024.json")
+    arsenal.update(mlbfetch.gamefeed(game_id))
+    arsenal.save("arsenal_2024.json")
+    summary = arsenal.to_pandas()
+"""
+from datatypes import EntryList, ColumnEntryList, GamefeedResponse
+from typing import TYPE_CHECKING
+import json
+import math
+import os
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+METRICS = ('start_speed', 'spin_rate', 'breakx', 'inducedbreakz')
+# pitch descriptions (Pitch.call) by outcome. Foul tips are contact, so they
+# count as swings but not whiffs.
+WHIFF_CALLS = frozenset({'Swinging Strike', 'Swinging Strike (Blocked)', 'Missed Bunt', 'Swinging Pitchout'})
+CALLED_STRIKE_CALLS = frozenset({'Called Strike'})
+SWING_CALLS = WHIFF_CALLS | frozenset({
+    'Foul', 'Foul Tip', 'Foul Bunt', 'Bunt Foul Tip', 'Foul Pitchout',
+    'In play, out(s)', 'In play, no out', 'In play, run(s)',
+})
+# running totals kept per (pitcher, pitch_type), in storage order
+STAT_COLUMNS = ('pitches', 'swings', 'whiffs', 'called_strikes') + tuple(
+    f'{metric}_{stat}' for metric in METRICS for stat in ('n', 'sum', 'sumsq')
+)
+FORMAT_VERSION = 1
+
+ArsenalKey = tuple[int, str | None]
+
+
+class ArsenalAggregator:
+    """
+    Running pitch statistics keyed by (pitcher, pitch_type).
+
+    Attributes:
+        games (set[int]): MLB.com IDs of the games added, so a game is never counted twice.
+    """
+    def __init__(self):
+        self.games: set[int] = set()
+        self._totals: dict[ArsenalKey, list[float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._totals)
+
+    def update(self, response: GamefeedResponse) -> bool:
+        """
+        Adds the pitches of one finished game.
+
+        Parameters:
+            response (GamefeedResponse): The game, e.g. from mlbfetch.gamefeed or mlbfetch.iter_gamefeeds.
+
+        Returns:
+            bool: False when the game was skipped, because it was already added or is not final.
+        """
+        game = response.game
+        if game.id in self.games or not str(game.status_code).startswith('F'):
+            return False
+        self.add_pitches(response.pitches)
+        self.games.add(game.id)
+        return True
+
+    def add_pitches(self, pitches: 'pd.DataFrame | EntryList | ColumnEntryList'):
+        """
+        Adds pitches without recording their games, e.g. to seed an aggregator
+        from a season's Parquet dataset. Use update for single games.
+
+        Parameters:
+            pitches (pd.DataFrame | EntryList[Pitch] | ColumnEntryList[Pitch]): The pitches.
+        """
+        df = pitches.to_pandas() if hasattr(pitches, 'to_pandas') else pitches
+        if len(df) == 0:
+            return
+        call = df['call']
+        columns = {
+            'pitches': 1,
+            'swings': call.isin(SWING_CALLS),
+            'whiffs': call.isin(WHIFF_CALLS),
+            'called_strikes': call.isin(CALLED_STRIKE_CALLS),
+        }
+        for metric in METRICS:
+            values = df[metric].astype('float64')
+            columns[f'{metric}_n'] = values.notna()
+            columns[f'{metric}_sum'] = values
+            columns[f'{metric}_sumsq'] = values ** 2
+        keys = [df['pitcher'], df['pitch_type'].astype(object)]
+        sums = df[[]].assign(**columns).groupby(keys, dropna=False, sort=False).sum()
+        for (pitcher, pitch_type), row in zip(sums.index, sums.itertuples(index=False)):
+            self._add(_key(pitcher, pitch_type), row)
+
+    def _add(self, key: ArsenalKey, values):
+        totals = self._totals.get(key)
+        if totals is None:
+            self._totals[key] = [float(v) for v in values]
+        else:
+            for i, v in enumerate(values):
+                totals[i] += float(v)
+
+    def merge(self, other: 'ArsenalAggregator') -> 'ArsenalAggregator':
+        """
+        Adds the totals of another aggregator into this one.
+
+        Raises:
+            ValueError: If both aggregators contain the same game.
+
+        Returns:
+            ArsenalAggregator: self.
+        """
+        overlap = self.games & other.games
+        if overlap:
+            raise ValueError(f"games added to both aggregators: {sorted(overlap)[:10]}")
+        for key, values in other._totals.items():
+            self._add(key, values)
+        self.games |= other.games
+        return self
+
+    def to_pandas(self) -> 'pd.DataFrame':
+        """
+        The arsenal summary, one row per pitcher and pitch type.
+
+        Returns:
+            pd.DataFrame: With pitcher, pitch_type, pitches, usage (share of the pitcher's pitches),
+                {metric}_mean and {metric}_std for start_speed, spin_rate, breakx and inducedbreakz,
+                swing_rate, whiff_rate (whiffs per swing) and called_strike_rate (per pitch).
+        """
+        import numpy as np
+        import pandas as pd
+        totals = pd.DataFrame(list(self._totals.values()), columns=list(STAT_COLUMNS), dtype='float64')
+        keys = pd.DataFrame(list(self._totals.keys()), columns=['pitcher', 'pitch_type'])
+        summary = pd.DataFrame({
+            'pitcher': keys['pitcher'].astype('int32'),
+            'pitch_type': keys['pitch_type'].astype('category'),
+            'pitches': totals['pitches'].astype('int64'),
+        })
+        summary['usage'] = totals['pitches'] / totals.groupby(keys['pitcher'])['pitches'].transform('sum')
+        with np.errstate(invalid='ignore', divide='ignore'):
+            for metric in METRICS:
+                n, total, sumsq = (totals[f'{metric}_{stat}'] for stat in ('n', 'sum', 'sumsq'))
+                summary[f'{metric}_mean'] = total / n.where(n > 0)
+                variance = (sumsq - total ** 2 / n) / (n - 1).where(n > 1)
+                summary[f'{metric}_std'] = np.sqrt(variance.clip(lower=0))
+            summary['swing_rate'] = totals['swings'] / totals['pitches']
+            summary['whiff_rate'] = totals['whiffs'] / totals['swings'].where(totals['swings'] > 0)
+            summary['called_strike_rate'] = totals['called_strikes'] / totals['pitches']
+        return summary.sort_values(['pitcher', 'pitches'], ascending=[True, False], ignore_index=True)
+
+    def save(self, path: str):
+        """
+        Writes the aggregator to a JSON file. The file is written to a temporary
+        name first, so an interrupted save never leaves a partial file.
+        """
+        state = {
+            'version': FORMAT_VERSION,
+            'columns': STAT_COLUMNS,
+            'games': sorted(self.games),
+            'totals': [[pitcher, pitch_type, *values] for (pitcher, pitch_type), values in self._totals.items()],
+        }
+        tmp = path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'ArsenalAggregator':
+        """
+        Reads an aggregator written by save.
+
+        Raises:
+            ValueError: If the file was written with different statistics.
+        """
+        with open(path) as f:
+            state = json.load(f)
+        if state.get('version') != FORMAT_VERSION or tuple(state['columns']) != STAT_COLUMNS:
+            raise ValueError(f"{path} was not written by this version of ArsenalAggregator")
+        aggregator = cls()
+        aggregator.games = set(state['games'])
+        for pitcher, pitch_type, *values in state['totals']:
+            aggregator._totals[(pitcher, pitch_type)] = values
+        return aggregator
+
+def _key(pitcher, pitch_type) -> ArsenalKey:
+    # plain python values, so keys from numpy, pandas and json compare equal
+    missing = pitch_type is None or (isinstance(pitch_type, float) and math.isnan(pitch_type))
+    return int(pitcher), None if missing else str(pitch_type)
@@ -1,25 +1,357 @@
-from dataclasses import dataclass
-from typing import List, TypeVar, Generic
+from dataclasses import dataclass, field, fields
+from typing import Any, List, TypeVar, Generic, Iterable, Iterator, ClassVar, TYPE_CHECKING, get_type_hints, get_args
 from datetime import date
-import pandas as pd
-import polars as pl
+
+# numpy, pandas and polars are imported when a list is first converted, so
+# fetch-only code does not pay for them at import time
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import polars as pl
 
 GenericEntry = TypeVar('GenericEntry', bound='Entry')
 
+# column dtypes used in Entry schemas, all integer types are nullable
+PANDAS_DTYPES = {
+    'category': 'category',
+    'string': 'string',
+    'bool': 'boolean',
+    'int8': 'Int8',
+    'int16': 'Int16',
+    'int32': 'Int32',
+    'int64': 'Int64',
+    'float32': 'float32',
+    'float64': 'float64',
+    'date': 'datetime64[s]',
+}
+# names of the polars dtypes, resolved by polars_dtypes
+_POLARS_DTYPE_NAMES = {
+    'category': 'Categorical',
+    'string': 'String',
+    'bool': 'Boolean',
+    'int8': 'Int8',
+    'int16': 'Int16',
+    'int32': 'Int32',
+    'int64': 'Int64',
+    'float32': 'Float32',
+    'float64': 'Float64',
+    'date': 'Date',
+}
+_polars_dtypes: dict | None = None
+
+def polars_dtypes() -> dict:
+    # the polars counterpart of PANDAS_DTYPES, imports polars on first use
+    global _polars_dtypes
+    if _polars_dtypes is None:
+        import polars as pl
+        _polars_dtypes = {name: getattr(pl, dtype) for name, dtype in _POLARS_DTYPE_NAMES.items()}
+    return _polars_dtypes
+
+def __getattr__(name: str):
+    # POLARS_DTYPES is kept as a module attribute without importing polars up front
+    if name == 'POLARS_DTYPES':
+        return polars_dtypes()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+_ANNOTATION_DTYPES = {int: 'int64', float: 'float64', bool: 'bool', date: 'date'}
+
 @dataclass
 class Entry:
-    def to_series(self) -> pd.Series:
+    # dtype overrides for DataFrame columns, see Entry.schema
+    _dtypes: ClassVar[dict[str, str]] = {}
+    # fields EntryList.build_indexes indexes up front, see EntryList.groups
+    _indexes: ClassVar[tuple[str, ...]] = ()
+
+    def to_series(self) -> 'pd.Series':
+        import pandas as pd
         return pd.Series(self.__dict__)
 
+    @classmethod
+    def schema(cls) -> dict[str, str | None]:
+        """
+        Column dtypes used when converting a list of this entry to a DataFrame.
+        Defaults come from the field annotations and are overridden by _dtypes.
+        None leaves the column's inferred dtype as is.
+        """
+        hints = get_type_hints(cls)
+        schema = {}
+        for f in fields(cls):
+            types = [t for t in (get_args(hints[f.name]) or (hints[f.name],)) if t is not type(None)]
+            schema[f.name] = _ANNOTATION_DTYPES.get(types[0]) if len(types) == 1 else None
+        schema.update(cls._dtypes)
+        return schema
+
+def apply_pandas_schema(df: 'pd.DataFrame', entry_type: type) -> 'pd.DataFrame':
+    # cast the columns of df to the dtypes declared by entry_type
+    import pandas as pd
+    for name, dtype in entry_type.schema().items():
+        if dtype is None or name not in df.columns:
+            continue
+        column = df[name]
+        if dtype == 'date':
+            df[name] = pd.to_datetime(column, errors='coerce').astype(PANDAS_DTYPES[dtype])
+        elif dtype.startswith(('int', 'float')):
+            if column.dtype == object or pd.api.types.is_string_dtype(column):
+                column = pd.to_numeric(column, errors='coerce')
+            df[name] = column.astype(PANDAS_DTYPES[dtype])
+        else:
+            df[name] = column.astype(PANDAS_DTYPES[dtype])
+    return df
+
+def apply_polars_schema(df: 'pl.DataFrame', entry_type: type) -> 'pl.DataFrame':
+    # cast the columns of df to the dtypes declared by entry_type
+    import polars as pl
+    dtypes = polars_dtypes()
+    casts = []
+    for name, dtype in entry_type.schema().items():
+        if dtype is None or name not in df.columns:
+            continue
+        column = pl.col(name)
+        if df.schema[name] == pl.Null:
+            casts.append(column.cast(dtypes[dtype]))
+        elif dtype == 'date' and df.schema[name] == pl.String:
+            casts.append(column.str.to_date(strict=False))
+        elif dtype == 'category':
+            casts.append(column.cast(pl.String).cast(pl.Categorical))
+        else:
+            casts.append(column.cast(dtypes[dtype], strict=False))
+    return df.with_columns(casts) if casts else df
+
+def _invalidates_indexes(method):
+    # wrap a list method that can reorder or replace entries so it drops
+    # cached indexes. Methods that only add to the end (append, extend, +=)
+    # are left alone, indexes notice those from the length of the list.
+    def wrapper(self, *args, **kwargs):
+        self.__dict__.pop('_index_cache', None)
+        return method(self, *args, **kwargs)
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
 class EntryList(List[GenericEntry], Generic[GenericEntry]):
-    
-    def to_pandas(self) -> pd.DataFrame:
+    """
+    A list of entries with DataFrame conversion and hash indexes.
+
+    groups, group and lookup index the list by a field the first time that
+    field is used, after which lookups are O(1) until the list is mutated.
+    append and extend are the plain list methods, so parsing stays fast: an
+    index is rebuilt on its next use once the list's length has changed.
+    Other mutations (item assignment, sort, remove, ...) drop every index.
+    Changing a field of an entry that is already in the list does not, call
+    build_indexes or mutate the list to refresh them.
+    """
+    insert = _invalidates_indexes(list.insert)
+    remove = _invalidates_indexes(list.remove)
+    pop = _invalidates_indexes(list.pop)
+    clear = _invalidates_indexes(list.clear)
+    sort = _invalidates_indexes(list.sort)
+    reverse = _invalidates_indexes(list.reverse)
+    __setitem__ = _invalidates_indexes(list.__setitem__)
+    __delitem__ = _invalidates_indexes(list.__delitem__)
+    __imul__ = _invalidates_indexes(list.__imul__)
+
+    def groups(self, field_name: str) -> dict[Any, 'EntryList[GenericEntry]']:
+        """
+        The entries grouped by the value of a field, in list order. The
+        result is cached and must not be modified.
+
+        Parameters:
+            field_name (str): Field to group by, e.g. "pitcher".
+
+        Returns:
+            dict[Any, EntryList]: Field value -> entries with that value.
+        """
+        cache = self.__dict__.setdefault('_index_cache', {}) # field -> (len when built, index)
+        length, index = cache.get(field_name, (-1, None))
+        if length != len(self):
+            index = {}
+            for entry in self:
+                key = getattr(entry, field_name)
+                group = index.get(key)
+                if group is None:
+                    index[key] = group = EntryList()
+                list.append(group, entry)
+            cache[field_name] = (len(self), index)
+        return index
+
+    def group(self, field_name: str, value: Any) -> 'EntryList[GenericEntry]':
+        # entries whose field equals value, empty if there are none
+        return self.groups(field_name).get(value, EntryList())
+
+    def lookup(self, field_name: str, value: Any, default: Any = None) -> GenericEntry | None:
+        # first entry whose field equals value, e.g. lookup("playerid", 660271)
+        group = self.groups(field_name).get(value)
+        return group[0] if group else default
+
+    def build_indexes(self, *field_names: str) -> 'EntryList[GenericEntry]':
+        """
+        Builds indexes up front (e.g. before serving lookups from many threads)
+        for field_names, or for the fields the entry type declares in _indexes.
+        Rebuilds indexes that already exist.
+        """
+        self.__dict__.pop('_index_cache', None)
+        if not field_names and len(self) > 0:
+            field_names = type(self[0])._indexes
+        for name in field_names:
+            self.groups(name)
+        return self
+
+    def to_pandas(self, schema: bool = True) -> 'pd.DataFrame':
+        import pandas as pd
         data = [e.__dict__ for e in self]
-        return pd.DataFrame(data)
+        df = pd.DataFrame(data)
+        if schema and len(self) > 0:
+            df = apply_pandas_schema(df, type(self[0]))
+        return df
 
-    def to_polars(self) -> pl.DataFrame:
+    def to_polars(self, schema: bool = True) -> 'pl.DataFrame':
+        import polars as pl
         data = [e.__dict__ for e in self]
-        return pl.DataFrame(data)
+        df = pl.DataFrame(data)
+        if schema and len(self) > 0:
+            df = apply_polars_schema(df, type(self[0]))
+        return df
+
+    def to_columns(self, entry_type: type[GenericEntry] | None = None) -> 'ColumnEntryList[GenericEntry]':
+        # entry_type is only needed for empty lists
+        if entry_type is None:
+            if len(self) == 0:
+                raise ValueError("entry_type is required to convert an empty EntryList")
+            entry_type = type(self[0])
+        return ColumnEntryList.from_entries(entry_type, self)
+
+def _field_kinds(entry_type: type) -> dict[str, type]:
+    # python type each field is stored as: float, int, bool or object
+    hints = get_type_hints(entry_type)
+    kinds = {}
+    for f in fields(entry_type):
+        types = [t for t in (get_args(hints[f.name]) or (hints[f.name],)) if t is not type(None)]
+        kinds[f.name] = types[0] if len(types) == 1 and types[0] in (float, int, bool) else object
+    return kinds
+
+def _to_column(values: list, kind: type) -> 'np.ndarray':
+    import numpy as np
+    # typed array when every value matches the declared type, object array otherwise
+    if kind is float and all(v is None or (type(v) in (float, int)) for v in values):
+        return np.array(values, dtype=np.float64)
+    if kind is int and all(v is None or type(v) is int for v in values):
+        # missing ints are stored as nan and restored to None on materialization
+        return np.array(values, dtype=np.float64 if None in values else np.int64)
+    if kind is bool and all(type(v) is bool for v in values):
+        return np.array(values, dtype=np.bool_)
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+def _from_column(column: 'np.ndarray', kind: type) -> list:
+    import numpy as np
+    values = column.tolist()
+    if column.dtype == np.float64:
+        if kind is int:
+            return [None if v != v else int(v) for v in values]
+        return [None if v != v else v for v in values]
+    return values
+
+class ColumnEntryList(Generic[GenericEntry]):
+    """
+    A read-only EntryList stored as one array per dataclass field. Entries are
+    only built when indexed or iterated, and DataFrame conversion hands the
+    arrays over without a row-wise pass.
+
+    Parameters:
+        entry_type (type): The Entry dataclass stored in the list.
+        columns (dict[str, np.ndarray]): One equal-length array per field of entry_type.
+    """
+    def __init__(self, entry_type: type[GenericEntry], columns: 'dict[str, np.ndarray]'):
+        self.entry_type = entry_type
+        self._kinds = _field_kinds(entry_type)
+        if set(columns) != set(self._kinds):
+            raise ValueError(f"columns must match the fields of {entry_type.__name__}")
+        lengths = {len(c) for c in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("columns must all have the same length")
+        self.columns = {name: columns[name] for name in self._kinds}
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_entries(cls, entry_type: type[GenericEntry], entries: Iterable[GenericEntry]) -> 'ColumnEntryList[GenericEntry]':
+        entries = list(entries)
+        kinds = _field_kinds(entry_type)
+        columns = {name: _to_column([getattr(e, name) for e in entries], kind) for name, kind in kinds.items()}
+        return cls(entry_type, columns)
+
+    @classmethod
+    def concat(cls, lists: Iterable['ColumnEntryList[GenericEntry]'], entry_type: type[GenericEntry] | None = None) -> 'ColumnEntryList[GenericEntry]':
+        # entry_type is only needed when lists is empty
+        import numpy as np
+        lists = list(lists)
+        if entry_type is None:
+            if not lists:
+                raise ValueError("entry_type is required to concatenate no lists")
+            entry_type = lists[0].entry_type
+        columns = {}
+        for name in _field_kinds(entry_type):
+            parts = [l.columns[name] for l in lists]
+            dtypes = {p.dtype for p in parts}
+            if len(dtypes) > 1:
+                # int64 parts next to float64 ones (a game with a missing int) become
+                # float64 with nan, only non-numeric mixes fall back to an object column
+                if all(d.kind in 'iuf' for d in dtypes):
+                    dtype = np.result_type(*dtypes)
+                else:
+                    dtype = np.dtype(object)
+                parts = [p.astype(dtype) for p in parts]
+            columns[name] = np.concatenate(parts) if parts else np.empty(0, dtype=object)
+        return cls(entry_type, columns)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, key):
+        import numpy as np
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += self._length
+            if not 0 <= key < self._length:
+                raise IndexError("ColumnEntryList index out of range")
+            return self.entry_type(**{
+                name: _from_column(column[key:key + 1], self._kinds[name])[0]
+                for name, column in self.columns.items()
+            })
+        # slices, integer arrays and boolean masks select a new ColumnEntryList
+        return ColumnEntryList(self.entry_type, {name: column[key] for name, column in self.columns.items()})
+
+    def __iter__(self) -> Iterator[GenericEntry]:
+        names = list(self.columns)
+        values = [_from_column(self.columns[name], self._kinds[name]) for name in names]
+        for row in zip(*values):
+            yield self.entry_type(**dict(zip(names, row)))
+
+    def __repr__(self) -> str:
+        return f"ColumnEntryList[{self.entry_type.__name__}]({self._length} entries)"
+
+    def column(self, name: str) -> 'np.ndarray':
+        return self.columns[name]
+
+    def to_entries(self) -> EntryList[GenericEntry]:
+        return EntryList(self)
+
+    def to_pandas(self, schema: bool = True) -> 'pd.DataFrame':
+        import pandas as pd
+        df = pd.DataFrame(self.columns, copy=False)
+        return apply_pandas_schema(df, self.entry_type) if schema else df
+
+    def to_polars(self, schema: bool = True) -> 'pl.DataFrame':
+        import numpy as np
+        import polars as pl
+        series = []
+        for name, column in self.columns.items():
+            s = pl.Series(name, column, nan_to_null=column.dtype == np.float64)
+            if self._kinds[name] is int and column.dtype == np.float64:
+                s = s.cast(pl.Int64)
+            series.append(s)
+        df = pl.DataFrame(series)
+        return apply_polars_schema(df, self.entry_type) if schema else df
 
 @dataclass
 class Player(Entry):
@@ -37,6 +369,18 @@ class Player(Entry):
     bat_side: str # L, R, or S
     pitch_hand: str # L or R
 
+    _dtypes: ClassVar[dict[str, str]] = {
+        'id': 'int32',
+        'birth_country': 'category',
+        'weight': 'int16',
+        'current_team_id': 'int32',
+        'primary_position_code': 'category',
+        'primary_position_abbrev': 'category',
+        'bat_side': 'category',
+        'pitch_hand': 'category',
+    }
+    _indexes: ClassVar[tuple[str, ...]] = ('id', 'current_team_id')
+
 @dataclass
 class Team(Entry):
     id: int # mlb.com player id
@@ -57,6 +401,21 @@ class Team(Entry):
     parent_org_id: int | None # parent organizations mlb.com team id
     parent_org_name: str | None
 
+    _dtypes: ClassVar[dict[str, str]] = {
+        'id': 'int32',
+        'season': 'int16',
+        'venue_id': 'int32',
+        'league_id': 'int32',
+        'league_name': 'category',
+        'division_id': 'int32',
+        'division_name': 'category',
+        'sport_id': 'int32',
+        'sport_name': 'category',
+        'parent_org_id': 'int32',
+        'parent_org_name': 'category',
+    }
+    _indexes: ClassVar[tuple[str, ...]] = ('id',)
+
 @dataclass
 class Venue(Entry):
     id: int # mlb.com venue id
@@ -73,6 +432,21 @@ class Venue(Entry):
     azimuth_ange: int | None
     elevation: int | None
 
+    _dtypes: ClassVar[dict[str, str]] = {
+        'id': 'int32',
+        'turf_type': 'category',
+        'roof_type': 'category',
+        'left_line': 'int16',
+        'left': 'int16',
+        'left_center': 'int16',
+        'center': 'int16',
+        'right_center': 'int16',
+        'right': 'int16',
+        'right_line': 'int16',
+        'azimuth_ange': 'int16',
+        'elevation': 'int16',
+    }
+
 @dataclass
 class Game(Entry):
     id: int # mlb.com game id
@@ -96,6 +470,24 @@ class Game(Entry):
     away_team_pitcher_id: int
     away_team_pitcher_name: str
 
+    _dtypes: ClassVar[dict[str, str]] = {
+        'id': 'int32',
+        'type': 'category',
+        'doubleheader': 'category',
+        'season': 'int16',
+        'status_code': 'category',
+        'home_team_id': 'int32',
+        'away_team_id': 'int32',
+        'home_team_name': 'category',
+        'away_team_name': 'category',
+        'venue_id': 'int32',
+        'venue_name': 'category',
+        'weather_condition': 'category',
+        'home_team_pitcher_id': 'int32',
+        'away_team_pitcher_id': 'int32',
+    }
+    _indexes: ClassVar[tuple[str, ...]] = ('id', 'home_team_id', 'away_team_id')
+
 @dataclass
 class DefensePlay(Entry):
     fielder_id: str # mlb.com player id
@@ -109,6 +501,16 @@ class DefensePlay(Entry):
     runs_prevented: float # statcast runs prevented for fielder
     is_out: bool
 
+    _dtypes: ClassVar[dict[str, str]] = {
+        'fielder_id': 'int32',
+        'fielder_name': 'category',
+        'fielder_team_id': 'int32',
+        'fielder_position': 'int8',
+        'year': 'int16',
+        'month': 'int8',
+    }
+    _indexes: ClassVar[tuple[str, ...]] = ('fielder_id',)
+
 @dataclass
 class Pitch(Entry):
     id: str
@@ -159,6 +561,33 @@ class Pitch(Entry):
     runner_1b_score: bool
     runner_2b_score: bool
     runner_3b_score: bool
+    base_out_state: int | None # before the pitch: runners bitmask (1B=1, 2B=2, 3B=4) + 8 * outs, 0-23
+    runs_on_play: int # runs scored on the plate appearance
+
+    _dtypes: ClassVar[dict[str, str]] = {
+        'inning': 'int8',
+        'ab_number': 'int16',
+        'batter': 'int32',
+        'stand': 'category',
+        'pitcher': 'int32',
+        'p_throws': 'category',
+        'team_batting_id': 'int32',
+        'team_fielding_id': 'int32',
+        'result': 'category',
+        'events': 'category',
+        'strikes': 'int8',
+        'balls': 'int8',
+        'outs': 'int8',
+        'pitch_type': 'category',
+        'call': 'category',
+        'pitch_call': 'category',
+        'zone': 'int8',
+        'pitch_number': 'int8',
+        'gameid': 'int32',
+        'base_out_state': 'int8',
+        'runs_on_play': 'int8',
+    }
+    _indexes: ClassVar[tuple[str, ...]] = ('pitcher', 'batter', 'gameid')
 
 @dataclass
 class BatterBoxscore(Entry):
@@ -181,6 +610,27 @@ class BatterBoxscore(Entry):
     triples: int
     hitbypitch: int
 
+    _dtypes: ClassVar[dict[str, str]] = {
+        'playerid': 'int32',
+        'gameid': 'int32',
+        'flyouts': 'int16',
+        'groundouts': 'int16',
+        'runs': 'int16',
+        'homeruns': 'int16',
+        'strikeouts': 'int16',
+        'baseonballs': 'int16',
+        'hits': 'int16',
+        'atbats': 'int16',
+        'caughtstealing': 'int16',
+        'stolenbases': 'int16',
+        'plateappearances': 'int16',
+        'rbi': 'int16',
+        'doubles': 'int16',
+        'triples': 'int16',
+        'hitbypitch': 'int16',
+    }
+    _indexes: ClassVar[tuple[str, ...]] = ('playerid', 'gameid')
+
 @dataclass
 class PitcherBoxscore(Entry):
     id: str
@@ -204,6 +654,34 @@ class PitcherBoxscore(Entry):
     balls: int
     strikes: int
 
+    _dtypes: ClassVar[dict[str, str]] = {
+        'playerid': 'int32',
+        'gameid': 'int32',
+        'groundouts': 'int16',
+        'airouts': 'int16',
+        'runs': 'int16',
+        'strikeouts': 'int16',
+        'baseonballs': 'int16',
+        'hits': 'int16',
+        'hitbypitch': 'int16',
+        'atbats': 'int16',
+        'numberofpitches': 'int16',
+        'wins': 'int16',
+        'losses': 'int16',
+        'earnedruns': 'int16',
+        'battersfaced': 'int16',
+        'outs': 'int16',
+        'balls': 'int16',
+        'strikes': 'int16',
+    }
+    _indexes: ClassVar[tuple[str, ...]] = ('playerid', 'gameid')
+
+@dataclass
+class DefensePlaysResponse:
+    # plays is a ColumnEntryList when fetched with columnar=True
+    plays: EntryList[DefensePlay]
+    errors: dict[tuple[int, int], Exception] = field(default_factory=dict) # (fielder id, year) -> exception for requests that failed
+
 @dataclass
 class GamefeedResponse():
     game: Game
@@ -213,10 +691,22 @@ class GamefeedResponse():
 
 @dataclass
 class GamefeedsResponse:
+    # lists are ColumnEntryLists when fetched with columnar=True
     games: EntryList[Game]
     pitches: EntryList[Pitch]
     batter_boxscores: EntryList[BatterBoxscore]
     pitcher_boxscores: EntryList[PitcherBoxscore]
+    errors: dict[int, Exception] = field(default_factory=dict) # game id -> exception for feeds that failed
+
+@dataclass
+class LiveUpdate:
+    # what changed in a live game since the previous update
+    game: Game
+    pitches: EntryList[Pitch] # pitches that are new or whose data changed
+    batter_boxscores: EntryList[BatterBoxscore] # box scores that changed
+    pitcher_boxscores: EntryList[PitcherBoxscore]
+    timecode: str | None # feed timestamp the update is current to
+    full_refresh: bool # the full feed was downloaded instead of a diff
 
 @dataclass
 class SavantBatterSeason(Entry):
@@ -264,3 +754,8 @@ class SavantBatterSeason(Entry):
 class SavantBatterPage:
     batter_id: int
     savant_seasons: EntryList[SavantBatterSeason]
+
+@dataclass
+class SavantBatterPagesResponse:
+    pages: dict[int, SavantBatterPage] # player id -> page, in the order of the requested ids, without the failures
+    errors: dict[int, Exception] = field(default_factory=dict) # player id -> exception for pages that failed
@@ -0,0 +1,57 @@
+"""
+Outs above average and runs prevented rollups over defensive plays.
+
+    response = mlbfetch.defense_plays_batch(fielder_ids, 2022, 2024, max_workers=8)
+    by_fielder = defense.oaa_rollup(response.plays)
+    by_team_month = defense.oaa_rollup(response.plays, by=['team', 'month'])
+"""
+from datatypes import EntryList, ColumnEntryList
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# rollup levels and the DefensePlay columns they group by
+GROUPS = {
+    'fielder': ['fielder_id', 'fielder_name'],
+    'position': ['fielder_position'],
+    'team': ['fielder_team_id'],
+    'year': ['year'],
+    'month': ['year', 'month'],
+}
+
+
+def oaa_rollup(plays: 'pd.DataFrame | EntryList | ColumnEntryList', by: str | list[str] = 'fielder') -> 'pd.DataFrame':
+    """
+    Sums outs above average and runs prevented over groups of plays.
+
+    Parameters:
+        plays (pd.DataFrame | EntryList[DefensePlay] | ColumnEntryList[DefensePlay]): The plays.
+        by (str | list[str]): Levels to group by, any of "fielder", "position", "team",
+            "year", "month" (year and month), or DefensePlay column names. Default is "fielder".
+
+    Returns:
+        pd.DataFrame: One row per group, sorted by outs_above_avg descending, with:
+            - plays: Number of plays.
+            - outs: Plays converted into outs.
+            - outs_above_avg: Sum of outs above average.
+            - runs_prevented: Sum of fielding runs prevented.
+            - est_success: Mean estimated success rate.
+            - success_above_est: Actual out rate minus est_success.
+    """
+    df = plays.to_pandas() if hasattr(plays, 'to_pandas') else plays
+    keys = []
+    for level in [by] if isinstance(by, str) else by:
+        for column in GROUPS.get(level, [level]):
+            if column not in keys:
+                keys.append(column)
+    rollup = df.assign(outs=df['is_out'].astype('float64')).groupby(keys, observed=True, sort=False).agg(
+        plays=('is_out', 'size'),
+        outs=('outs', 'sum'),
+        outs_above_avg=('outs_above_avg', 'sum'),
+        runs_prevented=('runs_prevented', 'sum'),
+        est_success=('est_success', 'mean'),
+    )
+    rollup['outs'] = rollup['outs'].astype('int64')
+    rollup['success_above_est'] = rollup['outs'] / rollup['plays'] - rollup['est_success']
+    return rollup.sort_values('outs_above_avg', ascending=False).reset_index()
@@ -0,0 +1,121 @@
+"""
+Vectorized joins of reference data (players, teams, venues) onto pitch and
+box score tables.
+
+Pitches and box scores only carry ids. These functions add names,
+handedness, team abbreviations and venue dimensions by mapping each id
+column through the reference table's id index, one hashed lookup per column
+instead of a Python lookup per row. Reference lists default to the season's
+mlbfetch.players/teams/venues, which are kept in process after the first call.
+
+    response = mlbfetch.gamefeeds(game_ids, max_workers=8)
+    df = enrich.enrich_pitches(response.pitches, season=2024, games=response.games)
+"""
+from datatypes import EntryList, ColumnEntryList, Game, Player, Team, Venue
+import mlbfetch
+from typing import Iterable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+PLAYER_COLUMNS = ('full_name', 'bat_side', 'pitch_hand', 'primary_position_abbrev')
+VENUE_COLUMNS = ('name', 'left_line', 'left_center', 'center', 'right_center', 'right_line', 'roof_type', 'turf_type', 'elevation')
+
+
+def _frame(table) -> 'pd.DataFrame':
+    # a DataFrame we can add columns to without touching the caller's
+    if hasattr(table, 'to_pandas'):
+        return table.to_pandas()
+    return table.copy(deep=False)
+
+def _reference(table, id_column: str = 'id') -> 'pd.DataFrame':
+    df = table.to_pandas() if hasattr(table, 'to_pandas') else table
+    return df.drop_duplicates(id_column).set_index(id_column)
+
+def join_reference(df: 'pd.DataFrame', key: str, reference: 'pd.DataFrame', columns: Iterable[str], prefix: str) -> 'pd.DataFrame':
+    """
+    Adds columns of reference to df, matching df[key] against reference's index.
+
+    Parameters:
+        df (pd.DataFrame): Table to add columns to, modified in place.
+        key (str): Id column of df.
+        reference (pd.DataFrame): Reference table indexed by id, e.g. players by player id.
+        columns (Iterable[str]): Columns of reference to add.
+        prefix (str): Prefix of the added column names, e.g. "pitcher_".
+
+    Returns:
+        pd.DataFrame: df, with {prefix}{column} for each column. Ids missing from reference get NA.
+    """
+    keys = df[key]
+    for column in columns:
+        df[prefix + column] = keys.map(reference[column])
+    return df
+
+def _join_venues(df: 'pd.DataFrame', games, venues: 'pd.DataFrame') -> 'pd.DataFrame':
+    # gameid -> venue_id from the games, then the venue's dimensions
+    join_reference(df, 'gameid', _reference(games), ('venue_id', 'game_date'), '')
+    return join_reference(df, 'venue_id', venues, VENUE_COLUMNS, 'venue_')
+
+def enrich_pitches(
+    pitches: 'pd.DataFrame | EntryList | ColumnEntryList',
+    season: int,
+    games: EntryList[Game] | None = None,
+    players: EntryList[Player] | None = None,
+    teams: EntryList[Team] | None = None,
+    venues: EntryList[Venue] | None = None,
+) -> 'pd.DataFrame':
+    """
+    A DataFrame of pitches with player names, handedness and team abbreviations.
+
+    Parameters:
+        pitches (pd.DataFrame | EntryList[Pitch] | ColumnEntryList[Pitch]): The pitches.
+        season (int): Season whose players and teams are joined.
+        games (EntryList[Game] | None): Games of the pitches. When given, adds game_date,
+            venue_id and venue_* columns (name and field dimensions).
+        players (EntryList[Player] | None): Players to join. Default is mlbfetch.players(season=season).
+        teams (EntryList[Team] | None): Teams to join. Default is mlbfetch.teams(season).
+        venues (EntryList[Venue] | None): Venues to join. Default is mlbfetch.venues().
+
+    Returns:
+        pd.DataFrame: The pitch columns plus pitcher_full_name, batter_full_name, batter_bat_side,
+            team_batting_abbreviation and team_fielding_abbreviation.
+    """
+    df = _frame(pitches)
+    players_df = _reference(players if players is not None else mlbfetch.players(season=season))
+    teams_df = _reference(teams if teams is not None else mlbfetch.teams(season))
+    join_reference(df, 'pitcher', players_df, ('full_name',), 'pitcher_')
+    join_reference(df, 'batter', players_df, ('full_name', 'bat_side'), 'batter_')
+    join_reference(df, 'team_batting_id', teams_df, ('abbreviation',), 'team_batting_')
+    join_reference(df, 'team_fielding_id', teams_df, ('abbreviation',), 'team_fielding_')
+    if games is not None:
+        _join_venues(df, games, _reference(venues if venues is not None else mlbfetch.venues()))
+    return df
+
+def enrich_boxscores(
+    boxscores: 'pd.DataFrame | EntryList | ColumnEntryList',
+    season: int,
+    games: EntryList[Game] | None = None,
+    players: EntryList[Player] | None = None,
+    venues: EntryList[Venue] | None = None,
+) -> 'pd.DataFrame':
+    """
+    A DataFrame of batter or pitcher box scores with player names and positions.
+
+    Parameters:
+        boxscores (pd.DataFrame | EntryList | ColumnEntryList): BatterBoxscores or PitcherBoxscores.
+        season (int): Season whose players are joined.
+        games (EntryList[Game] | None): Games of the box scores. When given, adds game_date,
+            venue_id and venue_* columns.
+        players (EntryList[Player] | None): Players to join. Default is mlbfetch.players(season=season).
+        venues (EntryList[Venue] | None): Venues to join. Default is mlbfetch.venues().
+
+    Returns:
+        pd.DataFrame: The box score columns plus player_* columns (full_name, bat_side, pitch_hand,
+            primary_position_abbrev).
+    """
+    df = _frame(boxscores)
+    players_df = _reference(players if players is not None else mlbfetch.players(season=season))
+    join_reference(df, 'playerid', players_df, PLAYER_COLUMNS, 'player_')
+    if games is not None:
+        _join_venues(df, games, _reference(venues if venues is not None else mlbfetch.venues()))
+    return df
@@ -0,0 +1,256 @@
+"""
+Incremental tracking of in-progress games.
+
+LiveGame keeps the last downloaded game feed and asks statsapi for a JSON
+patch of what changed since its timecode, so each poll transfers and parses
+only the new part of the game instead of the whole feed/live payload.
+"""
+from datatypes import (
+    EntryList, Pitch, BatterBoxscore, PitcherBoxscore, LiveUpdate
+)
+from utils import get_request_json, TTL_NONE
+import mlbfetch
+import metrics
+import ratelimit
+import copy
+import re
+
+PLAY_PATH = re.compile(r'^/liveData/plays/allPlays/(\d+|-)(/|$)')
+
+
+class PatchError(Exception):
+    pass
+
+
+def _pointer(path: str) -> list[str]:
+    # split a JSON pointer (RFC 6901) into unescaped tokens
+    if path == '':
+        return []
+    if not path.startswith('/'):
+        raise PatchError(f"invalid JSON pointer {path!r}")
+    return [t.replace('~1', '/').replace('~0', '~') for t in path[1:].split('/')]
+
+def _resolve(doc, tokens: list[str]):
+    for token in tokens:
+        if isinstance(doc, list):
+            doc = doc[int(token)]
+        elif isinstance(doc, dict):
+            doc = doc[token]
+        else:
+            raise PatchError(f"cannot traverse into {type(doc).__name__}")
+    return doc
+
+def _add(doc, tokens: list[str], value):
+    if not tokens:
+        return value
+    parent = _resolve(doc, tokens[:-1])
+    key = tokens[-1]
+    if isinstance(parent, list):
+        if key == '-':
+            parent.append(value)
+        else:
+            parent.insert(int(key), value)
+    else:
+        parent[key] = value
+    return doc
+
+def _remove(doc, tokens: list[str]):
+    parent = _resolve(doc, tokens[:-1])
+    key = tokens[-1]
+    value = parent[int(key) if isinstance(parent, list) else key]
+    del parent[int(key) if isinstance(parent, list) else key]
+    return value
+
+def apply_patch(doc, operations: list[dict]):
+    """
+    Applies JSON patch (RFC 6902) operations to doc in place.
+
+    Parameters:
+        doc (dict | list): The document to patch.
+        operations (list[dict]): Patch operations with op, path, and value/from.
+
+    Returns:
+        dict | list: The patched document (a new object only when the root is replaced).
+    """
+    try:
+        for operation in operations:
+            op = operation['op']
+            tokens = _pointer(operation['path'])
+            if op == 'add':
+                doc = _add(doc, tokens, operation['value'])
+            elif op == 'remove':
+                _remove(doc, tokens)
+            elif op == 'replace':
+                if not tokens:
+                    doc = operation['value']
+                else:
+                    parent = _resolve(doc, tokens[:-1])
+                    key = tokens[-1]
+                    if isinstance(parent, list):
+                        parent[int(key)] = operation['value']
+                    elif key in parent:
+                        parent[key] = operation['value']
+                    else:
+                        raise PatchError(f"replace target {operation['path']!r} does not exist")
+            elif op == 'move':
+                doc = _add(doc, tokens, _remove(doc, _pointer(operation['from'])))
+            elif op == 'copy':
+                doc = _add(doc, tokens, copy.deepcopy(_resolve(doc, _pointer(operation['from']))))
+            elif op == 'test':
+                if _resolve(doc, tokens) != operation['value']:
+                    raise PatchError(f"test failed at {operation['path']!r}")
+            else:
+                raise PatchError(f"unknown patch op {op!r}")
+    except (KeyError, IndexError, ValueError, TypeError) as e:
+        raise PatchError(str(e)) from e
+    return doc
+
+
+class LiveGame:
+    """
+    Tracks an in-progress game, emitting only what changed on each update.
+
+    The first update downloads the full feed. Later updates request the
+    diffPatch endpoint with the feed's last timecode and fall back to a full
+    download when statsapi answers with a full feed, the patch does not apply,
+    or the patched feed is older than the timecode it was requested from.
+    Requests are made at live priority, ahead of other queued requests.
+
+    Parameters:
+        game_id (int): The MLB.com ID of the game to track.
+
+    Example:
+        game = LiveGame(747060)
+        while not game.is_final:
+            update = game.update()
+            print(len(update.pitches), "new pitches")
+            time.sleep(10)
+    """
+    def __init__(self, game_id: int):
+        self.game_id = game_id
+        self.feed: dict | None = None
+        self._pitches: dict[tuple[int, int], Pitch] = {} # (ab_number, pitch_number) -> pitch
+        self._batter_boxscores: dict[str, BatterBoxscore] = {}
+        self._pitcher_boxscores: dict[str, PitcherBoxscore] = {}
+
+    @property
+    def timecode(self) -> str | None:
+        if self.feed is None:
+            return None
+        return self.feed.get("metaData", {}).get("timeStamp")
+
+    @property
+    def is_final(self) -> bool:
+        if self.feed is None:
+            return False
+        return self.feed.get("gameData", {}).get("status", {}).get("abstractGameState") == "Final"
+
+    @property
+    def pitches(self) -> EntryList[Pitch]:
+        # every pitch seen so far
+        return EntryList(self._pitches.values())
+
+    def _fetch_full(self) -> dict:
+        url, params, _ = mlbfetch._gamefeed_request(self.game_id)
+        with ratelimit.request_priority(ratelimit.PRIORITY_LIVE):
+            return get_request_json(url, params, ttl=TTL_NONE, endpoint='gamefeed')
+
+    def _fetch_diff(self) -> dict | list:
+        url, _, _ = mlbfetch._gamefeed_request(self.game_id)
+        with ratelimit.request_priority(ratelimit.PRIORITY_LIVE):
+            return get_request_json(
+                url + "/diffPatch", {'startTimecode': self.timecode}, ttl=TTL_NONE, endpoint='gamefeed_diff'
+            )
+
+    def update(self) -> LiveUpdate:
+        """
+        Brings the game up to date.
+
+        Returns:
+            LiveUpdate: The current game, and the pitches and box scores that changed.
+        """
+        full_refresh = False
+        if self.feed is not None:
+            diff = self._fetch_diff()
+            if isinstance(diff, dict):
+                # statsapi sends the whole feed when the diff would be too large
+                self.feed = diff
+                full_refresh = True
+            else:
+                operations = [op for patch in diff for op in patch.get('diff', [])]
+                play_count = len(self._plays())
+                timecode = self.timecode
+                try:
+                    self.feed = apply_patch(self.feed, operations)
+                    if (self.timecode or '') < (timecode or ''):
+                        raise PatchError(f"patch moved the feed back from {timecode} to {self.timecode}")
+                except PatchError:
+                    self.feed = None # partially patched or out of step, start over
+                else:
+                    first_play, boxscores_changed = self._changed_parts(operations, play_count)
+        if self.feed is None:
+            self.feed = self._fetch_full()
+            full_refresh = True
+        if full_refresh:
+            first_play, boxscores_changed = 0, True
+        return metrics.parse('gamefeed_diff', self._emit, first_play, boxscores_changed, full_refresh)
+
+    def _plays(self) -> list[dict]:
+        return self.feed.get("liveData", {}).get("plays", {}).get("allPlays", [])
+
+    def _changed_parts(self, operations: list[dict], play_count: int) -> tuple[int, bool]:
+        # index of the first play touched by the patch, and whether box scores
+        # were. play_count is the number of plays before the patch, where any
+        # appended ("-") plays start.
+        first_play = play_count
+        boxscores_changed = False
+        for operation in operations:
+            for path in (operation['path'], operation.get('from')):
+                if path is None:
+                    continue
+                match = PLAY_PATH.match(path)
+                if match:
+                    index = match.group(1)
+                    first_play = min(first_play, play_count if index == '-' else int(index))
+                elif path in ('', '/liveData', '/liveData/plays', '/liveData/plays/allPlays'):
+                    first_play = 0
+                if path in ('', '/liveData') or path.startswith('/liveData/boxscore'):
+                    boxscores_changed = True
+        return first_play, boxscores_changed
+
+    def _emit(self, first_play: int, boxscores_changed: bool, full_refresh: bool) -> LiveUpdate:
+        game = mlbfetch._parse_gamefeed_game(self.feed)
+        plays = self._plays()
+        # outs carry over between the plays of a half inning, so parsing starts
+        # at the first play of the half inning that changed
+        first_play = min(first_play, len(plays))
+        if first_play < len(plays):
+            half_inning = mlbfetch._half_inning(plays[first_play])
+            while first_play > 0 and mlbfetch._half_inning(plays[first_play - 1]) == half_inning:
+                first_play -= 1
+        new_pitches: EntryList[Pitch] = EntryList()
+        for pitch in mlbfetch._parse_gamefeed_pitches(plays[first_play:], game, self.game_id):
+            key = (pitch.ab_number, pitch.pitch_number)
+            if self._pitches.get(key) != pitch:
+                self._pitches[key] = pitch
+                new_pitches.append(pitch)
+        new_batter_boxscores: EntryList[BatterBoxscore] = EntryList()
+        new_pitcher_boxscores: EntryList[PitcherBoxscore] = EntryList()
+        if boxscores_changed:
+            batter_boxscores, pitcher_boxscores = mlbfetch._parse_gamefeed_boxscores(self.feed, self.game_id)
+            for boxscore in batter_boxscores:
+                if self._batter_boxscores.get(boxscore.id) != boxscore:
+                    self._batter_boxscores[boxscore.id] = boxscore
+                    new_batter_boxscores.append(boxscore)
+            for boxscore in pitcher_boxscores:
+                if self._pitcher_boxscores.get(boxscore.id) != boxscore:
+                    self._pitcher_boxscores[boxscore.id] = boxscore
+                    new_pitcher_boxscores.append(boxscore)
+        return LiveUpdate(
+            game=game,
+            pitches=new_pitches,
+            batter_boxscores=new_batter_boxscores,
+            pitcher_boxscores=new_pitcher_boxscores,
+            timecode=self.timecode,
+            full_refresh=full_refresh,
+        )
@@ -0,0 +1,149 @@
+"""
+Instrumentation for requests and parsing.
+
+Every request made through utils.get_request_json/get_request_text (and
+mlbfetch.aio) emits a RequestEvent, and every endpoint's parse stage emits a
+ParseEvent, to the callbacks registered with add_hook. Metrics is a ready-made
+hook that keeps per-endpoint percentiles in process.
+
+    from mlbdatatools import metrics
+
+    collector = metrics.Metrics()
+    metrics.add_hook(collector)
+    ...
+    print(collector.summary())
+"""
+from dataclasses import dataclass
+from collections import defaultdict, deque
+from typing import Callable, Any
+import threading
+import time
+
+
+@dataclass
+class RequestEvent:
+    endpoint: str # mlbfetch endpoint name, or the url path for direct calls
+    url: str
+    status: int | None # http status, None for cache hits and failed requests
+    latency: float # seconds spent on the network (or the cache lookup)
+    decode_time: float # seconds spent decoding the body
+    bytes: int # size of the response body
+    retries: int # retries before the final response
+    cache_hit: bool
+    error: str | None = None # exception raised by the request
+    queue_time: float = 0 # seconds waiting on the rate limiter before sending, not included in latency
+
+@dataclass
+class ParseEvent:
+    endpoint: str
+    duration: float # seconds spent building dataclasses from the decoded response
+    error: str | None = None
+
+Event = RequestEvent | ParseEvent
+
+# counters in every summary, 0 for endpoints (or collectors) that never had one
+COUNT_COLUMNS = ('requests', 'bytes', 'retries', 'errors', 'cache_hits', 'parse_errors')
+
+_hooks: list[Callable[[Event], Any]] = []
+_hooks_lock = threading.Lock()
+
+def add_hook(hook: Callable[[Event], Any]):
+    # hooks are called synchronously on the thread that made the request
+    with _hooks_lock:
+        _hooks.append(hook)
+
+def remove_hook(hook: Callable[[Event], Any]):
+    with _hooks_lock:
+        _hooks.remove(hook)
+
+def enabled() -> bool:
+    return bool(_hooks)
+
+def emit(event: Event):
+    for hook in list(_hooks):
+        hook(event)
+
+def parse(endpoint: str, func: Callable[..., Any], *args):
+    # run an endpoint's parse stage, timing it when hooks are registered
+    if not _hooks:
+        return func(*args)
+    start = time.perf_counter()
+    try:
+        result = func(*args)
+    except Exception as e:
+        emit(ParseEvent(endpoint, time.perf_counter() - start, error=repr(e)))
+        raise
+    emit(ParseEvent(endpoint, time.perf_counter() - start))
+    return result
+
+
+class Metrics:
+    """
+    A hook that aggregates events per endpoint.
+
+    Parameters:
+        max_samples (int): Most recent latencies kept per endpoint for percentiles. Default is 10,000.
+    """
+    def __init__(self, max_samples: int = 10_000):
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._latencies = defaultdict(lambda: deque(maxlen=self.max_samples))
+            self._decode_times = defaultdict(lambda: deque(maxlen=self.max_samples))
+            self._parse_times = defaultdict(lambda: deque(maxlen=self.max_samples))
+            self._queue_times = defaultdict(lambda: deque(maxlen=self.max_samples))
+            self._counts = defaultdict(lambda: defaultdict(int))
+
+    def __call__(self, event: Event):
+        with self._lock:
+            counts = self._counts[event.endpoint]
+            if isinstance(event, ParseEvent):
+                self._parse_times[event.endpoint].append(event.duration)
+                counts['parse_errors'] += event.error is not None
+                return
+            counts['requests'] += 1
+            if event.queue_time:
+                self._queue_times[event.endpoint].append(event.queue_time)
+            counts['bytes'] += event.bytes
+            counts['retries'] += event.retries
+            counts['errors'] += event.error is not None or (event.status or 0) >= 400
+            if event.cache_hit:
+                counts['cache_hits'] += 1
+            else:
+                self._latencies[event.endpoint].append(event.latency)
+            self._decode_times[event.endpoint].append(event.decode_time)
+            if event.status is not None:
+                counts[f'status_{event.status}'] += 1
+
+    def summary(self, percentiles: tuple[float, ...] = (50, 90, 99)):
+        """
+        Per-endpoint totals and latency percentiles.
+
+        Parameters:
+            percentiles (tuple[float, ...]): Percentiles reported for network, rate limiter queue, decode and parse times.
+
+        Returns:
+            pd.DataFrame: One row per endpoint. Times are in milliseconds.
+        """
+        import numpy as np
+        import pandas as pd
+        rows = {}
+        with self._lock:
+            for endpoint, counts in self._counts.items():
+                row = dict(counts)
+                for name, samples in (
+                    ('latency', self._latencies[endpoint]),
+                    ('queue', self._queue_times[endpoint]),
+                    ('decode', self._decode_times[endpoint]),
+                    ('parse', self._parse_times[endpoint]),
+                ):
+                    for p in percentiles:
+                        row[f'{name}_p{p:g}_ms'] = np.percentile(samples, p) * 1000 if samples else np.nan
+                rows[endpoint] = row
+        df = pd.DataFrame.from_dict(rows, orient='index')
+        for name in COUNT_COLUMNS:
+            df[name] = df[name].fillna(0) if name in df.columns else 0
+        return df
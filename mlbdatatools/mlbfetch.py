@@ -1,27 +1,144 @@
 from datatypes import (
-    EntryList, Game, Player, Team, Venue, DefensePlay, Pitch,
+    EntryList, ColumnEntryList, Game, Player, Team, Venue, DefensePlay, DefensePlaysResponse, Pitch,
     BatterBoxscore, PitcherBoxscore, GamefeedResponse, GamefeedsResponse,
-    SavantBatterPage, SavantBatterSeason
+    SavantBatterPage, SavantBatterPagesResponse, SavantBatterSeason
 )
-from utils import get_request_json, get_request_text
+from utils import (
+    get_request_json, get_request_text, Ttl,
+    TTL_LIVE, TTL_SHORT, TTL_DAY, TTL_FOREVER
+)
+import metrics
+import ratelimit
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, FIRST_COMPLETED, wait
+from contextvars import copy_context
+from datetime import date, timedelta
 import json
+import os
+import re
+import threading
+import time
+from typing import Callable, Iterable, Iterator, TypeVar, Any
+
+T = TypeVar('T')
+
+def _season_ttl(season: int) -> float:
+    # past seasons never change, the current one changes with roster moves
+    return TTL_FOREVER if int(season) < date.today().year else TTL_SHORT
+
+def _gamefeed_ttl(data: dict) -> float:
+    # finished games are immutable, live games change every pitch
+    state = data.get("gameData", {}).get("status", {}).get("abstractGameState")
+    return TTL_FOREVER if state == "Final" else TTL_LIVE
+
+def _schedule_ttl(end_date: str) -> Callable[[dict], float]:
+    def ttl(data: dict) -> float:
+        if end_date >= date.today().isoformat():
+            return TTL_SHORT
+        for d in data.get('dates', []):
+            for g in d.get('games', []):
+                if g.get('status', {}).get('abstractGameState') != 'Final':
+                    return TTL_SHORT
+        return TTL_FOREVER
+    return ttl
+
+def _iter_concurrent(func: Callable[[T], Any], items: Iterable[T], max_workers: int = 1, ordered: bool = True) -> Iterator[tuple[T, Any, Exception | None]]:
+    # run func over items on a thread pool, yielding (item, result, error) as
+    # results complete (or in input order). At most 2 * max_workers calls are
+    # pending or waiting to be yielded in order at once, so memory stays
+    # bounded for long inputs. Calls run in a copy of the caller's context so
+    # the request priority carries over.
+    max_workers = max(1, max_workers)
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending = {} # future -> (index, item)
+    done_out_of_order = {} # index -> (item, result, error)
+    next_index = 0
+    submitted = 0
+    try:
+        while True:
+            # results held back behind a slow earlier item count against the window
+            while len(pending) + len(done_out_of_order) < 2 * max_workers:
+                try:
+                    item = next(items)
+                except StopIteration:
+                    break
+                pending[executor.submit(copy_context().run, func, item)] = (submitted, item)
+                submitted += 1
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                i, item = pending.pop(future)
+                error = future.exception()
+                output = (item, None if error else future.result(), error)
+                if not ordered:
+                    yield output
+                    continue
+                done_out_of_order[i] = output
+                while next_index in done_out_of_order:
+                    yield done_out_of_order.pop(next_index)
+                    next_index += 1
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+# parsed reference data (players, teams, venues) kept in process by request,
+# expiring with the request's ttl: never for past seasons, hourly for the current one
+_references: dict[tuple, tuple[float, EntryList]] = {}
+_references_lock = threading.Lock()
+
+def _reference(endpoint: str, request: tuple[str, dict | None, Ttl], parse: Callable[[dict], EntryList], refresh: bool = False) -> EntryList:
+    cached = None if refresh else _cached_reference(request)
+    if cached is not None:
+        return cached
+    data = get_request_json(*request, endpoint=endpoint)
+    return _store_reference(request, metrics.parse(endpoint, parse, data))
 
-def players(sport_id: int = 1, season: int = 2024) -> EntryList[Player]:
+# shared with mlbfetch.aio, so both keep the same reference data
+def _reference_key(request: tuple[str, dict | None, Ttl]) -> tuple:
+    url, params, _ = request
+    return url, tuple(sorted((params or {}).items()))
+
+def _cached_reference(request: tuple[str, dict | None, Ttl]) -> EntryList | None:
+    with _references_lock:
+        cached = _references.get(_reference_key(request))
+    return cached[1] if cached is not None and cached[0] > time.monotonic() else None
+
+def _store_reference(request: tuple[str, dict | None, Ttl], value: EntryList) -> EntryList:
+    with _references_lock:
+        _references[_reference_key(request)] = (time.monotonic() + request[2], value)
+    return value
+
+def clear_reference_cache():
+    # forget the players, teams and venues kept in process
+    with _references_lock:
+        _references.clear()
+
+def players(sport_id: int = 1, season: int = 2024, refresh: bool = False) -> EntryList[Player]:
     """
     Fetches a list of players for a specific sport and season.
 
+    The parsed list is kept in process per sport and season, so repeated 
+    calls are free until the season's data may have changed (see clear_reference_cache).
+
     Parameters:
         sport_id (int): The ID of the sport to fetch players for. Default is 1 (MLB).
         season (int): The year of the season to fetch player data for. Default is 2024.
+        refresh (bool): Fetch again even if the season is kept in process. Default is False.
 
     Returns:
         EntryList[Player]: A list of Player objects.
     """
+    return EntryList(_reference('players', _players_request(sport_id, season), _parse_players, refresh))
+
+def _players_request(sport_id: int, season: int) -> tuple[str, dict | None, Ttl]:
     players_url = f"https://statsapi.mlb.com/api/v1/sports/{sport_id}/players"
     params = {
         'season': str(season),
     }
-    players_raw = get_request_json(players_url, params).get('people')
+    return players_url, params, _season_ttl(season)
+
+def _parse_players(data: dict) -> EntryList[Player]:
+    players_raw = data.get('people')
     players_clean = EntryList(Player(
         id=p.get('id'),
         full_name=p.get('fullName'),
@@ -39,18 +156,32 @@ def players(sport_id: int = 1, season: int = 2024) -> EntryList[Player]:
     ) for p in players_raw)
     return players_clean
 
-def teams() -> EntryList[Team]:
+def teams(season: int = 2024, refresh: bool = False) -> EntryList[Team]:
     """
     Fetches a list of teams for the MLB.
 
     This function retrieves detailed team information such as name, season, 
-    venue, and league affiliation from the MLB Stats API.
+    venue, and league affiliation from the MLB Stats API. The parsed list is 
+    kept in process per season, like players.
+
+    Parameters:
+        season (int): The year of the season to fetch teams for. Default is 2024.
+        refresh (bool): Fetch again even if the season is kept in process. Default is False.
 
     Returns:
         EntryList[Team]: A list of Team objects.
     """
-    teams_url = "https://statsapi.mlb.com/api/v1/teams?season=2024"
-    teams_raw = get_request_json(teams_url).get('teams')
+    return EntryList(_reference('teams', _teams_request(season), _parse_teams, refresh))
+
+def _teams_request(season: int = 2024) -> tuple[str, dict | None, Ttl]:
+    teams_url = "https://statsapi.mlb.com/api/v1/teams"
+    params = {
+        'season': str(season),
+    }
+    return teams_url, params, _season_ttl(season)
+
+def _parse_teams(data: dict) -> EntryList[Team]:
+    teams_raw = data.get('teams')
     teams_clean = EntryList(Team(
         id=t.get('id'),
         name=t.get('name'),
@@ -72,18 +203,28 @@ def teams() -> EntryList[Team]:
     ) for t in teams_raw)
     return teams_clean
 
-def venues() -> EntryList[Venue]:
+def venues(refresh: bool = False) -> EntryList[Venue]:
     """
     Fetches a list of MLB venues with detailed field and location information.
 
     This function retrieves information such as venue name, turf type, roof type, 
-    field dimensions, and location attributes from the MLB Stats API.
+    field dimensions, and location attributes from the MLB Stats API. The 
+    parsed list is kept in process, like players.
+
+    Parameters:
+        refresh (bool): Fetch again even if the venues are kept in process. Default is False.
 
     Returns:
         EntryList[Venue]: A list of Venue objects.
     """
+    return EntryList(_reference('venues', _venues_request(), _parse_venues, refresh))
+
+def _venues_request() -> tuple[str, dict | None, Ttl]:
     venues_url = "https://ws.statsapi.mlb.com/api/v1/venues?hydrate=fieldInfo,location"
-    venues_raw = get_request_json(venues_url).get("venues", [])
+    return venues_url, None, TTL_FOREVER
+
+def _parse_venues(data: dict) -> EntryList[Venue]:
+    venues_raw = data.get("venues", [])
     venues_clean = EntryList(
         Venue(
             id=v.get('id'),
@@ -115,6 +256,10 @@ def defense_plays(entity_id: int, start_year: int, end_year: int | None) -> Entr
     Returns:
         EntryList[DefensePlay]: A list of DefensePlay objects.
     """
+    data = get_request_json(*_defense_plays_request(entity_id, start_year, end_year), endpoint='defense_plays')
+    return metrics.parse('defense_plays', _parse_defense_plays, data)
+
+def _defense_plays_request(entity_id: int, start_year: int, end_year: int | None) -> tuple[str, dict | None, Ttl]:
     if end_year == None:
         end_year = start_year
     plays_url = "https://baseballsavant.mlb.com/visuals/oaa-data"
@@ -124,7 +269,9 @@ def defense_plays(entity_id: int, start_year: int, end_year: int | None) -> Entr
         'startYear': start_year,
         'endYear': end_year
     }
-    plays_raw = get_request_json(plays_url, params)
+    return plays_url, params, _season_ttl(end_year)
+
+def _parse_defense_plays(plays_raw: list[dict]) -> EntryList[DefensePlay]:
     plays_clean = EntryList(
         DefensePlay(
             fielder_id=p.get("target_mlb_id"),
@@ -141,6 +288,53 @@ def defense_plays(entity_id: int, start_year: int, end_year: int | None) -> Entr
     )
     return plays_clean
 
+def defense_plays_batch(
+    entity_ids: Iterable[int],
+    start_year: int,
+    end_year: int | None = None,
+    max_workers: int = 4,
+    columnar: bool = True,
+) -> DefensePlaysResponse:
+    """
+    Fetches defensive plays for many fielders over a range of years.
+
+    Each fielder and year is requested separately, so completed seasons are 
+    cached for good (when a cache is installed, see utils.set_cache) and a 
+    daily refresh only downloads the current season. Repeated ids are 
+    fetched once, and a request that fails is recorded in errors instead of 
+    failing the whole batch. See defense.oaa_rollup for aggregates.
+
+    Parameters:
+        entity_ids (Iterable[int]): The MLB.com IDs of the fielders.
+        start_year (int): The starting year of the range to fetch data for.
+        end_year (int | None): The ending year of the range to fetch data for. If None, defaults to start_year.
+        max_workers (int): Maximum number of requests made at once. Default is 4.
+        columnar (bool): Return plays as a ColumnEntryList instead of an EntryList. Default is True.
+
+    Returns:
+        DefensePlaysResponse: The plays in order of fielder then year, and the exception for 
+            each (fielder id, year) that failed.
+    """
+    if end_year is None:
+        end_year = start_year
+    pairs = [(e_id, year) for e_id in dict.fromkeys(entity_ids) for year in range(start_year, end_year + 1)]
+    parts: list[EntryList[DefensePlay]] = []
+    errors: dict[tuple[int, int], Exception] = {}
+
+    def fetch(pair: tuple[int, int]) -> EntryList[DefensePlay]:
+        return defense_plays(pair[0], pair[1], pair[1])
+
+    for pair, plays, error in _iter_concurrent(fetch, pairs, max_workers):
+        if error:
+            errors[pair] = error
+        elif columnar:
+            parts.append(ColumnEntryList.from_entries(DefensePlay, plays))
+        else:
+            parts.append(plays)
+    if columnar:
+        return DefensePlaysResponse(ColumnEntryList.concat(parts, DefensePlay), errors)
+    return DefensePlaysResponse(EntryList(play for part in parts for play in part), errors)
+
 def gamefeed(game_id: int) -> GamefeedResponse:
     """
     Fetches detailed game feed data for a specific MLB game.
@@ -158,10 +352,27 @@ def gamefeed(game_id: int) -> GamefeedResponse:
             - batter_boxscores (EntryList[BatterBoxscore]): Box score data for all batters.
             - pitcher_boxscores (EntryList[PitcherBoxscore]): Box score data for all pitchers.
     """
+    data = get_request_json(*_gamefeed_request(game_id), endpoint='gamefeed')
+    return metrics.parse('gamefeed', _parse_gamefeed, data, game_id)
+
+def _gamefeed_request(game_id: int) -> tuple[str, dict | None, Ttl]:
     gamefeed_url = f"https://statsapi.mlb.com/api/v1.1/game/{game_id}/feed/live"
-    data = get_request_json(gamefeed_url)
+    return gamefeed_url, None, _gamefeed_ttl
+
+def _parse_gamefeed(data: dict, game_id: int) -> GamefeedResponse:
+    game_data_clean = _parse_gamefeed_game(data)
+    all_plays = data.get("liveData", {}).get("plays", {}).get("allPlays", [])
+    batter_boxscores, pitcher_boxscores = _parse_gamefeed_boxscores(data, game_id)
+    return GamefeedResponse(
+        game=game_data_clean,
+        pitches=_parse_gamefeed_pitches(all_plays, game_data_clean, game_id),
+        batter_boxscores=batter_boxscores,
+        pitcher_boxscores=pitcher_boxscores
+    )
+
+def _parse_gamefeed_game(data: dict) -> Game:
     game_data = data.get("gameData", {})
-    game_data_clean = Game(
+    return Game(
         id=game_data.get("game", {}).get("pk"),
         type=game_data.get("game", {}).get("type"),
         doubleheader=game_data.get("game", {}).get("doubleheader"),
@@ -183,78 +394,135 @@ def gamefeed(game_id: int) -> GamefeedResponse:
         away_team_pitcher_id=game_data.get("probablePitchers", {}).get("away", {}).get("id"),
         away_team_pitcher_name=game_data.get("probablePitchers", {}).get("away", {}).get("fullName")
     )
-    all_plays = data.get("liveData", {}).get("plays", {}).get("allPlays", [])
-    pitches = [{'play_data': play, 'pitch_data': pitch} for play in all_plays for pitch in play.get("playEvents", []) if pitch.get('isPitch', False)]
+
+BASE_OUT_STATE_RUNNERS = {'1B': 1, '2B': 2, '3B': 4}
+
+def _play_context(play_data: dict, game_data_clean: Game, game_id: int) -> tuple[dict, int, list[tuple[float, int, int]]]:
+    # Pitch fields shared by every pitch of a plate appearance, computed once
+    # per play, the bitmask of runners the play lists on base at its start and
+    # the runner movements as (event index, base left, base reached) bits,
+    # in the order they happened
+    home_away_batting = "home" if play_data.get("about", {}).get("halfInning") == "top" else "away"
+    batting_team_id = game_data_clean.home_team_id if home_away_batting == "home" else game_data_clean.away_team_id
+    fielding_team_id = game_data_clean.away_team_id if home_away_batting == "home" else game_data_clean.home_team_id
+    # first runner entry from each origin base (None is the batter) and runs scored on the play
+    runners_by_origin: dict[str | None, dict] = {}
+    movements: list[tuple[float, int, int]] = []
+    runs_on_play = 0
+    for runner in play_data.get("runners", []):
+        movement = runner.get("movement", {})
+        runners_by_origin.setdefault(movement.get("originBase"), movement)
+        if movement.get("end") == "score":
+            runs_on_play += 1
+        # movements without an event index are treated as happening after the last pitch
+        event_index = runner.get("details", {}).get("playIndex")
+        movements.append((
+            float('inf') if event_index is None else event_index,
+            BASE_OUT_STATE_RUNNERS.get(movement.get("start"), 0),
+            BASE_OUT_STATE_RUNNERS.get(movement.get("end"), 0),
+        ))
+    movements.sort(key=lambda m: m[0])
+    bases = sum(bit for base, bit in BASE_OUT_STATE_RUNNERS.items() if base in runners_by_origin)
+    matchup = play_data.get("matchup", {})
+    return {
+        "inning": play_data.get("about", {}).get("inning"),
+        "ab_number": play_data.get("atBatIndex"),
+        "batter": matchup.get("batter", {}).get("id"),
+        "stand": matchup.get("batSide", {}).get("code"),
+        "pitcher": matchup.get("pitcher", {}).get("id"),
+        "p_throws": matchup.get("pitchHand", {}).get("code"),
+        "team_batting_id": batting_team_id,
+        "team_fielding_id": fielding_team_id,
+        "result": play_data.get("result", {}).get("event"),
+        "events": play_data.get("result", {}).get("event"),
+        "gameid": game_id,
+        "runner_on_1b": '1B' in runners_by_origin,
+        "runner_on_2b": '2B' in runners_by_origin,
+        "runner_on_3b": '3B' in runners_by_origin,
+        "runner_batter_score": runners_by_origin.get(None, {}).get("end") == "score",
+        "runner_1b_score": runners_by_origin.get('1B', {}).get("end") == "score",
+        "runner_2b_score": runners_by_origin.get('2B', {}).get("end") == "score",
+        "runner_3b_score": runners_by_origin.get('3B', {}).get("end") == "score",
+        "runs_on_play": runs_on_play,
+    }, bases, movements
+
+def _half_inning(play_data: dict) -> tuple[int | None, str | None]:
+    about = play_data.get("about", {})
+    return about.get("inning"), about.get("halfInning")
+
+def _parse_gamefeed_pitches(all_plays: list[dict], game_data_clean: Game, game_id: int) -> EntryList[Pitch]:
     clean_pitches: EntryList[Pitch] = EntryList()
-    for p in pitches:
-        play_data = p.get('play_data', {})
-        pitch_data = p.get('pitch_data', {})
-        home_away_batting = "home" if play_data.get("about", {}).get("halfInning") == "top" else "away"
-        home_away_fielding = "away" if home_away_batting == "home" else "home"
-        runners = play_data.get("runners", [])
-        runner_batter = [runner for runner in runners if runner.get("movement", {}).get("originBase") == None]
-        runner_on_1b = [runner for runner in runners if runner.get("movement", {}).get("originBase") == '1B']
-        runner_on_2b = [runner for runner in runners if runner.get("movement", {}).get("originBase") == '2B']
-        runner_on_3b = [runner for runner in runners if runner.get("movement", {}).get("originBase") == '3B']
-        is_runner_on_1b = len(runner_on_1b) > 0
-        is_runner_on_2b = len(runner_on_2b) > 0
-        is_runner_on_3b = len(runner_on_3b) > 0
-        runner_batter_score = runner_batter[0].get("movement", {}).get("end") == "score"  if len(runner_batter) > 0 else False
-        runner_1b_score = runner_on_1b[0].get("movement", {}).get("end") == "score" if is_runner_on_1b else False
-        runner_2b_score = runner_on_2b[0].get("movement", {}).get("end") == "score" if is_runner_on_2b else False
-        runner_3b_score = runner_on_3b[0].get("movement", {}).get("end") == "score" if is_runner_on_3b else False
-        clean_pitches.append(Pitch(**{
-            "id": pitch_data.get("playId"),
-            "inning": play_data.get("about", {}).get("inning"),
-            "ab_number": play_data.get("atBatIndex"),
-            "batter": play_data.get("matchup", {}).get("batter", {}).get("id"),
-            "stand": play_data.get("matchup", {}).get("batSide", {}).get("code"),
-            "pitcher": play_data.get("matchup", {}).get("pitcher", {}).get("id"),
-            "p_throws": play_data.get("matchup", {}).get("pitchHand", {}).get("code"),
-            "team_batting_id": game_data_clean.home_team_id if home_away_batting == "home" else game_data_clean.away_team_id,
-            "team_fielding_id": game_data_clean.home_team_id if home_away_fielding == "home" else game_data_clean.away_team_id,
-            "result": play_data.get("result", {}).get("event"),
-            "events": play_data.get("result", {}).get("event"),
-            "strikes": pitch_data.get("count", {}).get("strikes"),
-            "balls": pitch_data.get("count", {}).get("balls"),
-            "outs": pitch_data.get("count", {}).get("outs"),
-            "pitch_type": pitch_data.get("details", {}).get("type", {}).get("code"),
-            "call": pitch_data.get("details", {}).get("call", {}).get("description"),
-            "pitch_call": pitch_data.get("details", {}).get("call", {}).get("description"),
-            "start_speed": pitch_data.get("pitchData", {}).get("startSpeed"),
-            "extension": pitch_data.get("pitchData", {}).get("extension"),
-            "zone": pitch_data.get("pitchData", {}).get("zone"),
-            "spin_rate": pitch_data.get("pitchData", {}).get("breaks", {}).get("spinRate"),
-            "x0": pitch_data.get("pitchData", {}).get("coordinates", {}).get("x0"),
-            "z0": pitch_data.get("pitchData", {}).get("coordinates", {}).get("z0"),
-            "breakx": pitch_data.get("pitchData", {}).get("breaks", {}).get("breakHorizontal"),
-            "breakz": pitch_data.get("pitchData", {}).get("breaks", {}).get("breakVertical"),
-            "inducedbreakz": pitch_data.get("pitchData", {}).get("breaks", {}).get("breakVerticalInduced"),
-            "hit_speed": pitch_data.get("hitData", {}).get("launchSpeed"),
-            "hit_angle": pitch_data.get("hitData", {}).get("launchAngle"),
-            "pitch_number": pitch_data.get("pitchNumber"),
-            "gameid": game_id,
-            "px": pitch_data.get("pitchData", {}).get("coordinates", {}).get("pX"),
-            "pz": pitch_data.get("pitchData", {}).get("coordinates", {}).get("pZ"),
-            "y0": pitch_data.get("pitchData", {}).get("coordinates", {}).get("y0"),
-            "ax": pitch_data.get("pitchData", {}).get("coordinates", {}).get("aX"),
-            "ay": pitch_data.get("pitchData", {}).get("coordinates", {}).get("aY"),
-            "az": pitch_data.get("pitchData", {}).get("coordinates", {}).get("aZ"),
-            "vx0": pitch_data.get("pitchData", {}).get("coordinates", {}).get("vX0"),
-            "vy0": pitch_data.get("pitchData", {}).get("coordinates", {}).get("vY0"),
-            "vz0": pitch_data.get("pitchData", {}).get("coordinates", {}).get("vZ0"),
-            "hc_x_ft": pitch_data.get("hitData", {}).get("coordinates", {}).get("coordX"),
-            "hc_y_ft": pitch_data.get("hitData", {}).get("coordinates", {}).get("coordY"),
-            "runner_on_1b": is_runner_on_1b,
-            "runner_on_2b": is_runner_on_2b,
-            "runner_on_3b": is_runner_on_3b,
-            "runner_batter_score": runner_batter_score,
-            "runner_1b_score": runner_1b_score,
-            "runner_2b_score": runner_2b_score,
-            "runner_3b_score": runner_3b_score,
-        }))
-    
-    # Create boxscore lists
+    # Event counts are after the event, so a pitch's base-out state comes from
+    # the outs after the event before it and the runner movements before it.
+    # Outs and runners carry across the plays of a half inning (runners who do
+    # not move are not listed), so all_plays must start at the first play of one.
+    half_inning = None
+    outs_before = 0
+    bases = 0
+    for play_data in all_plays:
+        if _half_inning(play_data) != half_inning:
+            half_inning = _half_inning(play_data)
+            outs_before, bases = 0, 0
+        context, start_bases, movements = _play_context(play_data, game_data_clean, game_id)
+        bases |= start_bases
+        moved = 0
+        for index, pitch_data in enumerate(play_data.get("playEvents", [])):
+            count = pitch_data.get("count", {})
+            outs_after = count.get("outs")
+            if not pitch_data.get('isPitch', False):
+                outs_before = outs_after if outs_after is not None else outs_before
+                continue
+            while moved < len(movements) and movements[moved][0] < index:
+                _, left, reached = movements[moved]
+                bases = bases & ~left | reached
+                moved += 1
+            base_out_state = outs_before * 8 + bases if outs_before in (0, 1, 2) else None
+            outs_before = outs_after if outs_after is not None else outs_before
+            details = pitch_data.get("details", {})
+            pitch_info = pitch_data.get("pitchData", {})
+            breaks = pitch_info.get("breaks", {})
+            coordinates = pitch_info.get("coordinates", {})
+            hit_data = pitch_data.get("hitData", {})
+            clean_pitches.append(Pitch(**context, **{
+                "id": pitch_data.get("playId"),
+                "strikes": count.get("strikes"),
+                "balls": count.get("balls"),
+                "outs": outs_after,
+                "pitch_type": details.get("type", {}).get("code"),
+                "call": details.get("call", {}).get("description"),
+                "pitch_call": details.get("call", {}).get("description"),
+                "start_speed": pitch_info.get("startSpeed"),
+                "extension": pitch_info.get("extension"),
+                "zone": pitch_info.get("zone"),
+                "spin_rate": breaks.get("spinRate"),
+                "x0": coordinates.get("x0"),
+                "z0": coordinates.get("z0"),
+                "breakx": breaks.get("breakHorizontal"),
+                "breakz": breaks.get("breakVertical"),
+                "inducedbreakz": breaks.get("breakVerticalInduced"),
+                "hit_speed": hit_data.get("launchSpeed"),
+                "hit_angle": hit_data.get("launchAngle"),
+                "pitch_number": pitch_data.get("pitchNumber"),
+                "px": coordinates.get("pX"),
+                "pz": coordinates.get("pZ"),
+                "y0": coordinates.get("y0"),
+                "ax": coordinates.get("aX"),
+                "ay": coordinates.get("aY"),
+                "az": coordinates.get("aZ"),
+                "vx0": coordinates.get("vX0"),
+                "vy0": coordinates.get("vY0"),
+                "vz0": coordinates.get("vZ0"),
+                "hc_x_ft": hit_data.get("coordinates", {}).get("coordX"),
+                "hc_y_ft": hit_data.get("coordinates", {}).get("coordY"),
+                "base_out_state": base_out_state,
+            }))
+        for _, left, reached in movements[moved:]:
+            bases = bases & ~left | reached
+        play_outs = play_data.get("count", {}).get("outs")
+        outs_before = play_outs if play_outs is not None else outs_before
+    return clean_pitches
+
+def _parse_gamefeed_boxscores(data: dict, game_id: int) -> tuple[EntryList[BatterBoxscore], EntryList[PitcherBoxscore]]:
     batter_boxscores: EntryList[BatterBoxscore] = EntryList()
     pitcher_boxscores: EntryList[PitcherBoxscore] = EntryList()
     away_boxscores = list(data.get("liveData", {}).get("boxscore", {}).get("teams", {}).get("away", {}).get("players", {}).values())
@@ -310,22 +578,33 @@ def gamefeed(game_id: int) -> GamefeedResponse:
                 strikes=pitching_boxscore.get("strikes"),
             ))
 
-    return GamefeedResponse(
-        game=game_data_clean,
-        pitches=clean_pitches,
-        batter_boxscores=batter_boxscores,
-        pitcher_boxscores=pitcher_boxscores
-    )
+    return batter_boxscores, pitcher_boxscores
 
-def gamefeeds(game_ids: list[int]) -> GamefeedsResponse:
+def gamefeeds(game_ids: list[int], max_workers: int = 1, columnar: bool = False, processes: int | None = None) -> GamefeedsResponse:
     """
     Fetches game feed data for multiple MLB games.
 
     This function retrieves metadata, pitch-by-pitch details, and box score 
-    information for a list of specified games.
+    information for a list of specified games. Feeds are fetched and parsed 
+    concurrently when max_workers is greater than 1. Results keep the order 
+    of game_ids, and a game that fails to fetch or parse is recorded in 
+    `errors` instead of failing the whole batch.
+
+    With columnar=True each game is converted to ColumnEntryLists as soon 
+    as it is parsed, so at most one game's worth of Pitch objects is alive 
+    at a time and the combined lists convert to DataFrames without a 
+    row-wise pass.
+
+    With processes set, feeds are downloaded on max_workers threads and 
+    decoded and parsed in that many worker processes, which send each game 
+    back as ColumnEntryLists. Parsing then scales with cores instead of 
+    being held to one by the GIL. Requires columnar=True.
 
     Parameters:
         game_ids (list[int]): A list of MLB.com game IDs to fetch data for.
+        max_workers (int): Maximum number of feeds fetched at once. Default is 1 (sequential).
+        columnar (bool): Return ColumnEntryLists instead of EntryLists. Default is False.
+        processes (int | None): Number of worker processes parsing feeds. Default is None (parse on the fetching threads).
 
     Returns:
         GamefeedsResponse: An object containing aggregated data for all requested games:
@@ -333,15 +612,185 @@ def gamefeeds(game_ids: list[int]) -> GamefeedsResponse:
             - pitches (EntryList[Pitch]): Combined pitch data for all games.
             - batter_boxscores (EntryList[BatterBoxscore]): Box score data for all batters.
             - pitcher_boxscores (EntryList[PitcherBoxscore]): Box score data for all pitchers.
+            - errors (dict[int, Exception]): The exception raised for each game that failed.
+    """
+    parsed: dict[int, GamefeedResponse] = {}
+    errors: dict[int, Exception] = {}
+    for g_id, response, error in _iter_feeds(game_ids, max_workers, columnar, processes):
+        if error:
+            errors[g_id] = error
+        else:
+            parsed[g_id] = response
+    responses = [parsed[g_id] for g_id in game_ids if g_id in parsed]
+    return _merge_gamefeeds(responses, errors, columnar)
+
+def iter_gamefeeds(
+    game_ids: Iterable[int],
+    max_workers: int = 1,
+    ordered: bool = False,
+    on_error: Callable[[int, Exception], None] | None = None,
+) -> Iterator[GamefeedResponse]:
+    """
+    Fetches game feed data for multiple MLB games, yielding each game as soon 
+    as it is parsed.
+
+    Only a small window of games (2 * max_workers) is in flight at once, so 
+    memory stays bounded no matter how many game ids are passed.
+
+    Parameters:
+        game_ids (Iterable[int]): MLB.com game IDs to fetch data for.
+        max_workers (int): Maximum number of feeds fetched at once. Default is 1 (sequential).
+        ordered (bool): Yield games in the order of game_ids instead of as they complete. Default is False.
+        on_error (Callable[[int, Exception], None] | None): Called with the game id and exception 
+            for games that fail. If None, the exception is raised.
+
+    Yields:
+        GamefeedResponse: The game, pitches and box scores for one game.
+    """
+    for g_id, response, error in _iter_concurrent(gamefeed, game_ids, max_workers, ordered):
+        if error:
+            if on_error is None:
+                raise error
+            on_error(g_id, error)
+        else:
+            yield response
+
+def iter_gamefeed_batches(
+    game_ids: Iterable[int],
+    batch_size: int = 15,
+    max_workers: int = 1,
+    columnar: bool = True,
+    processes: int | None = None,
+) -> Iterator[GamefeedsResponse]:
+    """
+    Fetches game feed data for multiple MLB games, yielding a GamefeedsResponse 
+    for every batch_size games.
+
+    Each batch can be converted with to_pandas()/to_polars() and written out 
+    before the next one is fetched. Failed games are recorded in the batch's 
+    errors. With processes set, feeds are parsed in worker processes as in 
+    gamefeeds, while the threads keep downloading the next games.
+
+    Parameters:
+        game_ids (Iterable[int]): MLB.com game IDs to fetch data for.
+        batch_size (int): Number of games per batch. Default is 15.
+        max_workers (int): Maximum number of feeds fetched at once. Default is 1 (sequential).
+        columnar (bool): Return ColumnEntryLists instead of EntryLists. Default is True.
+        processes (int | None): Number of worker processes parsing feeds. Default is None (parse on the fetching threads).
+
+    Yields:
+        GamefeedsResponse: Aggregated data for up to batch_size games.
     """
     responses: list[GamefeedResponse] = []
-    for g_id in game_ids:
-        responses.append(gamefeed(g_id))
+    errors: dict[int, Exception] = {}
+    for g_id, response, error in _iter_feeds(game_ids, max_workers, columnar, processes):
+        if error:
+            errors[g_id] = error
+        else:
+            responses.append(response)
+        if len(responses) + len(errors) >= batch_size:
+            yield _merge_gamefeeds(responses, errors, columnar)
+            responses, errors = [], {}
+    if responses or errors:
+        yield _merge_gamefeeds(responses, errors, columnar)
+
+def _gamefeed_columns(response: GamefeedResponse) -> GamefeedResponse:
+    return GamefeedResponse(
+        game=response.game,
+        pitches=ColumnEntryList.from_entries(Pitch, response.pitches),
+        batter_boxscores=ColumnEntryList.from_entries(BatterBoxscore, response.batter_boxscores),
+        pitcher_boxscores=ColumnEntryList.from_entries(PitcherBoxscore, response.pitcher_boxscores),
+    )
+
+def _iter_feeds(
+    game_ids: Iterable[int], max_workers: int, columnar: bool, processes: int | None
+) -> Iterator[tuple[int, GamefeedResponse | None, Exception | None]]:
+    # (game id, response, error) per game as games complete, parsed on the
+    # fetching threads or, with processes, in worker processes
+    if processes:
+        if not columnar:
+            raise ValueError("processes requires columnar=True")
+        return _iter_gamefeeds_processes(game_ids, max_workers, processes)
+    if not columnar:
+        return _iter_concurrent(gamefeed, game_ids, max_workers, ordered=False)
+    return (
+        (g_id, None if error else _gamefeed_columns(response), error)
+        for g_id, response, error in _iter_concurrent(gamefeed, game_ids, max_workers, ordered=False)
+    )
+
+# the game state is near the top of a feed, so the ttl of a raw feed is found
+# without decoding it. The first match is gameData.status.
+GAMEFEED_STATE = re.compile(r'"abstractGameState"\s*:\s*"(\w+)"')
+
+def _gamefeed_text_ttl(text: str) -> float:
+    match = GAMEFEED_STATE.search(text)
+    return TTL_FOREVER if match is not None and match.group(1) == 'Final' else TTL_LIVE
+
+def _gamefeed_text(game_id: int) -> str:
+    url, params, _ = _gamefeed_request(game_id)
+    return get_request_text(url, params, _gamefeed_text_ttl, endpoint='gamefeed')
+
+def _parse_gamefeed_text(text: str, game_id: int) -> tuple[GamefeedResponse, float]:
+    # runs in a worker process. Only the game and column arrays are pickled
+    # back, along with the parse time for the parent's metrics.
+    start = time.perf_counter()
+    response = _gamefeed_columns(_parse_gamefeed(json.loads(text), game_id))
+    return response, time.perf_counter() - start
+
+def _parsed_gamefeeds(pending: dict[Future, int], done: Iterable[Future]) -> Iterator[tuple[int, GamefeedResponse | None, Exception | None]]:
+    for future in done:
+        g_id = pending.pop(future)
+        error = future.exception()
+        if error:
+            if metrics.enabled():
+                metrics.emit(metrics.ParseEvent('gamefeed', 0, error=repr(error)))
+            yield g_id, None, error
+            continue
+        response, duration = future.result()
+        if metrics.enabled():
+            metrics.emit(metrics.ParseEvent('gamefeed', duration))
+        yield g_id, response, None
+
+def _iter_gamefeeds_processes(
+    game_ids: Iterable[int], max_workers: int, processes: int
+) -> Iterator[tuple[int, GamefeedResponse | None, Exception | None]]:
+    # download raw feeds on max_workers threads and parse them on a process
+    # pool. At most 2 * processes feeds wait for a worker, and downloads pause
+    # while they do, so memory stays bounded.
+    executor = ProcessPoolExecutor(max_workers=processes)
+    pending: dict[Future, int] = {}
+    try:
+        for g_id, text, error in _iter_concurrent(_gamefeed_text, game_ids, max_workers, ordered=False):
+            if error:
+                yield g_id, None, error
+                continue
+            pending[executor.submit(_parse_gamefeed_text, text, g_id)] = g_id
+            if len(pending) >= 2 * processes:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                yield from _parsed_gamefeeds(pending, done)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            yield from _parsed_gamefeeds(pending, done)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+def _merge_gamefeeds(responses: list[GamefeedResponse | None], errors: dict[int, Exception], columnar: bool = False) -> GamefeedsResponse:
+    if columnar:
+        responses = [r for r in responses if r is not None]
+        return GamefeedsResponse(
+            games=ColumnEntryList.from_entries(Game, [r.game for r in responses]),
+            pitches=ColumnEntryList.concat([r.pitches for r in responses], Pitch),
+            batter_boxscores=ColumnEntryList.concat([r.batter_boxscores for r in responses], BatterBoxscore),
+            pitcher_boxscores=ColumnEntryList.concat([r.pitcher_boxscores for r in responses], PitcherBoxscore),
+            errors=errors
+        )
     games: EntryList[Game] = EntryList()
     pitches: EntryList[Pitch] = EntryList()
     batter_boxscores: EntryList[BatterBoxscore] = EntryList()
     pitcher_boxscores: EntryList[PitcherBoxscore] = EntryList()
     for r in responses:
+        if r is None:
+            continue
         games.append(r.game)
         pitches += r.pitches
         batter_boxscores += r.batter_boxscores
@@ -350,32 +799,91 @@ def gamefeeds(game_ids: list[int]) -> GamefeedsResponse:
         games=games,
         pitches=pitches,
         batter_boxscores=batter_boxscores,
-        pitcher_boxscores=pitcher_boxscores
+        pitcher_boxscores=pitcher_boxscores,
+        errors=errors
     )
 
-def schedule(start_date: str, end_date:str | None = None, sport_id: int = 1) -> EntryList[Game]:
+# hydrations requested by schedule by default. Game only reads the probable
+# pitchers and weather from them, hydrate=() still fills every other field.
+SCHEDULE_HYDRATE = ('team', 'probablePitcher', 'lineups', 'weather', 'scoringplays')
+
+def schedule(
+    start_date: str,
+    end_date: str | None = None,
+    sport_id: int = 1,
+    hydrate: Iterable[str] = SCHEDULE_HYDRATE,
+    chunk_days: int | None = None,
+    max_workers: int = 1,
+) -> EntryList[Game]:
     """
     Fetches the MLB game schedule for a specified date range.
 
     This function retrieves detailed information about scheduled games, 
     including participating teams, probable pitchers, venue, and weather conditions.
 
+    Long ranges can be split into chunks of chunk_days, fetched concurrently 
+    with max_workers. Each chunk is cached on its own, so once a chunk's 
+    games are final it is never downloaded again.
+
     Parameters:
         start_date (str): The starting date for the schedule (format: YYYY-MM-DD).
         end_date (str | None): The ending date for the schedule. If None, defaults to start_date.
+        sport_id (int): The ID of the sport. Default is 1 (MLB).
+        hydrate (Iterable[str]): Extra data requested per game. Default is SCHEDULE_HYDRATE. Pass () 
+            when only ids, dates, teams, venue and status are needed, which returns a much smaller 
+            response and leaves the weather and probable pitcher fields None.
+        chunk_days (int | None): Days per request. Default is None (one request for the whole range).
+        max_workers (int): Maximum number of chunks fetched at once. Default is 1 (sequential).
+
+    Raises:
+        ValueError: If chunk_days is less than 1.
 
     Returns:
         EntryList[Game]: A list of Game objects containing metadata about the scheduled games.
     """
+    if chunk_days is not None and chunk_days < 1:
+        raise ValueError(f"chunk_days must be at least 1, got {chunk_days}")
+    hydrate = tuple(hydrate)
+    chunks = _schedule_chunks(start_date, end_date or start_date, chunk_days)
+    if len(chunks) == 1:
+        return _schedule_chunk(chunks[0], sport_id, hydrate)
+    games: EntryList[Game] = EntryList()
+    for _, chunk_games, error in _iter_concurrent(lambda chunk: _schedule_chunk(chunk, sport_id, hydrate), chunks, max_workers):
+        if error:
+            raise error
+        games.extend(chunk_games)
+    return games
+
+def _schedule_chunks(start_date: str, end_date: str, chunk_days: int | None) -> list[tuple[str, str]]:
+    # consecutive (start, end) date ranges of at most chunk_days covering start_date..end_date
+    if chunk_days is None:
+        return [(start_date, end_date)]
+    start, end = date.fromisoformat(start_date), date.fromisoformat(end_date)
+    chunks = []
+    while start <= end:
+        chunk_end = min(start + timedelta(days=chunk_days - 1), end)
+        chunks.append((start.isoformat(), chunk_end.isoformat()))
+        start = chunk_end + timedelta(days=1)
+    return chunks or [(start_date, end_date)]
+
+def _schedule_chunk(chunk: tuple[str, str], sport_id: int, hydrate: tuple[str, ...]) -> EntryList[Game]:
+    data = get_request_json(*_schedule_request(chunk[0], chunk[1], sport_id, hydrate), endpoint='schedule')
+    return metrics.parse('schedule', _parse_schedule, data)
+
+def _schedule_request(start_date: str, end_date: str | None, sport_id: int, hydrate: Iterable[str] = SCHEDULE_HYDRATE) -> tuple[str, dict | None, Ttl]:
     schedule_url = f"https://statsapi.mlb.com/api/v1/schedule"
     params = {
         'sportId': sport_id,
         'gameType': 'R',
         'startDate': start_date,
         'endDate': end_date if end_date else start_date,
-        'hydrate': 'team,probablePitcher,lineups,weather,scoringplays'
     }
-    data = get_request_json(schedule_url, params)
+    hydrate = ','.join(hydrate)
+    if hydrate:
+        params['hydrate'] = hydrate
+    return schedule_url, params, _schedule_ttl(params['endDate'])
+
+def _parse_schedule(data: dict) -> EntryList[Game]:
     clean_games: EntryList[Game] = EntryList()
     for date in data.get('dates', []):
         for g in date.get('games', []):
@@ -404,63 +912,214 @@ def schedule(start_date: str, end_date:str | None = None, sport_id: int = 1) ->
             clean_games.append(game_data_clean)
     return clean_games
 
+SEASON_TABLES = ('pitches', 'batter_boxscores', 'pitcher_boxscores', 'games')
+
+def _season_partition(dest: str, table: str, game: Game) -> str:
+    return os.path.join(dest, table, f"season={game.season}", f"game_date={game.game_date}")
+
+def _write_parquet(entries: EntryList, path: str):
+    # partition keys live in the path, and a file is written to a temporary
+    # name first so partial files are never picked up
+    df = entries.to_pandas().drop(columns=['season', 'game_date'], errors='ignore')
+    tmp = path + '.tmp'
+    df.to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+
+def season_pitches(
+    season: int,
+    dest: str,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    max_workers: int = 8,
+    on_error: Callable[[int, Exception], None] | None = None,
+    processes: int | None = None,
+) -> EntryList[Game]:
+    """
+    Loads every finished regular season game of a season into a Parquet dataset.
+
+    Games are resolved through schedule, and only games that are not already 
+    in dest are fetched, so re-running the loader (e.g. daily) only touches 
+    games that finished since the last run. Each game is written as one file 
+    per table, partitioned by season and date:
+
+        dest/pitches/season=2024/game_date=2024-03-28/747060.parquet
+
+    for the pitches, batter_boxscores, pitcher_boxscores and games tables. The 
+    games file is written last and marks the game as loaded. The dataset can 
+    be read back with pandas.read_parquet(os.path.join(dest, "pitches")).
+    Feeds are requested at backfill priority, so live polling in the same 
+    process is served first. With processes set, feeds are parsed in that 
+    many worker processes while the threads keep downloading.
+
+    Parameters:
+        season (int): The season to load.
+        dest (str): Directory of the dataset.
+        start_date (str | None): Only load games on or after this date (format: YYYY-MM-DD). Default is the start of the season.
+        end_date (str | None): Only load games on or before this date (format: YYYY-MM-DD). Default is the end of the season.
+        max_workers (int): Maximum number of feeds fetched at once. Default is 8.
+        on_error (Callable[[int, Exception], None] | None): Called with the game id and exception 
+            for games that fail, which are retried on the next run. If None, the exception is raised.
+        processes (int | None): Number of worker processes parsing feeds. Default is None (parse on the fetching threads).
+
+    Returns:
+        EntryList[Game]: The games loaded by this call.
+    """
+    # only ids, dates and status are needed to find the games to load
+    games = schedule(
+        start_date or f"{season}-01-01", end_date or f"{season}-12-31",
+        hydrate=(), chunk_days=31, max_workers=max_workers
+    )
+    missing = [
+        g for g in games
+        if str(g.status_code).startswith('F') and not os.path.exists(
+            os.path.join(_season_partition(dest, 'games', g), f"{g.id}.parquet")
+        )
+    ]
+    scheduled = {g.id: g for g in missing}
+    loaded: EntryList[Game] = EntryList()
+    with ratelimit.request_priority(ratelimit.PRIORITY_BACKFILL):
+        for g_id, response, error in _iter_feeds(list(scheduled), max_workers, True, processes):
+            if error:
+                if on_error is None:
+                    raise error
+                on_error(g_id, error)
+                continue
+            game = response.game
+            # partition by the schedule so the next run finds the game where it looks
+            for table in SEASON_TABLES:
+                entries = EntryList([game]) if table == 'games' else getattr(response, table)
+                if len(entries) == 0:
+                    continue
+                partition = _season_partition(dest, table, scheduled[game.id])
+                os.makedirs(partition, exist_ok=True)
+                _write_parquet(entries, os.path.join(partition, f"{game.id}.parquet"))
+            loaded.append(game)
+    return loaded
+
 def savant_batter_page(player_id: int) -> SavantBatterPage:
+    """
+    Fetches the Baseball Savant player page for a batter.
+
+    Parameters:
+        player_id (int): The MLB.com ID of the batter.
+
+    Returns:
+        SavantBatterPage: The batter's statcast seasons with percentile ranks.
+    """
+    data = get_request_text(*_savant_batter_page_request(player_id), endpoint='savant_batter_page')
+    return metrics.parse('savant_batter_page', _parse_savant_batter_page, data, player_id)
+
+def savant_batter_pages(
+    player_ids: list[int],
+    max_workers: int = 4,
+    on_error: Callable[[int, Exception], None] | None = None,
+) -> SavantBatterPagesResponse:
+    """
+    Fetches the Baseball Savant player pages for many batters concurrently.
+
+    Pages are cached for a day when a cache is installed (see utils.set_cache), 
+    so re-running a refresh only downloads pages that expired or failed. 
+    Requests are paced by the baseballsavant.mlb.com rate limit (see ratelimit), 
+    which bounds throughput more than max_workers does.
+
+    Parameters:
+        player_ids (list[int]): The MLB.com IDs of the batters.
+        max_workers (int): Maximum number of pages fetched at once. Default is 4.
+        on_error (Callable[[int, Exception], None] | None): Called with the player id and exception 
+            for pages that fail, in addition to recording them in errors.
+
+    Returns:
+        SavantBatterPagesResponse: The pages keyed by player id (in the order of player_ids), and the 
+            exception for each player that failed.
+    """
+    response = SavantBatterPagesResponse({})
+    for player_id, page, error in _iter_concurrent(savant_batter_page, player_ids, max_workers):
+        if error:
+            response.errors[player_id] = error
+            if on_error is not None:
+                on_error(player_id, error)
+        else:
+            response.pages[player_id] = page
+    return response
+
+def _savant_batter_page_request(player_id: int) -> tuple[str, dict | None, Ttl]:
     url = f"https://baseballsavant.mlb.com/savant-player/{player_id}?stats=statcast-r-hitting-mlb"
-    data = get_request_text(url)
-    serverValsText = data.split('var serverVals = ')[1].split(';')[0]
+    return url, None, TTL_DAY
+
+def _parse_savant_batter_page(data: str, player_id: int) -> SavantBatterPage:
     seasons = EntryList[SavantBatterSeason]()
-    for line in serverValsText.split('\n'):
-        if 'statcast: ' in line:
-            line_data = line.split('statcast: ')[1][:-1]
-            statcast_seasons_raw = json.loads(line_data) 
-            for season_data in statcast_seasons_raw:
-                if season_data['year'] is None:
-                    continue
-                savant_season = SavantBatterSeason(
-                    # Existing fields with percentiles
-                    barrel_batted_rate=float(season_data['barrel_batted_rate']),
-                    pct_rank_barrel_batted_rate=float(season_data["percent_rank_barrel_batted_rate_unrounded"]),
-                    xba=float(season_data["xba"]),
-                    pct_rank_xba=float(season_data["percent_rank_xba_unrounded"]),
-                    hard_hit_rate=float(season_data["hard_hit_percent"]),
-                    pct_rank_hard_hit_rate=float(season_data["percent_rank_hard_hit_percent_unrounded"]),
-                    exit_velocity_avg=float(season_data["exit_velocity_avg"]),
-                    pct_rank_exit_velocity_avg=float(season_data["percent_rank_exit_velocity_avg_unrounded"]),
-                    launch_angle_avg=float(season_data["launch_angle_avg"]),
-                    pct_rank_launch_angle_avg=float(season_data["percent_rank_launch_angle_avg_unrounded"]),
-                    woba=float(season_data["woba"]),
-                    pct_rank_woba=float(season_data["percent_rank_woba_unrounded"]),
-                    xwoba=float(season_data["xwoba"]),
-                    pct_rank_xwoba=float(season_data["percent_rank_xwoba_unrounded"]),
-                    sweet_spot_percent=float(season_data["sweet_spot_percent"]),
-                    pct_rank_sweet_spot_percent=float(season_data["percent_rank_sweet_spot_percent_unrounded"]),
-                    groundballs_percent=float(season_data["groundballs_percent"]),
-                    pct_rank_groundballs_percent=float(season_data["percent_rank_groundballs_percent_unrounded"]),
-                    babip=float(season_data["babip"]),
-                    pct_rank_babip=float(season_data["percent_rank_babip_unrounded"]),
-                    obp=float(season_data["obp"]),
-                    pct_rank_obp=float(season_data["percent_rank_obp_unrounded"]),
-                    slg=float(season_data["slg"]),
-                    pct_rank_slg=float(season_data["percent_rank_slg_unrounded"]),
-                    iso=float(season_data["iso"]),
-                    pct_rank_iso=float(season_data["percent_rank_iso_unrounded"]),
-                    bacon=float(season_data["bacon"]),
-                    pct_rank_bacon=float(season_data["percent_rank_bacon_unrounded"]),
-                    xbacon=float(season_data["xbacon"]),
-                    pct_rank_xbacon=float(season_data["percent_rank_xbacon_unrounded"]),
-                    xslg=float(season_data["xslg"]),
-                    pct_rank_xslg=float(season_data["percent_rank_xslg_unrounded"]),
-                    xiso=float(season_data["xiso"]),
-                    pct_rank_xiso=float(season_data["percent_rank_xiso_unrounded"]),
-                    avg_hyper_speed=float(season_data["avg_hyper_speed"]),
-                    pct_rank_avg_hyper_speed=float(season_data["percent_rank_avg_hyper_speed_unrounded"]),
-                    avg_best_speed=float(season_data["avg_best_speed"]),
-                    pct_rank_avg_best_speed=float(season_data["percent_rank_avg_best_speed_unrounded"]),
-                )
-
-                # Append to the list of seasons
-                seasons.append(savant_season)
+    for season_data in _savant_statcast(data, player_id):
+        if season_data['year'] is None:
+            continue
+        savant_season = SavantBatterSeason(
+            # Existing fields with percentiles
+            barrel_batted_rate=float(season_data['barrel_batted_rate']),
+            pct_rank_barrel_batted_rate=float(season_data["percent_rank_barrel_batted_rate_unrounded"]),
+            xba=float(season_data["xba"]),
+            pct_rank_xba=float(season_data["percent_rank_xba_unrounded"]),
+            hard_hit_rate=float(season_data["hard_hit_percent"]),
+            pct_rank_hard_hit_rate=float(season_data["percent_rank_hard_hit_percent_unrounded"]),
+            exit_velocity_avg=float(season_data["exit_velocity_avg"]),
+            pct_rank_exit_velocity_avg=float(season_data["percent_rank_exit_velocity_avg_unrounded"]),
+            launch_angle_avg=float(season_data["launch_angle_avg"]),
+            pct_rank_launch_angle_avg=float(season_data["percent_rank_launch_angle_avg_unrounded"]),
+            woba=float(season_data["woba"]),
+            pct_rank_woba=float(season_data["percent_rank_woba_unrounded"]),
+            xwoba=float(season_data["xwoba"]),
+            pct_rank_xwoba=float(season_data["percent_rank_xwoba_unrounded"]),
+            sweet_spot_percent=float(season_data["sweet_spot_percent"]),
+            pct_rank_sweet_spot_percent=float(season_data["percent_rank_sweet_spot_percent_unrounded"]),
+            groundballs_percent=float(season_data["groundballs_percent"]),
+            pct_rank_groundballs_percent=float(season_data["percent_rank_groundballs_percent_unrounded"]),
+            babip=float(season_data["babip"]),
+            pct_rank_babip=float(season_data["percent_rank_babip_unrounded"]),
+            obp=float(season_data["obp"]),
+            pct_rank_obp=float(season_data["percent_rank_obp_unrounded"]),
+            slg=float(season_data["slg"]),
+            pct_rank_slg=float(season_data["percent_rank_slg_unrounded"]),
+            iso=float(season_data["iso"]),
+            pct_rank_iso=float(season_data["percent_rank_iso_unrounded"]),
+            bacon=float(season_data["bacon"]),
+            pct_rank_bacon=float(season_data["percent_rank_bacon_unrounded"]),
+            xbacon=float(season_data["xbacon"]),
+            pct_rank_xbacon=float(season_data["percent_rank_xbacon_unrounded"]),
+            xslg=float(season_data["xslg"]),
+            pct_rank_xslg=float(season_data["percent_rank_xslg_unrounded"]),
+            xiso=float(season_data["xiso"]),
+            pct_rank_xiso=float(season_data["percent_rank_xiso_unrounded"]),
+            avg_hyper_speed=float(season_data["avg_hyper_speed"]),
+            pct_rank_avg_hyper_speed=float(season_data["percent_rank_avg_hyper_speed_unrounded"]),
+            avg_best_speed=float(season_data["avg_best_speed"]),
+            pct_rank_avg_best_speed=float(season_data["percent_rank_avg_best_speed_unrounded"]),
+        )
+
+        # Append to the list of seasons
+        seasons.append(savant_season)
     return SavantBatterPage(
         player_id,
         savant_seasons=seasons
-    )
\ No newline at end of file
+    )
+
+SAVANT_STATCAST = re.compile(r'^\s*statcast: ', re.M)
+
+def _savant_statcast(data: str, player_id: int) -> list[dict]:
+    # decode the statcast seasons array embedded in the page's serverVals
+    # script, instead of splitting the whole document into lines. Only that
+    # script is searched, other scripts on the page have statcast keys too.
+    start = data.find('var serverVals = ')
+    if start == -1:
+        raise ValueError(f"no serverVals on the savant page for player {player_id}")
+    end = data.find('</script>', start)
+    script = data[start:end if end != -1 else len(data)]
+    match = SAVANT_STATCAST.search(script)
+    if match is None:
+        return []
+    seasons, _ = json.JSONDecoder().raw_decode(script, match.end())
+    return seasons
+
+def __getattr__(name: str):
+    # mlbfetch.aio is imported on first use so aiohttp stays optional
+    if name == 'aio':
+        import aio
+        return aio
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
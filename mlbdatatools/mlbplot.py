@@ -1,16 +1,77 @@
+import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle
 import numpy as np
 import pandas as pd
-from dataclasses import fields
-from datatypes import SavantBatterSeason
+from dataclasses import dataclass, field, fields
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Callable, Iterable
+import os
 from matplotlib.colors import Normalize
-from matplotlib.cm import ScalarMappable, get_cmap
+from matplotlib.cm import ScalarMappable
+from matplotlib import colormaps
+from matplotlib.colors import LogNorm
+from matplotlib.lines import Line2D
+from matplotlib.figure import Figure
 
 FIG_SIZE_X = 6
 FIG_SIZE_Y = 6
 
-def pitch_locations(df: pd.DataFrame | pd.Series, label_column='pitch_type'):
+PLOT_MODES = ('auto', 'scatter', 'density', 'hexbin')
+AUTO_DENSITY_THRESHOLD = 50_000 # points above which mode='auto' draws a density plot
+RASTERIZE_THRESHOLD = 5_000 # scatter plots with more points are drawn as an image in vector output
+
+def _finish(fig: Figure, path: str | None, show: bool | None) -> Figure:
+    # save and/or show a finished chart. Saved figures are closed (after
+    # showing them, if asked) so pyplot does not keep them alive when
+    # rendering many charts.
+    if path is not None:
+        fig.savefig(path)
+    if show if show is not None else path is None:
+        plt.show()
+    if path is not None:
+        plt.close(fig)
+    return fig
+
+def _draw_points(ax, x: pd.Series, y: pd.Series, labels: pd.Series, label_title: str,
+                 mode: str = 'auto', bins: int = 50, extent: tuple[float, float, float, float] | None = None,
+                 legend_loc: str = 'best'):
+    # Draws points colored by label with one scatter call (grouping in a single
+    # factorize pass), or bins them into a density plot. extent is
+    # (xmin, xmax, ymin, ymax), the data range if None.
+    if mode not in PLOT_MODES:
+        raise ValueError(f"mode must be one of {PLOT_MODES}, got {mode!r}")
+    if mode == 'auto':
+        mode = 'density' if len(x) > AUTO_DENSITY_THRESHOLD else 'scatter'
+
+    if mode == 'scatter':
+        codes, uniques = pd.factorize(labels, use_na_sentinel=False)
+        cycle = plt.rcParams['axes.prop_cycle'].by_key()['color']
+        colors = np.array(cycle, dtype=object)[codes % len(cycle)]
+        ax.scatter(x, y, c=list(colors), alpha=0.7, rasterized=len(x) > RASTERIZE_THRESHOLD)
+        handles = [
+            Line2D([], [], linestyle='', marker='o', alpha=0.7, color=cycle[i % len(cycle)], label=label)
+            for i, label in enumerate(uniques)
+        ]
+        ax.legend(handles=handles, title=label_title, loc=legend_loc)
+        return
+
+    x = x.to_numpy(dtype=float, na_value=np.nan)
+    y = y.to_numpy(dtype=float, na_value=np.nan)
+    finite = np.isfinite(x) & np.isfinite(y)
+    x, y = x[finite], y[finite]
+    if extent is None:
+        extent = (x.min(), x.max(), y.min(), y.max()) if len(x) else (0, 1, 0, 1)
+    if mode == 'hexbin':
+        mappable = ax.hexbin(x, y, gridsize=bins, extent=extent, mincnt=1, cmap='viridis', bins='log')
+    else:
+        counts, x_edges, y_edges = np.histogram2d(x, y, bins=bins, range=[extent[:2], extent[2:]])
+        counts = np.ma.masked_equal(counts, 0)
+        norm = LogNorm(vmin=1, vmax=max(counts.max(), 1)) if counts.count() else None
+        mappable = ax.pcolormesh(x_edges, y_edges, counts.T, cmap='viridis', norm=norm)
+    ax.figure.colorbar(mappable, ax=ax, label='Count')
+
+def pitch_locations(df: pd.DataFrame | pd.Series, label_column='pitch_type', mode='auto', bins=50, path=None, show=None) -> Figure:
     """
     Plots a 2D scatter plot of pitch coordinates (px, pz) with different colors for each label.
     Includes a strike zone box, with equal axis scaling and y-axis minimum set to the floor of the data.
@@ -18,6 +79,14 @@ def pitch_locations(df: pd.DataFrame | pd.Series, label_column='pitch_type'):
     Parameters:
         df (pd.DataFrame): DataFrame containing 'px', 'pz', and label_column columns.
         label_column (str): Column to use for labeling points (default is 'pitch_type').
+        mode (str): 'scatter', 'density' (2D histogram), 'hexbin', or 'auto' to use density 
+            above AUTO_DENSITY_THRESHOLD pitches (default is 'auto'). Labels are ignored by the density modes.
+        bins (int): Bins per axis for the density modes (default is 50).
+        path (str | None): Save the figure to this file (format from the extension) and close it.
+        show (bool | None): Call plt.show(). Default is to show only when path is None.
+
+    Returns:
+        Figure: The chart.
     """
     if not {'px', 'pz'}.issubset(df.columns):
         raise ValueError("DataFrame must contain 'px' and 'pz' columns")
@@ -27,11 +96,7 @@ def pitch_locations(df: pd.DataFrame | pd.Series, label_column='pitch_type'):
     
     fig, ax = plt.subplots(figsize=(FIG_SIZE_X, FIG_SIZE_Y))
     
-    # Create a scatter plot for each unique label
-    unique_labels = df[label_column].unique()
-    for label in unique_labels:
-        subset = df[df[label_column] == label]
-        ax.scatter(subset['px'], subset['pz'], label=label, alpha=0.7)
+    _draw_points(ax, df['px'], df['pz'], df[label_column], label_column.capitalize(), mode, bins)
     
     # Define the strike zone (centered at px = 0, z range = [20/12, 43/12])
     strike_zone = Rectangle(
@@ -46,20 +111,26 @@ def pitch_locations(df: pd.DataFrame | pd.Series, label_column='pitch_type'):
     ax.set_xlabel('Horizontal Coordinate (px)')
     ax.set_ylabel('Vertical Coordinate (pz)')
     ax.set_title(f'Pitch Locations by {label_column.capitalize()}')
-    ax.legend(title=label_column.capitalize())
     ax.grid(True, linestyle='--', alpha=0.5)
     
     # Ensure equal scaling for both axes
     ax.set_aspect('equal', adjustable='datalim')
-    plt.show()
+    return _finish(fig, path, show)
 
-def pitch_movements(df: pd.DataFrame | pd.Series, label_column='pitch_type'):
+def pitch_movements(df: pd.DataFrame | pd.Series, label_column='pitch_type', mode='auto', bins=50, path=None, show=None) -> Figure:
     """
     Plots a 2D scatter plot of pitch breaks (breakx and inducedbreakz) with different colors for each label.
 
     Parameters:
         df (pd.DataFrame): DataFrame containing 'breakx', 'inducedbreakz', and label_column columns.
         label_column (str): Column to use for labeling points (default is 'pitch_type').
+        mode (str): 'scatter', 'density', 'hexbin' or 'auto' (default is 'auto'), see pitch_locations.
+        bins (int): Bins per axis for the density modes (default is 50).
+        path (str | None): Save the figure to this file (format from the extension) and close it.
+        show (bool | None): Call plt.show(). Default is to show only when path is None.
+
+    Returns:
+        Figure: The chart.
     """
     if not {'breakx', 'inducedbreakz'}.issubset(df.columns):
         raise ValueError("DataFrame must contain 'breakx' and 'inducedbreakz' columns")
@@ -69,11 +140,10 @@ def pitch_movements(df: pd.DataFrame | pd.Series, label_column='pitch_type'):
     
     fig, ax = plt.subplots(figsize=(FIG_SIZE_X, FIG_SIZE_Y))
     
-    # Create a scatter plot for each unique label
-    unique_labels = df[label_column].unique()
-    for label in unique_labels:
-        subset = df[df[label_column] == label]
-        ax.scatter(subset['breakx'], subset['inducedbreakz'], label=label, alpha=0.7)
+    _draw_points(
+        ax, df['breakx'], df['inducedbreakz'], df[label_column], label_column.capitalize(),
+        mode, bins, extent=(-36, 36, -36, 36), legend_loc='upper left'
+    )
     
     # Set axis limits to represent a 24-inch square space
     ax.set_xlim(-36, 36)
@@ -83,15 +153,14 @@ def pitch_movements(df: pd.DataFrame | pd.Series, label_column='pitch_type'):
     ax.set_xlabel('Horizontal Break (breakx) [inches]')
     ax.set_ylabel('Vertical Break (inducedbreakz) [inches]')
     ax.set_title(f'Pitch Breaks by {label_column.capitalize()}')
-    ax.legend(title=label_column.capitalize(), loc='upper left')
     ax.grid(True, linestyle='--', alpha=0.5)
     
     # Ensure equal aspect ratio
     ax.set_aspect('equal')
     
-    plt.show()
+    return _finish(fig, path, show)
 
-def spray_chart(df: pd.DataFrame | pd.Series, label_column='events'):
+def spray_chart(df: pd.DataFrame | pd.Series, label_column='events', mode='auto', bins=50, path=None, show=None) -> Figure:
     """
     Plots a spray chart of batted ball locations using `hc_x_ft` and `hc_y_ft` 
     from a pitch DataFrame. Includes curved foul lines extending 300 feet.
@@ -99,6 +168,13 @@ def spray_chart(df: pd.DataFrame | pd.Series, label_column='events'):
     Parameters:
         df (pd.DataFrame): DataFrame containing 'hc_x_ft', 'hc_y_ft', and label_column.
         label_column (str): Column to use for labeling points (default is 'events').
+        mode (str): 'scatter', 'density', 'hexbin' or 'auto' (default is 'auto'), see pitch_locations.
+        bins (int): Bins per axis for the density modes (default is 50).
+        path (str | None): Save the figure to this file (format from the extension) and close it.
+        show (bool | None): Call plt.show(). Default is to show only when path is None.
+
+    Returns:
+        Figure: The chart.
     """
     if not {'hc_x_ft', 'hc_y_ft'}.issubset(df.columns):
         raise ValueError("DataFrame must contain 'hc_x_ft' and 'hc_y_ft' columns")
@@ -111,16 +187,15 @@ def spray_chart(df: pd.DataFrame | pd.Series, label_column='events'):
     fig, ax = plt.subplots(figsize=(FIG_SIZE_X, FIG_SIZE_Y))
 
     # Plot each batted ball location with labels
-    unique_labels = df[label_column].unique()
-    for label in unique_labels:
-        subset = df[df[label_column] == label]
-        ax.scatter(subset['hc_x_ft'], subset['hc_y_ft'], label=label, alpha=0.7)
+    _draw_points(
+        ax, df['hc_x_ft'], df['hc_y_ft'], df[label_column], label_column.capitalize(),
+        mode, bins, extent=(-20, 350, -20, 350), legend_loc='upper left'
+    )
     
     # Set labels and title
     ax.set_xlabel('Y from Home Plate (feet)')
     ax.set_ylabel('X Distance from Home Plate (feet)')
     ax.set_title(f'Spray Chart by {label_column.capitalize()}')
-    ax.legend(title=label_column.capitalize(), loc='upper left')
     ax.grid(True, linestyle='--', alpha=0.5)
     
     # Set aspect ratio and orientation
@@ -128,15 +203,20 @@ def spray_chart(df: pd.DataFrame | pd.Series, label_column='events'):
     ax.set_xlim(-20, 350)
     ax.set_ylim(-20, 350)
     
-    plt.show()
+    return _finish(fig, path, show)
 
-def plot_savant_percentile_chart_dynamic(savant_season, title="MLB Percentile Rankings"):
+def plot_savant_percentile_chart_dynamic(savant_season, title="MLB Percentile Rankings", path=None, show=None) -> Figure:
     """
     Plots a Baseball Savant-style percentile chart dynamically based on a data instance.
 
     Parameters:
         savant_season (SavantBatterSeason): An instance containing percentile rankings and their corresponding values.
         title (str): The title of the chart.
+        path (str | None): Save the figure to this file (format from the extension) and close it.
+        show (bool | None): Call plt.show(). Default is to show only when path is None.
+
+    Returns:
+        Figure: The chart.
     """
     # Extract fields with `pct_rank` in their names
     field_dict = {
@@ -154,7 +234,7 @@ def plot_savant_percentile_chart_dynamic(savant_season, title="MLB Percentile Ra
 
     # Normalize the percentiles for the colormap
     norm = Normalize(vmin=0, vmax=100)
-    cmap = get_cmap("coolwarm")  # Choose a gradient colormap
+    cmap = colormaps["coolwarm"]  # Choose a gradient colormap
     sm = ScalarMappable(norm=norm, cmap=cmap)
 
     fig, ax = plt.subplots(figsize=(8, len(categories) * 0.5))
@@ -176,15 +256,133 @@ def plot_savant_percentile_chart_dynamic(savant_season, title="MLB Percentile Ra
     ax.set_yticks([])
 
     # Add title
-    plt.title(title, fontsize=14, weight='bold')
+    ax.set_title(title, fontsize=14, weight='bold')
 
     # Add color bar for the gradient
-    cbar = plt.colorbar(sm, orientation="horizontal", pad=0.1, aspect=50)
+    cbar = fig.colorbar(sm, ax=ax, orientation="horizontal", pad=0.1, aspect=50)
     cbar.set_label('Percentile', fontsize=10)
 
     # Add gridlines for better readability
     ax.grid(axis='x', linestyle='--', alpha=0.6)
 
-    plt.xlabel("Percentile", fontsize=10)
-    plt.tight_layout()
-    plt.show()
\ No newline at end of file
+    ax.set_xlabel("Percentile", fontsize=10)
+    fig.tight_layout()
+    return _finish(fig, path, show)
+
+@dataclass
+class PlotJob:
+    """
+    One chart for render_batch.
+
+    Parameters:
+        func (str | Callable): An mlbplot function or its name, e.g. "pitch_locations".
+        path (str): File the chart is written to.
+        args (tuple): Positional arguments for func, e.g. a DataFrame or SavantBatterSeason.
+        kwargs (dict): Keyword arguments for func.
+    """
+    func: str | Callable[..., Figure]
+    path: str
+    args: tuple = ()
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+def _init_worker():
+    matplotlib.use('Agg')
+
+def _render_job(job: PlotJob) -> str:
+    func = globals()[job.func] if isinstance(job.func, str) else job.func
+    directory = os.path.dirname(job.path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    func(*job.args, **job.kwargs, path=job.path, show=False)
+    return job.path
+
+def render_batch(
+    jobs: Iterable[PlotJob],
+    max_workers: int | None = None,
+    on_error: Callable[[PlotJob, Exception], None] | None = None,
+) -> list[str]:
+    """
+    Renders charts to files in parallel worker processes using the 
+    non-interactive Agg backend.
+
+    Parameters:
+        jobs (Iterable[PlotJob]): The charts to render. Their arguments are pickled to the workers 
+            as they are submitted, at most 2 * max_workers jobs at a time, so a generator of jobs 
+            is never held in memory all at once.
+        max_workers (int | None): Number of worker processes. Default is the number of CPUs.
+        on_error (Callable[[PlotJob, Exception], None] | None): Called with the job and exception 
+            for charts that fail. If None, the exception is raised.
+
+    Returns:
+        list[str]: Paths of the charts written, in the order they finished.
+
+    Example:
+        jobs = [
+            PlotJob("pitch_locations", f"reports/{pitcher}.png", (group,))
+            for pitcher, group in df.groupby("pitcher")
+        ]
+        render_batch(jobs, max_workers=8)
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    jobs = iter(jobs)
+    written = []
+    pending: dict[Future, PlotJob] = {}
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+        try:
+            while True:
+                while len(pending) < 2 * max_workers:
+                    job = next(jobs, None)
+                    if job is None:
+                        break
+                    pending[executor.submit(_render_job, job)] = job
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = pending.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        written.append(future.result())
+                    elif on_error is None:
+                        raise error
+                    else:
+                        on_error(job, error)
+        finally:
+            for future in pending:
+                future.cancel()
+    return written
+
+def render_groups(
+    df: pd.DataFrame,
+    func: str | Callable[..., Figure],
+    by: str | list[str],
+    dest: str,
+    fmt: str = 'png',
+    max_workers: int | None = None,
+    on_error: Callable[[PlotJob, Exception], None] | None = None,
+    **kwargs,
+) -> list[str]:
+    """
+    Renders one chart per group of a DataFrame, e.g. pitch_locations for every
+    pitcher, with render_batch. Files are named after the group keys:
+
+        dest/<key>.png, or dest/<key1>_<key2>.png when grouping by several columns
+
+    Parameters:
+        df (pd.DataFrame): Rows to plot.
+        func (str | Callable): An mlbplot function that takes a DataFrame, or its name.
+        by (str | list[str]): Column(s) to group by.
+        dest (str): Directory the charts are written to.
+        fmt (str): Image format and file extension (default is 'png').
+        max_workers (int | None): Number of worker processes. Default is the number of CPUs.
+        on_error (Callable[[PlotJob, Exception], None] | None): See render_batch.
+        **kwargs: Passed to func, e.g. mode="density".
+
+    Returns:
+        list[str]: Paths of the charts written.
+    """
+    jobs = (
+        PlotJob(func, os.path.join(dest, '_'.join(map(str, key if isinstance(key, tuple) else (key,))) + '.' + fmt), (group,), kwargs)
+        for key, group in df.groupby(by, observed=True, sort=False)
+    )
+    return render_batch(jobs, max_workers, on_error)
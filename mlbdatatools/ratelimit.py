@@ -0,0 +1,196 @@
+"""
+Per-host rate limiting shared by every request mlbfetch makes.
+
+Each host has a token bucket. Requests waiting for a token are served in
+priority order (lower first), so live game polling gets ahead of background
+backfill traffic. Priority is set for a block of code with request_priority
+and carries over to the worker threads mlbfetch starts.
+
+    from mlbdatatools import ratelimit
+
+    ratelimit.configure("baseballsavant.mlb.com", rate=1, burst=2)
+    with ratelimit.request_priority(ratelimit.PRIORITY_BACKFILL):
+        mlbfetch.season_pitches(2024, "data/mlb")
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+
+PRIORITY_LIVE = 0
+PRIORITY_DEFAULT = 10
+PRIORITY_BACKFILL = 20
+
+# requests per second and burst size per host
+DEFAULT_LIMITS = {
+    'statsapi.mlb.com': (10, 20),
+    'ws.statsapi.mlb.com': (10, 20),
+    'baseballsavant.mlb.com': (2, 4),
+}
+
+_priority: ContextVar[int] = ContextVar('request_priority', default=PRIORITY_DEFAULT)
+
+@contextmanager
+def request_priority(priority: int):
+    # requests made inside the block (and by worker threads it starts) use priority
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+def current_priority() -> int:
+    return _priority.get()
+
+
+class TokenBucket:
+    """
+    Allows rate requests per second on average and up to burst at once.
+    Not thread safe on its own, RequestScheduler guards it with a lock.
+    """
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self) -> float:
+        # take a token, or return the seconds until one is available
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+
+class RequestScheduler:
+    """
+    Hands out request slots per host, highest priority (lowest number) first
+    and first come first served within a priority. Hosts without a limit are
+    never delayed.
+
+    Parameters:
+        limits (dict[str, tuple[float, float]] | None): (rate, burst) per host. Default is DEFAULT_LIMITS.
+    """
+    def __init__(self, limits: dict[str, tuple[float, float]] | None = None):
+        self._cond = threading.Condition()
+        self._buckets: dict[str, TokenBucket] = {}
+        self._queues: dict[str, list[tuple[int, int]]] = {}
+        self._cancelled: set[tuple[int, int]] = set()
+        self._tickets = itertools.count()
+        for host, (rate, burst) in (DEFAULT_LIMITS if limits is None else limits).items():
+            self.configure(host, rate, burst)
+
+    def configure(self, host: str, rate: float | None, burst: float | None = None):
+        # rate=None removes the limit for host
+        with self._cond:
+            if rate is None:
+                self._buckets.pop(host, None)
+            else:
+                self._buckets[host] = TokenBucket(rate, burst if burst is not None else max(1, rate))
+            self._cond.notify_all()
+
+    def _enqueue(self, host: str, priority: int) -> tuple[int, int]:
+        entry = (priority, next(self._tickets))
+        heapq.heappush(self._queues.setdefault(host, []), entry)
+        return entry
+
+    def _try(self, host: str, entry: tuple[int, int]) -> float:
+        # 0 when entry got its slot, otherwise seconds to wait before trying again
+        bucket = self._buckets.get(host)
+        queue = self._queues[host]
+        while queue and queue[0] in self._cancelled:
+            self._cancelled.discard(heapq.heappop(queue))
+        if bucket is None:
+            self._cancel(host, entry)
+            return 0
+        if queue[0] != entry:
+            return 1 / bucket.rate
+        wait = bucket.take()
+        if wait == 0:
+            heapq.heappop(queue)
+            self._cond.notify_all()
+        return wait
+
+    def _cancel(self, host: str, entry: tuple[int, int]):
+        queue = self._queues[host]
+        if queue and queue[0] == entry:
+            heapq.heappop(queue)
+            self._cond.notify_all()
+        else:
+            self._cancelled.add(entry)
+
+    def acquire(self, host: str, priority: int | None = None) -> float:
+        """
+        Blocks until a request to host may be sent.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        start = time.monotonic()
+        with self._cond:
+            if host not in self._buckets:
+                return 0
+            entry = self._enqueue(host, current_priority() if priority is None else priority)
+            try:
+                while (wait := self._try(host, entry)) > 0:
+                    self._cond.wait(wait)
+            except BaseException:
+                self._cancel(host, entry)
+                raise
+        return time.monotonic() - start
+
+    async def acquire_async(self, host: str, priority: int | None = None) -> float:
+        # acquire without blocking the event loop
+        start = time.monotonic()
+        with self._cond:
+            if host not in self._buckets:
+                return 0
+            entry = self._enqueue(host, current_priority() if priority is None else priority)
+        try:
+            while True:
+                with self._cond:
+                    wait = self._try(host, entry)
+                if wait == 0:
+                    return time.monotonic() - start
+                await asyncio.sleep(min(wait, 0.05))
+        except BaseException:
+            with self._cond:
+                self._cancel(host, entry)
+            raise
+
+
+_scheduler = RequestScheduler()
+
+def get_scheduler() -> RequestScheduler:
+    return _scheduler
+
+def set_scheduler(scheduler: RequestScheduler | None):
+    # None turns rate limiting off
+    global _scheduler
+    _scheduler = scheduler if scheduler is not None else RequestScheduler(limits={})
+
+def configure(host: str, rate: float | None, burst: float | None = None):
+    """
+    Sets the rate limit for a host on the shared scheduler.
+
+    Parameters:
+        host (str): Hostname, e.g. "statsapi.mlb.com".
+        rate (float | None): Requests per second, None removes the limit.
+        burst (float | None): Requests allowed at once. Default is max(1, rate).
+    """
+    _scheduler.configure(host, rate, burst)
+
+def acquire(host: str, priority: int | None = None) -> float:
+    return _scheduler.acquire(host, priority)
+
+async def acquire_async(host: str, priority: int | None = None) -> float:
+    return await _scheduler.acquire_async(host, priority)
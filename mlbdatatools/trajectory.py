@@ -0,0 +1,119 @@
+"""
+Pitch trajectory metrics derived from the Statcast kinematic fit.
+
+Each pitch carries the constant-acceleration fit of its flight: the position
+(x0, y0, z0) and velocity (vx0, vy0, vz0) when it is y0 (50) feet from home
+plate, and its acceleration (ax, ay, az). Every metric here comes from solving
+that fit for whole columns at once with NumPy, so a season of pitches takes
+well under a second:
+
+    response = mlbfetch.gamefeeds(game_ids, max_workers=8, columnar=True)
+    df = trajectory.add_trajectory_metrics(response.pitches)
+    df.groupby(['pitcher', 'pitch_type'])[['vaa', 'pfx_x', 'pfx_z']].mean()
+
+Units are feet and seconds like the fit, except plate_speed (mph), the
+approach angles (degrees) and pfx_x/pfx_z (inches). Pitches without a fit
+get NaN.
+"""
+from datatypes import EntryList, ColumnEntryList
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+MOUND_Y = 60.5 # pitching rubber to the back of home plate, in feet
+PLATE_Y = 17 / 12 # front of home plate
+MOVEMENT_Y = 40 # movement is measured over the last 40 feet, as pfx_x/pfx_z are
+GRAVITY = 32.174 # ft/s^2
+FT_PER_SEC_TO_MPH = 3600 / 5280
+
+KINEMATIC_COLUMNS = ('x0', 'y0', 'z0', 'vx0', 'vy0', 'vz0', 'ax', 'ay', 'az', 'extension')
+METRIC_COLUMNS = (
+    'release_pos_x', 'release_pos_y', 'release_pos_z',
+    'vx_f', 'vy_f', 'vz_f', 'plate_speed', 'vaa', 'haa',
+    'plate_time', 'pfx_x', 'pfx_z',
+)
+
+
+def _kinematics(pitches) -> 'dict[str, np.ndarray]':
+    # float64 arrays of the fit, NaN where a value is missing. ColumnEntryLists
+    # hand over their arrays, anything else goes through a DataFrame.
+    import numpy as np
+    if isinstance(pitches, ColumnEntryList):
+        return {name: np.asarray(pitches.columns[name], dtype='float64') for name in KINEMATIC_COLUMNS}
+    df = pitches.to_pandas() if hasattr(pitches, 'to_pandas') else pitches
+    return {name: df[name].to_numpy(dtype='float64', na_value=np.nan) for name in KINEMATIC_COLUMNS}
+
+def _vy_at(k: 'dict[str, np.ndarray]', y: 'float | np.ndarray') -> 'np.ndarray':
+    # velocity toward the plate (negative) when the pitch is y feet from it
+    import numpy as np
+    return -np.sqrt(k['vy0'] ** 2 - 2 * k['ay'] * (k['y0'] - y))
+
+def trajectory_metrics(pitches: 'pd.DataFrame | EntryList | ColumnEntryList') -> 'dict[str, np.ndarray]':
+    """
+    Computes trajectory metrics for every pitch.
+
+    Parameters:
+        pitches (pd.DataFrame | EntryList[Pitch] | ColumnEntryList[Pitch]): Pitches with the
+            x0, y0, z0, vx0, vy0, vz0, ax, ay, az and extension columns.
+
+    Returns:
+        dict[str, np.ndarray]: One array per metric, in the order of pitches:
+            - release_pos_x, release_pos_y, release_pos_z: Release point, release_pos_y being
+              60.5 feet minus the extension.
+            - vx_f, vy_f, vz_f: Velocity when the pitch crosses the front of home plate (ft/s).
+            - plate_speed: Speed at the front of home plate (mph).
+            - vaa: Vertical approach angle at the plate (degrees, negative when descending).
+            - haa: Horizontal approach angle at the plate (degrees, positive toward the
+              first base side).
+            - plate_time: Seconds from release to the front of home plate.
+            - pfx_x, pfx_z: Horizontal and vertical movement over the last 40 feet compared to
+              a pitch thrown without spin, with gravity removed from pfx_z (inches).
+    """
+    import numpy as np
+    k = _kinematics(pitches)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # t = 0 at y0. Times at each distance come from the velocity there.
+        release_y = MOUND_Y - k['extension']
+        release_t = (_vy_at(k, release_y) - k['vy0']) / k['ay']
+        vy_f = _vy_at(k, PLATE_Y)
+        plate_t = (vy_f - k['vy0']) / k['ay']
+        vx_f = k['vx0'] + k['ax'] * plate_t
+        vz_f = k['vz0'] + k['az'] * plate_t
+        movement_t = plate_t - (_vy_at(k, MOVEMENT_Y) - k['vy0']) / k['ay']
+        return {
+            'release_pos_x': k['x0'] + k['vx0'] * release_t + 0.5 * k['ax'] * release_t ** 2,
+            'release_pos_y': release_y,
+            'release_pos_z': k['z0'] + k['vz0'] * release_t + 0.5 * k['az'] * release_t ** 2,
+            'vx_f': vx_f,
+            'vy_f': vy_f,
+            'vz_f': vz_f,
+            'plate_speed': np.sqrt(vx_f ** 2 + vy_f ** 2 + vz_f ** 2) * FT_PER_SEC_TO_MPH,
+            'vaa': -np.degrees(np.arctan(vz_f / vy_f)),
+            'haa': -np.degrees(np.arctan(vx_f / vy_f)),
+            'plate_time': plate_t - release_t,
+            'pfx_x': 0.5 * k['ax'] * movement_t ** 2 * 12,
+            'pfx_z': 0.5 * (k['az'] + GRAVITY) * movement_t ** 2 * 12,
+        }
+
+def add_trajectory_metrics(pitches: 'pd.DataFrame | EntryList | ColumnEntryList') -> 'pd.DataFrame':
+    """
+    A DataFrame of pitches with the trajectory_metrics columns added.
+
+    Parameters:
+        pitches (pd.DataFrame | EntryList[Pitch] | ColumnEntryList[Pitch]): The pitches. A
+            DataFrame is not modified.
+
+    Returns:
+        pd.DataFrame: The pitch columns plus the METRIC_COLUMNS.
+    """
+    if hasattr(pitches, 'to_pandas'):
+        df = pitches.to_pandas()
+        metrics = trajectory_metrics(pitches if isinstance(pitches, ColumnEntryList) else df)
+    else:
+        df = pitches.copy(deep=False)
+        metrics = trajectory_metrics(df)
+    for name in METRIC_COLUMNS:
+        df[name] = metrics[name]
+    return df
@@ -1,22 +1,297 @@
 import requests
 import json
-import re
-from bs4 import BeautifulSoup
+import os
+import time
+import hashlib
+import random
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from metrics import RequestEvent
+from urllib.parse import urlsplit
+import metrics
+import ratelimit
 
+# cache lifetimes in seconds, 0 disables caching for a request
+TTL_NONE = 0
+TTL_LIVE = 15 # in progress games
+TTL_SHORT = 60 * 60 # current season rosters, upcoming schedules
+TTL_DAY = 24 * 60 * 60
+TTL_FOREVER = float('inf') # finished games, past schedules, venues
 
-def get_request_json(url: str, params: dict | None = None):
+Ttl = float | Callable[[Any], float]
+
+
+class ResponseCache(ABC):
+    """
+    Interface for response caches used by get_request_json/get_request_text.
+    Values are raw response bodies keyed by cache_key(url, params). Subclasses
+    must implement get, set and clear, or they cannot be instantiated.
+    """
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: float) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+
+class DiskCache(ResponseCache):
+    """
+    Stores response bodies as files in a directory, evicting the least recently
+    used entries once the directory grows past max_bytes.
+
+    Parameters:
+        path (str): Directory to store entries in. Created if it does not exist.
+        max_bytes (int): Size bound for all entries. Default is 1 GB.
+    """
+    def __init__(self, path: str, max_bytes: int = 1024 ** 3):
+        self.path = os.path.expanduser(path)
+        self.max_bytes = max_bytes
+        os.makedirs(self.path, exist_ok=True)
+        self._lock = threading.Lock()
+        self._index: OrderedDict[str, int] | None = None # key -> size, least recently used first
+        self._size = 0
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, key)
+
+    def _load_index(self) -> OrderedDict[str, int]:
+        if self._index is None:
+            entries = []
+            for name in os.listdir(self.path):
+                if name.endswith('.tmp'):
+                    continue
+                try:
+                    st = os.stat(self._file(name))
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, name, st.st_size))
+            entries.sort()
+            self._index = OrderedDict((name, size) for _, name, size in entries)
+            self._size = sum(self._index.values())
+        return self._index
+
+    def _remove(self, key: str) -> None:
+        index = self._load_index()
+        self._size -= index.pop(key, 0)
+        try:
+            os.remove(self._file(key))
+        except FileNotFoundError:
+            pass
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            index = self._load_index()
+            try:
+                with open(self._file(key), 'r', encoding='utf-8') as f:
+                    expires = json.loads(f.readline()).get('expires')
+                    if expires is not None and expires < time.time():
+                        value = None
+                    else:
+                        value = f.read()
+            except (FileNotFoundError, ValueError):
+                self._size -= index.pop(key, 0)
+                return None
+            if value is None:
+                self._remove(key)
+                return None
+            os.utime(self._file(key))
+            if key in index:
+                index.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        expires = None if ttl == TTL_FOREVER else time.time() + ttl
+        data = (json.dumps({'expires': expires}) + '\n' + value).encode('utf-8')
+        with self._lock:
+            index = self._load_index()
+            tmp = self._file(key) + f'.{threading.get_ident()}.tmp'
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, self._file(key))
+            self._size += len(data) - index.pop(key, 0)
+            index[key] = len(data)
+            while self._size > self.max_bytes and len(index) > 1:
+                self._remove(next(iter(index)))
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._load_index()):
+                self._remove(key)
+
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+_timeout: float | tuple[float, float] | None = (5, 30) # (connect, read) seconds
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+def make_session(
+    pool_size: int = 32,
+    max_retries: int = 5,
+    backoff_factor: float = 0.5,
+    backoff_jitter: float = 0.5,
+) -> requests.Session:
+    """
+    Creates a requests Session with keep-alive connection pooling and retries.
+
+    Connection errors are retried by the session itself. 429/5xx responses are
+    retried by get_request_json/get_request_text with the same settings, after
+    waiting for the rate limiter again, so retries never exceed a host's limit
+    and keep their request priority.
+
+    Parameters:
+        pool_size (int): Connections kept open per host, should be at least the number of threads sharing the session.
+        max_retries (int): Retries for connection errors and 429/5xx responses.
+        backoff_factor (float): Exponential backoff base, sleeps backoff_factor * 2 ** (retry - 1) seconds.
+        backoff_jitter (float): Maximum random seconds added to each backoff.
+
+    Returns:
+        requests.Session: A session to pass to set_session.
+    """
+    retry_kwargs = dict(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        allowed_methods=frozenset(['GET']),
+        # no status_forcelist and no Retry-After retries: _get retries those
+        # behind the rate limiter
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+    try:
+        retry = Retry(backoff_jitter=backoff_jitter, **retry_kwargs)
+    except TypeError: # urllib3 < 2 has no jitter support
+        retry = Retry(**retry_kwargs)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def set_session(session: requests.Session | None, timeout: float | tuple[float, float] | None = (5, 30)):
+    # install the session used by every request, None recreates the default on next use
+    global _session, _timeout
+    with _session_lock:
+        _session = session
+        _timeout = timeout
+
+def get_session() -> requests.Session:
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = make_session()
+    return _session
+
+_cache: ResponseCache | None = None
+
+def set_cache(cache: ResponseCache | None):
+    # install a cache used by every request, None disables caching
+    global _cache
+    _cache = cache
+
+def get_cache() -> ResponseCache | None:
+    return _cache
+
+def cache_key(url: str, params: dict | None = None) -> str:
+    params_key = json.dumps(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return hashlib.sha256((url + '?' + params_key).encode('utf-8')).hexdigest()
+
+def cache_lookup(url: str, params: dict | None, ttl: Ttl) -> str | None:
+    # cached body for a request, None on a miss or when the request is not cacheable
+    if _cache is None or not ttl:
+        return None
+    return _cache.get(cache_key(url, params))
+
+def cache_store(url: str, params: dict | None, ttl: Ttl, text: str, value: Any):
+    # store a fetched body with the ttl (a number of seconds, or a function of the decoded response)
+    if _cache is None or not ttl:
+        return
+    seconds = ttl(value) if callable(ttl) else ttl
+    if seconds > 0:
+        _cache.set(cache_key(url, params), text, seconds)
+
+def _retries(r: requests.Response) -> int:
+    retries = getattr(r.raw, 'retries', None)
+    return len(retries.history) if retries is not None else 0
+
+def _retry_delay(retry: Retry, attempt: int, r: requests.Response) -> float:
+    # backoff before retrying a 429/5xx response, at least its Retry-After seconds
+    delay = retry.backoff_factor * 2 ** attempt + random.uniform(0, getattr(retry, 'backoff_jitter', 0))
+    retry_after = r.headers.get('Retry-After', '')
+    return max(delay, int(retry_after)) if retry_after.isdigit() else delay
+
+def _get(url: str, params: dict | None, ttl: Ttl, decode: Callable[[str], Any], endpoint: str | None):
+    instrumented = metrics.enabled()
+    endpoint = endpoint or urlsplit(url).path
+    start = time.perf_counter()
+    cached = cache_lookup(url, params, ttl)
+    if cached is not None:
+        looked_up = time.perf_counter()
+        value = decode(cached)
+        if instrumented:
+            metrics.emit(RequestEvent(
+                endpoint, url, None, looked_up - start, time.perf_counter() - looked_up,
+                len(cached), 0, cache_hit=True
+            ))
+        return value
+    session = get_session()
+    # the session's Retry (see make_session) also sets how often statuses are retried
+    retry = getattr(session.get_adapter(url), 'max_retries', None)
+    max_retries = retry.total if isinstance(retry, Retry) and isinstance(retry.total, int) else 0
+    host = urlsplit(url).hostname
+    queued = 0
+    for attempt in range(max_retries + 1):
+        waited = ratelimit.acquire(host)
+        queued += waited
+        start += waited
+        try:
+            r = session.get(url, params=params, timeout=_timeout)
+        except Exception as e:
+            if instrumented:
+                metrics.emit(RequestEvent(
+                    endpoint, url, None, time.perf_counter() - start, 0, 0, attempt, False,
+                    error=repr(e), queue_time=queued
+                ))
+            raise
+        if r.status_code not in RETRY_STATUSES or attempt == max_retries:
+            break
+        r.close()
+        time.sleep(_retry_delay(retry, attempt, r))
+    retries = attempt + _retries(r)
+    fetched = time.perf_counter()
+    text = r.text
+    try:
+        value = decode(text)
+    except Exception as e:
+        if instrumented:
+            metrics.emit(RequestEvent(
+                endpoint, r.url, r.status_code, fetched - start, time.perf_counter() - fetched,
+                len(r.content), retries, False, error=repr(e), queue_time=queued
+            ))
+        raise
+    if instrumented:
+        metrics.emit(RequestEvent(
+            endpoint, r.url, r.status_code, fetched - start, time.perf_counter() - fetched,
+            len(r.content), retries, False, queue_time=queued
+        ))
+    if r.ok:
+        cache_store(url, params, ttl, text, value)
+    return value
+
+def get_request_json(url: str, params: dict | None = None, ttl: Ttl = TTL_NONE, endpoint: str | None = None):
     # extract json from url
-    if params != None:
-        r = requests.get(url, params=params)
-    else:
-        r = requests.get(url)
-    return r.json()
+    return _get(url, params, ttl, json.loads, endpoint)
 
-def get_request_text(url: str, params: dict | None = None):
+def get_request_text(url: str, params: dict | None = None, ttl: Ttl = TTL_NONE, endpoint: str | None = None):
     # extract a javascript variable from the html
-    if params != None:
-        r = requests.get(url, params=params)
-    else:
-        r = requests.get(url)
-    text = r.text
-    return text
\ No newline at end of file
+    return _get(url, params, ttl, lambda text: text, endpoint)
@@ -0,0 +1,272 @@
+"""
+A local SQLite store for game feeds.
+
+Games and box scores are upserted by their id and pitches by (gameid,
+ab_number, pitch_number), since not every pitch has a play id. Fetching a
+game twice (or a live game every few seconds) never duplicates rows, and
+common filters are answered from indexes instead of reloading DataFrames:
+
+    wh = Warehouse("mlb.sqlite")
+    wh.upsert(mlbfetch.gamefeeds(game_ids, max_workers=8))
+    sliders = wh.pitches(pitcher=669203, pitch_type="SL", season=2024)
+
+Pitches and box scores carry a denormalized game_date column taken from
+their game, so date filters do not need a join.
+"""
+from datatypes import (
+    Entry, EntryList, Game, Pitch, BatterBoxscore, PitcherBoxscore,
+    GamefeedResponse, GamefeedsResponse, LiveUpdate, _field_kinds
+)
+from dataclasses import fields
+from datetime import date
+from typing import Any, Iterable
+import sqlite3
+import threading
+
+TABLES: dict[str, type[Entry]] = {
+    'games': Game,
+    'pitches': Pitch,
+    'batter_boxscores': BatterBoxscore,
+    'pitcher_boxscores': PitcherBoxscore,
+}
+# primary key columns, rows with the same key are replaced on upsert
+KEYS = {
+    'games': ('id',),
+    'pitches': ('gameid', 'ab_number', 'pitch_number'),
+    'batter_boxscores': ('id',),
+    'pitcher_boxscores': ('id',),
+}
+# tables that get a game_date column copied from their game
+DATED_TABLES = ('pitches', 'batter_boxscores', 'pitcher_boxscores')
+INDEXES = {
+    'games': [('game_date',), ('season',)],
+    'pitches': [('pitcher', 'game_date'), ('batter', 'game_date'), ('game_date',)],
+    'batter_boxscores': [('playerid', 'game_date'), ('gameid',), ('game_date',)],
+    'pitcher_boxscores': [('playerid', 'game_date'), ('gameid',), ('game_date',)],
+}
+_SQL_TYPES = {int: 'INTEGER', float: 'REAL', bool: 'INTEGER'}
+# stored as PRAGMA user_version, bumped whenever the tables change
+SCHEMA_VERSION = 1
+
+
+def _sql_value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, date) else value
+
+def _entry_from_row(entry_type: type[Entry], names: list[str], row: tuple) -> Entry:
+    # sqlite returns bools as 0/1, dates stay ISO strings as the parsers produce them
+    values = dict(zip(names, row))
+    for name, kind in _field_kinds(entry_type).items():
+        if kind is bool and values[name] is not None:
+            values[name] = bool(values[name])
+    return entry_type(**{f.name: values[f.name] for f in fields(entry_type)})
+
+
+class Warehouse:
+    """
+    Games, pitches and box scores stored in a SQLite file.
+
+    Parameters:
+        path (str): Database file, created if missing. Default is ":memory:".
+
+    Raises:
+        ValueError: If the file was created with a different version of the tables.
+
+    Connections are shared between threads behind a lock, so a Warehouse can
+    be written by a LiveGame poller and read by request handlers at once.
+    """
+    def __init__(self, path: str = ':memory:'):
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if path != ':memory:':
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._columns: dict[str, list[str]] = {}
+        self._check_version()
+        with self._lock, self._conn:
+            for table, entry_type in TABLES.items():
+                self._create_table(table, entry_type)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _check_version(self):
+        # new files are empty, anything else must have been written with these tables
+        version = self._conn.execute('PRAGMA user_version').fetchone()[0]
+        has_tables = self._conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table'").fetchone()
+        if has_tables and version != SCHEMA_VERSION:
+            self._conn.close()
+            raise ValueError(
+                f"{self.path} has warehouse schema version {version}, expected {SCHEMA_VERSION}. "
+                "Rebuild it from the game feeds."
+            )
+
+    def _create_table(self, table: str, entry_type: type[Entry]):
+        kinds = _field_kinds(entry_type)
+        columns = [f.name for f in fields(entry_type)]
+        keys = KEYS[table]
+        definitions = [
+            f"{name} {_SQL_TYPES.get(kinds[name], 'TEXT')}" + (' NOT NULL' if name in keys else '')
+            for name in columns
+        ]
+        if table in DATED_TABLES:
+            definitions.append('game_date TEXT')
+        definitions.append(f"PRIMARY KEY ({', '.join(keys)})")
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(definitions)})")
+        for index in INDEXES[table]:
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {table}_{'_'.join(index)} ON {table} ({', '.join(index)})"
+            )
+        self._columns[table] = columns
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> 'Warehouse':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # writing
+
+    def upsert_entries(self, table: str, entries: Iterable[Entry], game_dates: dict[int, date] | None = None) -> int:
+        """
+        Inserts entries into a table, replacing rows that have the same key (see KEYS).
+
+        Parameters:
+            table (str): One of "games", "pitches", "batter_boxscores", "pitcher_boxscores".
+            entries (Iterable[Entry]): Entries of the table's type, an EntryList or ColumnEntryList.
+            game_dates (dict[int, date] | None): Game id -> date, fills game_date for the dated tables.
+
+        Returns:
+            int: Number of rows written.
+        """
+        with self._lock, self._conn:
+            return self._write(table, entries, game_dates)
+
+    def _write(self, table: str, entries: Iterable[Entry], game_dates: dict[int, date] | None) -> int:
+        # upsert without committing, callers hold the lock and the transaction
+        columns = self._columns[table]
+        names = columns + ['game_date'] if table in DATED_TABLES else columns
+        if table in DATED_TABLES:
+            game_dates = game_dates or {}
+            rows = [
+                [_sql_value(getattr(e, name)) for name in columns] + [_sql_value(game_dates.get(e.gameid))]
+                for e in entries
+            ]
+        else:
+            rows = [[_sql_value(getattr(e, name)) for name in columns] for e in entries]
+        keys = KEYS[table]
+        updates = ', '.join(f"{name} = excluded.{name}" for name in names if name not in keys)
+        sql = (
+            f"INSERT INTO {table} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))}) "
+            f"ON CONFLICT ({', '.join(keys)}) DO UPDATE SET {updates}"
+        )
+        self._conn.executemany(sql, rows)
+        return len(rows)
+
+    def upsert(self, response: GamefeedResponse | GamefeedsResponse | LiveUpdate) -> dict[str, int]:
+        """
+        Stores the games, pitches and box scores of a gamefeed, gamefeeds or
+        LiveGame.update result in one transaction.
+
+        Returns:
+            dict[str, int]: Rows written per table.
+        """
+        games = list(response.games) if isinstance(response, GamefeedsResponse) else [response.game]
+        game_dates = {g.id: g.game_date for g in games}
+        with self._lock, self._conn:
+            return {
+                'games': self._write('games', games, None),
+                'pitches': self._write('pitches', response.pitches, game_dates),
+                'batter_boxscores': self._write('batter_boxscores', response.batter_boxscores, game_dates),
+                'pitcher_boxscores': self._write('pitcher_boxscores', response.pitcher_boxscores, game_dates),
+            }
+
+    # reading
+
+    def _select(self, table: str, filters: dict[str, Any], season: int | None,
+                start_date: str | date | None, end_date: str | date | None) -> EntryList:
+        if season is not None:
+            start_date = max(str(start_date or ''), f"{season}-01-01")
+            end_date = min(str(end_date or '9999'), f"{season}-12-31")
+        clauses, params = [], []
+        for name, value in filters.items():
+            if value is not None:
+                clauses.append(f"{name} = ?")
+                params.append(value)
+        if start_date is not None:
+            clauses.append("game_date >= ?")
+            params.append(_sql_value(start_date))
+        if end_date is not None:
+            clauses.append("game_date <= ?")
+            params.append(_sql_value(end_date))
+        columns = self._columns[table]
+        sql = f"SELECT {', '.join(columns)} FROM {table}"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        entry_type = TABLES[table]
+        return EntryList(_entry_from_row(entry_type, columns, row) for row in rows)
+
+    def games(self, game_id: int | None = None, season: int | None = None,
+              start_date: str | date | None = None, end_date: str | date | None = None) -> EntryList[Game]:
+        """
+        Stored games, filtered by id, season and an inclusive date range (YYYY-MM-DD).
+        """
+        return self._select('games', {'id': game_id}, season, start_date, end_date)
+
+    def pitches(self, pitcher: int | None = None, batter: int | None = None, gameid: int | None = None,
+                pitch_type: str | None = None, season: int | None = None,
+                start_date: str | date | None = None, end_date: str | date | None = None) -> EntryList[Pitch]:
+        """
+        Stored pitches matching every filter given.
+
+        Parameters:
+            pitcher (int | None): MLB.com ID of the pitcher.
+            batter (int | None): MLB.com ID of the batter.
+            gameid (int | None): MLB.com ID of the game.
+            pitch_type (str | None): Pitch type code, e.g. "SL".
+            season (int | None): Only pitches from games in this season.
+            start_date (str | date | None): Only pitches on or after this date (format: YYYY-MM-DD).
+            end_date (str | date | None): Only pitches on or before this date (format: YYYY-MM-DD).
+
+        Returns:
+            EntryList[Pitch]: The matching pitches.
+        """
+        filters = {'pitcher': pitcher, 'batter': batter, 'gameid': gameid, 'pitch_type': pitch_type}
+        return self._select('pitches', filters, season, start_date, end_date)
+
+    def batter_boxscores(self, playerid: int | None = None, gameid: int | None = None, season: int | None = None,
+                         start_date: str | date | None = None, end_date: str | date | None = None) -> EntryList[BatterBoxscore]:
+        """
+        Stored batter box scores, filtered like pitches.
+        """
+        return self._select('batter_boxscores', {'playerid': playerid, 'gameid': gameid}, season, start_date, end_date)
+
+    def pitcher_boxscores(self, playerid: int | None = None, gameid: int | None = None, season: int | None = None,
+                          start_date: str | date | None = None, end_date: str | date | None = None) -> EntryList[PitcherBoxscore]:
+        """
+        Stored pitcher box scores, filtered like pitches.
+        """
+        return self._select('pitcher_boxscores', {'playerid': playerid, 'gameid': gameid}, season, start_date, end_date)
+
+    def game_ids(self, final_only: bool = False) -> set[int]:
+        # ids of stored games, e.g. to skip finished games when backfilling
+        sql = "SELECT id FROM games" + (" WHERE status_code LIKE 'F%'" if final_only else "")
+        with self._lock:
+            return {row[0] for row in self._conn.execute(sql)}
+
+    def query(self, sql: str, params: tuple | dict = ()):
+        """
+        Runs a SQL query against the warehouse.
+
+        Returns:
+            pd.DataFrame: The result rows.
+        """
+        import pandas as pd
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            columns = [c[0] for c in cursor.description]
+            return pd.DataFrame(cursor.fetchall(), columns=columns)
@@ -10,6 +10,11 @@ setup(
     description='DataFrames, type-safety, and plotting for modern baseball analytics.',
     author='Joey Sinclair',
     install_requires=['pandas', 'numpy', 'matplotlib', 'requests'],
+    extras_require={
+        'aio': ['aiohttp'],
+        'parquet': ['pyarrow'],
+        'polars': ['polars'],
+    },
     long_description=(Path(__file__).parent / "README.md").read_text(),
     long_description_content_type="text/markdown",
 )
\ No newline at end of file
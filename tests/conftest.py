@@ -0,0 +1,80 @@
+import gzip
+import json
+import os
+import sys
+
+import pytest
+import requests
+
+# the package modules import each other as top level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'mlbdatatools'))
+
+RECORDED = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'benchmarks', 'fixtures')
+
+
+def recorded_text(url: str) -> str:
+    # a response body from the recorded benchmark fixtures
+    with open(os.path.join(RECORDED, 'manifest.json')) as f:
+        name = json.load(f)['urls'][url]
+    with gzip.open(os.path.join(RECORDED, name), 'rt') as f:
+        return f.read()
+
+@pytest.fixture
+def recorded_feeds() -> dict:
+    # game id -> recorded statsapi game feed
+    import mlbfetch
+    with open(os.path.join(RECORDED, 'manifest.json')) as f:
+        game_ids = json.load(f)['games']
+    return {
+        game_id: json.loads(recorded_text(mlbfetch._gamefeed_request(game_id)[0]))
+        for game_id in game_ids
+    }
+
+class RecordedAdapter(requests.adapters.BaseAdapter):
+    # answers requests from responses (url -> body), then the recorded
+    # benchmark fixtures, 404 for anything else
+    def __init__(self):
+        super().__init__()
+        with open(os.path.join(RECORDED, 'manifest.json')) as f:
+            self.urls = json.load(f)['urls']
+        self.responses: dict[str, str] = {}
+        self.requested = []
+
+    def send(self, request, **kwargs):
+        self.requested.append(request.url)
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        response.encoding = 'utf-8'
+        if request.url in self.responses:
+            response.status_code = 200
+            response._content = self.responses[request.url].encode('utf-8')
+        elif request.url in self.urls:
+            response.status_code = 200
+            response._content = recorded_text(request.url).encode('utf-8')
+        else:
+            response.status_code = 404
+            response._content = b'Not Found'
+        return response
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def recorded_session():
+    # every request is answered from the recorded fixtures, without caching or rate limits
+    import ratelimit
+    import utils
+    adapter = RecordedAdapter()
+    session = requests.Session()
+    session.mount('https://', adapter)
+    cache, scheduler = utils.get_cache(), ratelimit.get_scheduler()
+    utils.set_session(session)
+    utils.set_cache(None)
+    ratelimit.set_scheduler(None)
+    try:
+        yield adapter
+    finally:
+        utils.set_session(None)
+        utils.set_cache(cache)
+        ratelimit.set_scheduler(scheduler)
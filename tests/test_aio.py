@@ -0,0 +1,141 @@
+import asyncio
+import json
+import threading
+
+import pytest
+import requests
+
+import aio
+import mlbfetch
+import ratelimit
+import utils
+from conftest import RecordedAdapter, recorded_text
+from utils import DiskCache
+
+
+class FakeResponse:
+    def __init__(self, url, status, body, headers):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    def get_encoding(self) -> str:
+        return 'utf-8'
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+class FakeSession:
+    # stands in for aiohttp.ClientSession: answers from the recorded fixtures,
+    # after the scripted (status, Retry-After) responses
+    closed = False
+
+    def __init__(self, statuses=()):
+        self.urls = RecordedAdapter().urls
+        self.statuses = list(statuses)
+        self.requested = []
+
+    def get(self, url, params=None):
+        url = requests.Request('GET', url, params=params).prepare().url
+        self.requested.append(url)
+        if self.statuses:
+            status, retry_after = self.statuses.pop(0)
+            return FakeResponse(url, status, b'{}', {'Retry-After': retry_after})
+        if url in self.urls:
+            return FakeResponse(url, 200, recorded_text(url).encode('utf-8'), {})
+        return FakeResponse(url, 404, b'Not Found', {})
+
+def run(coro_func, session: FakeSession):
+    # run with session installed as the shared aiohttp session of the loop
+    async def main():
+        aio._session, aio._session_loop = session, asyncio.get_running_loop()
+        try:
+            return await coro_func()
+        finally:
+            aio._session, aio._session_loop = None, None
+    return asyncio.run(main())
+
+@pytest.fixture(autouse=True)
+def no_limits(monkeypatch):
+    acquired = []
+    async def acquire_async(host, priority=None):
+        acquired.append(host)
+        return 0
+    monkeypatch.setattr(ratelimit, 'acquire_async', acquire_async)
+    aio.configure(backoff_factor=0, backoff_jitter=0)
+    cache = utils.get_cache()
+    utils.set_cache(None)
+    yield acquired
+    aio.configure()
+    utils.set_cache(cache)
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list:
+    sleeps = []
+    real_sleep = asyncio.sleep
+    async def sleep(delay, *args):
+        sleeps.append(delay)
+        await real_sleep(0)
+    monkeypatch.setattr(asyncio, 'sleep', sleep)
+    return sleeps
+
+def test_gamefeed_matches_the_blocking_parse(recorded_feeds):
+    game_id, feed = next(iter(recorded_feeds.items()))
+    response = run(lambda: aio.gamefeed(game_id), FakeSession())
+    assert response == mlbfetch._parse_gamefeed(feed, game_id)
+
+def test_gamefeeds_reports_failed_games(recorded_feeds):
+    game_ids = list(recorded_feeds)
+    response = run(lambda: aio.gamefeeds(game_ids + [1]), FakeSession())
+    assert [g.id for g in response.games] == game_ids
+    assert list(response.errors) == [1]
+
+def test_schedule():
+    session = FakeSession()
+    games = run(lambda: aio.schedule('2024-03-28', '2024-03-29'), session)
+    assert len(games) > 0
+    assert games == mlbfetch._parse_schedule(json.loads(recorded_text(session.requested[0])))
+
+def test_statuses_are_retried_after_retry_after(no_limits, sleeps, recorded_feeds):
+    game_id = next(iter(recorded_feeds))
+    session = FakeSession([(503, ''), (429, '3')])
+    response = run(lambda: aio.gamefeed(game_id), session)
+    assert response.game.id == game_id
+    assert len(session.requested) == 3
+    # every attempt waits for the rate limiter, and a Retry-After is honoured
+    assert no_limits == ['statsapi.mlb.com'] * 3
+    assert sleeps == [0, 3]
+
+def test_last_status_is_returned_when_retries_run_out(sleeps):
+    aio.configure(max_retries=1, backoff_factor=0, backoff_jitter=0)
+    session = FakeSession([(503, '')] * 3)
+    assert run(lambda: aio.get_request_json('https://statsapi.mlb.com/api/v1/teams'), session) == {}
+    assert len(session.requested) == 2
+
+def test_cache_hits_skip_the_network(tmp_path, recorded_feeds, monkeypatch):
+    utils.set_cache(DiskCache(str(tmp_path / 'cache')))
+    threads = []
+    lookup, store = aio.cache_lookup, aio.cache_store
+    monkeypatch.setattr(aio, 'cache_lookup', lambda *args: threads.append(threading.current_thread()) or lookup(*args))
+    monkeypatch.setattr(aio, 'cache_store', lambda *args: threads.append(threading.current_thread()) or store(*args))
+    game_id = next(iter(recorded_feeds))
+    session = FakeSession()
+    first = run(lambda: aio.gamefeed(game_id), session)
+    second = run(lambda: aio.gamefeed(game_id), session)
+    assert first == second
+    assert len(session.requested) == 1
+    # lookup, store, lookup, all off the event loop's thread
+    assert len(threads) == 3
+    assert threading.main_thread() not in threads
+
+def test_savant_batter_pages_are_keyed_by_player():
+    response = run(lambda: aio.savant_batter_pages([1, 660271]), FakeSession())
+    assert list(response.pages) == [660271]
+    assert list(response.errors) == [1]
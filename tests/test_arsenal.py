@@ -0,0 +1,81 @@
+import pandas as pd
+import pytest
+
+import arsenal
+import mlbfetch
+from arsenal import ArsenalAggregator
+
+
+@pytest.fixture
+def responses(recorded_feeds) -> list:
+    return [mlbfetch._parse_gamefeed(feed, game_id) for game_id, feed in recorded_feeds.items()]
+
+def summary(aggregator: ArsenalAggregator) -> pd.DataFrame:
+    return aggregator.to_pandas().sort_values(['pitcher', 'pitch_type'], ignore_index=True)
+
+def test_update_counts_each_final_game_once(responses):
+    aggregator = ArsenalAggregator()
+    assert aggregator.update(responses[0])
+    assert not aggregator.update(responses[0])
+    assert aggregator.games == {responses[0].game.id}
+    df = summary(aggregator)
+    assert df['pitches'].sum() == len(responses[0].pitches)
+    assert df.groupby('pitcher')['usage'].sum().tolist() == pytest.approx([1] * df['pitcher'].nunique())
+
+def test_games_in_progress_are_skipped(responses):
+    response = responses[0]
+    response.game.status_code = 'I'
+    aggregator = ArsenalAggregator()
+    assert not aggregator.update(response)
+    assert len(aggregator) == 0
+
+def test_summary_matches_pitches(responses):
+    aggregator = ArsenalAggregator()
+    for response in responses:
+        aggregator.update(response)
+    pitches = pd.concat([r.pitches.to_pandas() for r in responses], ignore_index=True)
+    pitches['pitch_type'] = pitches['pitch_type'].astype(object)
+    expected = pitches.groupby(['pitcher', 'pitch_type'])['start_speed'].agg(['count', 'mean', 'std']).reset_index()
+    df = summary(aggregator)
+    assert df['pitches'].tolist() == expected['count'].tolist()
+    assert df['start_speed_mean'].tolist() == pytest.approx(expected['mean'].tolist())
+    assert df['start_speed_std'].tolist() == pytest.approx(expected['std'].tolist())
+    whiffs = pitches['call'].isin(arsenal.WHIFF_CALLS).sum()
+    swings = pitches['call'].isin(arsenal.SWING_CALLS).sum()
+    assert (df['whiff_rate'] * df['swing_rate'] * df['pitches']).sum() == pytest.approx(whiffs)
+    assert (df['swing_rate'] * df['pitches']).sum() == pytest.approx(swings)
+
+def test_merge_matches_a_single_aggregator(responses):
+    single, first, second = ArsenalAggregator(), ArsenalAggregator(), ArsenalAggregator()
+    for response in responses:
+        single.update(response)
+    first.update(responses[0])
+    for response in responses[1:]:
+        second.update(response)
+    assert first.merge(second) is first
+    assert first.games == single.games
+    pd.testing.assert_frame_equal(summary(first), summary(single))
+    with pytest.raises(ValueError):
+        first.merge(second)
+
+def test_save_load_round_trip(responses, tmp_path):
+    aggregator = ArsenalAggregator()
+    for response in responses:
+        aggregator.update(response)
+    path = str(tmp_path / 'arsenal.json')
+    aggregator.save(path)
+    loaded = ArsenalAggregator.load(path)
+    assert loaded.games == aggregator.games
+    pd.testing.assert_frame_equal(summary(loaded), summary(aggregator))
+    # games saved with the aggregator are not counted again
+    assert not loaded.update(responses[0])
+
+def test_load_rejects_other_versions(tmp_path):
+    path = str(tmp_path / 'arsenal.json')
+    ArsenalAggregator().save(path)
+    with open(path) as f:
+        text = f.read()
+    with open(path, 'w') as f:
+        f.write(text.replace(f'"version": {arsenal.FORMAT_VERSION}', '"version": 0'))
+    with pytest.raises(ValueError):
+        ArsenalAggregator.load(path)
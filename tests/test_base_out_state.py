@@ -0,0 +1,48 @@
+import mlbfetch
+
+
+def pitch(outs, **extra):
+    return {'isPitch': True, 'count': {'balls': 0, 'strikes': 0, 'outs': outs}, **extra}
+
+def play(index, inning, half, events, runners=(), outs=None):
+    return {
+        'atBatIndex': index,
+        'about': {'inning': inning, 'halfInning': half},
+        'matchup': {'batter': {'id': 100 + index}, 'pitcher': {'id': 500}},
+        'result': {'event': 'Out'},
+        'runners': list(runners),
+        'playEvents': events,
+        'count': {'outs': outs if outs is not None else events[-1]['count']['outs']},
+    }
+
+def runner(origin, start, end, play_index):
+    return {'movement': {'originBase': origin, 'start': start, 'end': end}, 'details': {'playIndex': play_index}}
+
+PLAYS = [
+    # groundout on the second pitch
+    play(0, 1, 'top', [pitch(0), pitch(1)]),
+    # single on the first pitch
+    play(1, 1, 'top', [pitch(1)], [runner(None, None, '1B', 0)]),
+    # steal of second between pitches, then a strikeout
+    play(2, 1, 'top', [
+        pitch(1),
+        {'isPitch': False, 'count': {'outs': 1}},
+        pitch(1),
+        pitch(2),
+    ], [runner('1B', '1B', '2B', 1), runner(None, None, None, 3)]),
+    # third out on the first pitch
+    play(3, 1, 'top', [pitch(3)], [runner(None, None, None, 0)]),
+    play(4, 1, 'bottom', [pitch(0)]),
+]
+
+def test_base_out_state_is_before_the_pitch():
+    game = mlbfetch._parse_gamefeed_game({})
+    pitches = mlbfetch._parse_gamefeed_pitches(PLAYS, game, 1)
+    assert [p.base_out_state for p in pitches] == [0, 0, 8, 9, 10, 10, 18, 0]
+
+def test_base_out_state_range():
+    game = mlbfetch._parse_gamefeed_game({})
+    states = [p.base_out_state for p in mlbfetch._parse_gamefeed_pitches(PLAYS, game, 1)]
+    assert all(0 <= s <= 23 for s in states)
+    # the third out pitch keeps its post-pitch count
+    assert max(p.outs for p in mlbfetch._parse_gamefeed_pitches(PLAYS, game, 1)) == 3
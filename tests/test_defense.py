@@ -0,0 +1,103 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+import requests
+
+import defense
+import mlbfetch
+
+PLAYS = os.path.join(os.path.dirname(__file__), 'fixtures', 'oaa_plays.json')
+
+
+def full_url(request) -> str:
+    url, params, _ = request
+    return requests.Request('GET', url, params=params).prepare().url
+
+@pytest.fixture
+def raw_plays() -> list[dict]:
+    # savant oaa-data rows for three fielders over 2023 and 2024
+    with open(PLAYS) as f:
+        return json.load(f)
+
+@pytest.fixture
+def served_plays(recorded_session, raw_plays):
+    # one response per fielder and season, as defense_plays_batch requests them
+    pairs = {(int(p['target_mlb_id']), int(p['year'])) for p in raw_plays}
+    for e_id, year in pairs:
+        rows = [p for p in raw_plays if (int(p['target_mlb_id']), int(p['year'])) == (e_id, year)]
+        recorded_session.responses[full_url(mlbfetch._defense_plays_request(e_id, year, year))] = json.dumps(rows)
+    return recorded_session
+
+@pytest.fixture
+def expected_plays(raw_plays) -> pd.DataFrame:
+    # the plays worked out straight from the savant rows
+    return pd.DataFrame({
+        'fielder_id': [int(p['target_mlb_id']) for p in raw_plays],
+        'fielder_name': [p['name_fielder'] for p in raw_plays],
+        'fielder_team_id': [int(p['fld_team_id']) for p in raw_plays],
+        'fielder_position': [int(p['target_id']) for p in raw_plays],
+        'year': [int(p['year']) for p in raw_plays],
+        'month': [int(p['api_game_date_month_mm']) for p in raw_plays],
+        'est_success': [float(p['adj_estimated_success_rate']) for p in raw_plays],
+        'outs_above_avg': [float(p['outs_above_average']) for p in raw_plays],
+        'runs_prevented': [float(p['fielding_runs_prevented']) for p in raw_plays],
+        'is_out': [p['is_hit_into_play_field_out'] == '1' for p in raw_plays],
+    })
+
+def hand_rollup(plays: pd.DataFrame, keys: list[str]) -> dict[tuple, dict]:
+    # rollup of plays computed group by group
+    rollup = {}
+    for key, group in plays.groupby(keys):
+        outs = int(group['is_out'].sum())
+        est_success = group['est_success'].mean()
+        rollup[tuple(key)] = {
+            'plays': len(group),
+            'outs': outs,
+            'outs_above_avg': group['outs_above_avg'].sum(),
+            'runs_prevented': group['runs_prevented'].sum(),
+            'est_success': est_success,
+            'success_above_est': outs / len(group) - est_success,
+        }
+    return rollup
+
+def test_defense_plays_batch_fetches_repeated_ids_once(served_plays, raw_plays):
+    ids = [665742, 677951, 665742, 621566, 677951]
+    response = mlbfetch.defense_plays_batch(ids, 2023, 2024, max_workers=2)
+    assert response.errors == {}
+    assert len(served_plays.requested) == 6
+    assert len(set(served_plays.requested)) == 6
+    # plays come back in order of fielder then year
+    order = [665742, 677951, 621566]
+    by_pair = sorted(raw_plays, key=lambda p: (order.index(int(p['target_mlb_id'])), p['year']))
+    assert response.plays.to_pandas()['fielder_id'].tolist() == [int(p['target_mlb_id']) for p in by_pair]
+
+def test_defense_plays_batch_records_errors(served_plays):
+    response = mlbfetch.defense_plays_batch([665742, 1], 2024, max_workers=2, columnar=False)
+    assert set(response.errors) == {(1, 2024)}
+    assert {p.fielder_id for p in response.plays} == {'665742'}
+
+@pytest.mark.parametrize('by, keys', [
+    ('fielder', ['fielder_id', 'fielder_name']),
+    ('position', ['fielder_position']),
+    ('team', ['fielder_team_id']),
+    ('year', ['year']),
+    ('month', ['year', 'month']),
+    (['team', 'month'], ['fielder_team_id', 'year', 'month']),
+    (['fielder', 'year'], ['fielder_id', 'fielder_name', 'year']),
+])
+@pytest.mark.parametrize('columnar', [True, False])
+def test_oaa_rollup_matches_groupby(served_plays, expected_plays, by, keys, columnar):
+    plays = mlbfetch.defense_plays_batch([665742, 677951, 621566], 2023, 2024, columnar=columnar).plays
+    df = defense.oaa_rollup(plays, by=by)
+    expected = hand_rollup(expected_plays, keys)
+    assert list(df.columns) == keys + ['plays', 'outs', 'outs_above_avg', 'runs_prevented', 'est_success', 'success_above_est']
+    assert len(df) == len(expected)
+    assert df['outs_above_avg'].is_monotonic_decreasing
+    for row in df.to_dict('records'):
+        want = expected[tuple(row[k] for k in keys)]
+        assert row['plays'] == want['plays']
+        assert row['outs'] == want['outs']
+        for column in ('outs_above_avg', 'runs_prevented', 'est_success', 'success_above_est'):
+            assert row[column] == pytest.approx(want[column])
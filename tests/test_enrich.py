@@ -0,0 +1,111 @@
+import asyncio
+import json
+import os
+
+import pandas as pd
+import pytest
+import requests
+
+import aio
+import enrich
+import mlbfetch
+from datatypes import BatterBoxscore, ColumnEntryList, EntryList, Venue
+
+REFERENCE = os.path.join(os.path.dirname(__file__), 'fixtures', 'reference_2024.json')
+
+
+def full_url(request) -> str:
+    url, params, _ = request
+    return requests.Request('GET', url, params=params).prepare().url
+
+@pytest.fixture
+def reference() -> dict:
+    with open(REFERENCE) as f:
+        return json.load(f)
+
+@pytest.fixture
+def served_reference(recorded_session, reference):
+    # players and teams of 2024 recorded from statsapi, some ids left out
+    recorded_session.responses[full_url(mlbfetch._players_request(1, 2024))] = json.dumps(reference['players'])
+    recorded_session.responses[full_url(mlbfetch._teams_request(2024))] = json.dumps(reference['teams'])
+    mlbfetch.clear_reference_cache()
+    yield recorded_session
+    mlbfetch.clear_reference_cache()
+
+@pytest.fixture
+def responses(recorded_feeds) -> list:
+    return [mlbfetch._parse_gamefeed(feed, game_id) for game_id, feed in recorded_feeds.items()]
+
+def values(column: pd.Series) -> list:
+    # None for missing values, whatever the dtype
+    return [None if pd.isna(v) else v for v in column]
+
+def names(reference) -> dict[int, str]:
+    return {p['id']: p['fullName'] for p in reference['players']['people']}
+
+def test_enrich_pitches(served_reference, reference, responses):
+    pitches = EntryList(p for r in responses for p in r.pitches)
+    df = enrich.enrich_pitches(pitches, season=2024)
+    original = pitches.to_pandas()
+    # one row per pitch, in the order given
+    assert len(df) == len(original)
+    assert df[['gameid', 'ab_number', 'pitch_number']].equals(original[['gameid', 'ab_number', 'pitch_number']])
+    expected = original['pitcher'].map(names(reference))
+    assert df['pitcher_full_name'].tolist() == expected.tolist()
+    missing = df['batter'].isin(reference['missing_players'])
+    assert missing.any()
+    assert df.loc[missing, 'batter_full_name'].isna().all()
+    assert df.loc[~missing, 'batter_full_name'].notna().all()
+    bat_sides = {p['id']: p['batSide']['code'] for p in reference['players']['people']}
+    assert values(df['batter_bat_side']) == [bat_sides.get(b) for b in original['batter']]
+    unknown_team = df['team_batting_id'].isin(reference['missing_teams'])
+    assert unknown_team.any()
+    assert df.loc[unknown_team, 'team_batting_abbreviation'].isna().all()
+    assert df.loc[~unknown_team, 'team_batting_abbreviation'].notna().all()
+
+def test_reference_data_is_fetched_once(served_reference, responses):
+    enrich.enrich_pitches(responses[0].pitches, season=2024)
+    enrich.enrich_boxscores(responses[1].batter_boxscores, season=2024)
+    reference_requests = [url for url in served_reference.requested if '/feed/live' not in url]
+    assert len(reference_requests) == 2
+    # the async API shares the cache, so it makes no request at all
+    players = asyncio.run(aio.players(season=2024))
+    assert players == mlbfetch.players(season=2024)
+    assert len([url for url in served_reference.requested if '/feed/live' not in url]) == 2
+
+@pytest.mark.parametrize('as_table', [
+    lambda boxscores: boxscores,
+    lambda boxscores: ColumnEntryList.from_entries(BatterBoxscore, boxscores),
+    lambda boxscores: boxscores.to_pandas(),
+])
+def test_enrich_boxscores(served_reference, reference, responses, as_table):
+    boxscores = EntryList(b for r in responses for b in r.batter_boxscores)
+    table = as_table(boxscores)
+    df = enrich.enrich_boxscores(table, season=2024)
+    assert df['id'].tolist() == [b.id for b in boxscores]
+    assert values(df['player_full_name']) == [names(reference).get(b.playerid) for b in boxscores]
+    if isinstance(table, pd.DataFrame):
+        assert 'player_full_name' not in table.columns
+
+def test_enrich_with_games_adds_venues(served_reference, responses):
+    games = EntryList(r.game for r in responses)
+    venues = EntryList(
+        Venue(id=venue_id, name=f'Park {venue_id}', turf_type='Grass', roof_type='Open', left_line=330, left=None,
+              left_center=375, center=400, right_center=375, right=None, right_line=330, azimuth_ange=None, elevation=100)
+        for venue_id in {g.venue_id for g in games[1:]} - {games[0].venue_id}
+    )
+    pitches = EntryList(p for r in responses for p in r.pitches)
+    df = enrich.enrich_pitches(pitches, season=2024, games=games, venues=venues)
+    assert len(df) == len(pitches)
+    assert df['game_date'].notna().all()
+    first_game = df['gameid'] == games[0].id
+    # the first game's venue is not in the reference
+    assert df.loc[first_game, 'venue_name'].isna().all()
+    assert (df.loc[~first_game, 'venue_center'] == 400).all()
+
+def test_join_reference_keeps_rows():
+    df = pd.DataFrame({'key': [3, 1, 3, 99, None]})
+    reference = pd.DataFrame({'name': ['one', 'three']}, index=[1, 3])
+    enrich.join_reference(df, 'key', reference, ('name',), 'ref_')
+    assert df['ref_name'].tolist()[:3] == ['three', 'one', 'three']
+    assert df['ref_name'][3:].isna().all()
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+
+from datatypes import Entry, EntryList
+
+
+@dataclass
+class Row(Entry):
+    id: int
+    team: str
+
+
+def rows(*teams) -> EntryList:
+    return EntryList(Row(i, team) for i, team in enumerate(teams))
+
+def test_append_is_the_list_method():
+    assert EntryList.append is list.append
+    assert EntryList.extend is list.extend
+
+def test_indexes_follow_appends():
+    entries = rows('NYY', 'BOS')
+    assert [r.id for r in entries.group('team', 'NYY')] == [0]
+    entries.append(Row(2, 'NYY'))
+    assert [r.id for r in entries.group('team', 'NYY')] == [0, 2]
+    entries.extend([Row(3, 'TOR')])
+    entries += [Row(4, 'BOS')]
+    assert entries.lookup('team', 'TOR').id == 3
+    assert [r.id for r in entries.group('team', 'BOS')] == [1, 4]
+
+def test_indexes_follow_same_length_mutations():
+    entries = rows('NYY', 'BOS', 'TOR')
+    assert entries.lookup('team', 'NYY').id == 0
+    entries[0] = Row(5, 'TB')
+    assert entries.lookup('team', 'NYY') is None
+    assert entries.lookup('team', 'TB').id == 5
+    entries.reverse()
+    assert [r.id for r in entries.groups('team')['TB']] == [5]
+    assert list(entries.groups('team')) == ['TOR', 'BOS', 'TB']
+    entries.pop()
+    entries.append(Row(6, 'NYY'))
+    assert entries.lookup('team', 'TB') is None
+    assert entries.lookup('team', 'NYY').id == 6
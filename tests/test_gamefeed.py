@@ -0,0 +1,80 @@
+import time
+
+import pandas as pd
+import pytest
+
+import mlbfetch
+from datatypes import ColumnEntryList, EntryList
+
+TABLES = ('games', 'pitches', 'batter_boxscores', 'pitcher_boxscores')
+
+
+@pytest.fixture
+def game_ids(recorded_feeds) -> list[int]:
+    return list(recorded_feeds)
+
+def test_gamefeed(recorded_session, recorded_feeds):
+    game_id, feed = next(iter(recorded_feeds.items()))
+    response = mlbfetch.gamefeed(game_id)
+    assert response.game.id == game_id
+    assert isinstance(response.pitches, EntryList)
+    assert len(response.pitches) == sum(
+        1 for play in feed['liveData']['plays']['allPlays'] for event in play['playEvents'] if event.get('isPitch')
+    )
+    assert {p.gameid for p in response.pitches} == {game_id}
+
+@pytest.mark.parametrize('processes', [None, 1])
+def test_row_and_columnar_parses_are_equal(recorded_session, game_ids, processes):
+    rows = mlbfetch.gamefeeds(game_ids, max_workers=2)
+    columns = mlbfetch.gamefeeds(game_ids, max_workers=2, columnar=True, processes=processes)
+    assert not rows.errors and not columns.errors
+    for table in TABLES:
+        assert isinstance(getattr(columns, table), ColumnEntryList)
+        pd.testing.assert_frame_equal(getattr(rows, table).to_pandas(), getattr(columns, table).to_pandas())
+        assert getattr(rows, table).to_polars().equals(getattr(columns, table).to_polars())
+    assert [g.id for g in rows.games] == game_ids
+
+def test_failed_games_are_reported(recorded_session, game_ids):
+    response = mlbfetch.gamefeeds(game_ids + [1], columnar=True)
+    assert list(response.errors) == [1]
+    assert [g.id for g in response.games] == game_ids
+
+def slow_first_game(adapter, game_id, seconds=0.2):
+    # the first game's feed arrives last
+    send = adapter.send
+    def delayed(request, **kwargs):
+        if f'/game/{game_id}/' in request.url:
+            time.sleep(seconds)
+        return send(request, **kwargs)
+    adapter.send = delayed
+
+def test_iter_gamefeeds_in_input_order(recorded_session, game_ids):
+    slow_first_game(recorded_session, game_ids[0])
+    errors = []
+    ids = game_ids + [1] + game_ids[::-1]
+    responses = mlbfetch.iter_gamefeeds(ids, max_workers=3, ordered=True, on_error=lambda g_id, e: errors.append(g_id))
+    assert [r.game.id for r in responses] == game_ids + game_ids[::-1]
+    assert errors == [1]
+
+def test_iter_gamefeeds_as_completed(recorded_session, game_ids):
+    slow_first_game(recorded_session, game_ids[0])
+    responses = list(mlbfetch.iter_gamefeeds(game_ids, max_workers=3))
+    assert sorted(r.game.id for r in responses) == sorted(game_ids)
+    assert responses[-1].game.id == game_ids[0]
+
+def test_iter_gamefeeds_raises_without_on_error(recorded_session, game_ids):
+    stream = mlbfetch.iter_gamefeeds([game_ids[0], 1, game_ids[1]], ordered=True)
+    assert next(stream).game.id == game_ids[0]
+    with pytest.raises(ValueError):
+        next(stream)
+
+@pytest.mark.parametrize('processes', [None, 1])
+def test_iter_gamefeed_batches(recorded_session, game_ids, processes):
+    ids = game_ids + [1] + game_ids[:1]
+    batches = list(mlbfetch.iter_gamefeed_batches(ids, batch_size=2, max_workers=2, processes=processes))
+    assert [len(b.games) + len(b.errors) for b in batches] == [2, 2, 1]
+    assert sorted(g for b in batches for g in b.errors) == [1]
+    assert sorted(g.id for b in batches for g in b.games) == sorted(game_ids + game_ids[:1])
+    for batch in batches:
+        assert isinstance(batch.pitches, ColumnEntryList)
+        assert set(batch.pitches.to_pandas()['gameid']) == {g.id for g in batch.games}
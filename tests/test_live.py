@@ -0,0 +1,158 @@
+import copy
+import json
+import os
+
+import pytest
+
+import live
+import mlbfetch
+from live import LiveGame, PatchError, apply_patch
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'live_replay.json')
+
+
+@pytest.fixture
+def replay():
+    with open(FIXTURE) as f:
+        return json.load(f)
+
+
+class ReplayServer:
+    # answers LiveGame's requests from a recorded sequence of feeds and diffPatch responses
+    def __init__(self, full_feeds: list, diffs: list):
+        self.full_feeds = list(full_feeds)
+        self.diffs = list(diffs)
+        self.requests = []
+
+    def get_request_json(self, url, params=None, ttl=0, endpoint=None):
+        self.requests.append((endpoint, params))
+        if url.endswith('/diffPatch'):
+            return copy.deepcopy(self.diffs.pop(0))
+        return copy.deepcopy(self.full_feeds.pop(0))
+
+
+def serve(monkeypatch, full_feeds, diffs) -> ReplayServer:
+    server = ReplayServer(full_feeds, diffs)
+    monkeypatch.setattr(live, 'get_request_json', server.get_request_json)
+    return server
+
+def keys(pitches) -> set:
+    return {(p.ab_number, p.pitch_number) for p in pitches}
+
+def parsed_pitches(feed, game_id) -> dict:
+    return {(p.ab_number, p.pitch_number): p for p in mlbfetch._parse_gamefeed(copy.deepcopy(feed), game_id).pitches}
+
+
+def test_apply_patch_object_paths():
+    doc = {'a': {'b': 1, 'c': 2}}
+    patched = apply_patch(doc, [
+        {'op': 'add', 'path': '/a/d', 'value': {'e': 3}},
+        {'op': 'replace', 'path': '/a/b', 'value': 10},
+        {'op': 'remove', 'path': '/a/c'},
+        {'op': 'add', 'path': '/x~1y', 'value': 'slash'},
+        {'op': 'move', 'from': '/a/d/e', 'path': '/e'},
+        {'op': 'copy', 'from': '/a/b', 'path': '/b'},
+        {'op': 'test', 'path': '/b', 'value': 10},
+    ])
+    assert patched is doc
+    assert doc == {'a': {'b': 10, 'd': {}}, 'x/y': 'slash', 'e': 3, 'b': 10}
+
+def test_apply_patch_array_paths():
+    doc = {'plays': [{'n': 0}, {'n': 1}]}
+    apply_patch(doc, [
+        {'op': 'add', 'path': '/plays/-', 'value': {'n': 2}},
+        {'op': 'add', 'path': '/plays/1', 'value': {'n': 'inserted'}},
+        {'op': 'replace', 'path': '/plays/0/n', 'value': 'first'},
+        {'op': 'remove', 'path': '/plays/2'},
+    ])
+    assert doc == {'plays': [{'n': 'first'}, {'n': 'inserted'}, {'n': 2}]}
+
+def test_apply_patch_replaces_root():
+    assert apply_patch({'a': 1}, [{'op': 'replace', 'path': '', 'value': [1]}]) == [1]
+
+@pytest.mark.parametrize('operation', [
+    {'op': 'replace', 'path': '/missing', 'value': 1},
+    {'op': 'remove', 'path': '/plays/5'},
+    {'op': 'add', 'path': '/plays/x', 'value': 1},
+    {'op': 'add', 'path': 'plays', 'value': 1},
+    {'op': 'test', 'path': '/plays/0', 'value': 2},
+    {'op': 'increment', 'path': '/plays/0'},
+])
+def test_apply_patch_errors(operation):
+    with pytest.raises(PatchError):
+        apply_patch({'plays': [1]}, [operation])
+
+def test_changed_parts():
+    game = LiveGame(1)
+    changed = game._changed_parts
+    assert changed([{'op': 'add', 'path': '/liveData/plays/allPlays/-', 'value': {}}], 7) == (7, False)
+    assert changed([
+        {'op': 'replace', 'path': '/liveData/plays/allPlays/5/result/event', 'value': 'Single'},
+        {'op': 'add', 'path': '/liveData/plays/allPlays/2/playEvents/-', 'value': {}},
+    ], 7) == (2, False)
+    assert changed([{'op': 'move', 'from': '/liveData/plays/allPlays/1', 'path': '/x'}], 7) == (1, False)
+    assert changed([{'op': 'replace', 'path': '/liveData/boxscore/teams/away/players/ID1/stats', 'value': {}}], 7) == (7, True)
+    assert changed([{'op': 'replace', 'path': '/liveData', 'value': {}}], 7) == (0, True)
+    assert changed([{'op': 'replace', 'path': '/metaData/timeStamp', 'value': 'x'}], 7) == (7, False)
+
+def test_replay(monkeypatch, replay):
+    steps = replay['steps']
+    game_id = replay['game_id']
+    refetches = [step['refetch'] for step in steps if 'refetch' in step]
+    server = serve(monkeypatch, [replay['initial']] + refetches, [step['response'] for step in steps])
+    game = LiveGame(game_id)
+
+    update = game.update()
+    assert update.full_refresh
+    assert keys(update.pitches) == set(parsed_pitches(replay['initial'], game_id))
+
+    # appended plays and events, a runner movement and a new box score
+    update = game.update()
+    assert not update.full_refresh
+    assert server.requests[-1] == ('gamefeed_diff', {'startTimecode': replay['initial']['metaData']['timeStamp']})
+    # (2, 1) changes too: the runner now listed on play 2 sets its runner_on_1b
+    assert keys(update.pitches) == {(2, 1), (2, 2), (3, 1)}
+    assert [b.playerid for b in update.batter_boxscores] == [596019]
+    assert update.timecode == steps[0]['expected']['metaData']['timeStamp']
+    assert {(p.ab_number, p.pitch_number): p for p in game.pitches} == parsed_pitches(steps[0]['expected'], game_id)
+
+    # a corrected call, a removed and re-inserted pitch, box score replace and remove
+    update = game.update()
+    assert not update.full_refresh
+    assert keys(update.pitches) == {(1, 1), (3, 1)}
+    assert {b.playerid for b in update.batter_boxscores} == {545361, 592450}
+    assert {(p.ab_number, p.pitch_number): p for p in game.pitches} == parsed_pitches(steps[1]['expected'], game_id)
+    assert game.feed == steps[1]['expected']
+
+    # a patch from an older timecode is dropped and the full feed downloaded again
+    update = game.update()
+    assert update.full_refresh
+    assert [endpoint for endpoint, _ in server.requests] == ['gamefeed', 'gamefeed_diff', 'gamefeed_diff', 'gamefeed_diff', 'gamefeed']
+    assert game.feed == steps[2]['expected']
+    assert game.is_final
+    assert {(p.ab_number, p.pitch_number): p for p in game.pitches} == parsed_pitches(steps[2]['expected'], game_id)
+
+def test_patch_that_does_not_apply_refetches(monkeypatch, replay):
+    initial = replay['initial']
+    # a patch made against a feed with more plays than ours
+    bad = [{'diff': [
+        {'op': 'replace', 'path': '/metaData/timeStamp', 'value': '20240328_201500'},
+        {'op': 'replace', 'path': '/liveData/plays/allPlays/9/count/outs', 'value': 1},
+    ]}]
+    server = serve(monkeypatch, [initial, replay['steps'][0]['expected']], [bad])
+    game = LiveGame(replay['game_id'])
+    game.update()
+    update = game.update()
+    assert update.full_refresh
+    assert [endpoint for endpoint, _ in server.requests] == ['gamefeed', 'gamefeed_diff', 'gamefeed']
+    assert game.feed == replay['steps'][0]['expected']
+
+def test_full_feed_from_diff_endpoint(monkeypatch, replay):
+    expected = replay['steps'][0]['expected']
+    serve(monkeypatch, [replay['initial']], [expected])
+    game = LiveGame(replay['game_id'])
+    game.update()
+    update = game.update()
+    assert update.full_refresh
+    assert game.feed == expected
+    assert keys(update.pitches) == {(2, 1), (2, 2), (3, 1)}
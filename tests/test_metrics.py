@@ -0,0 +1,77 @@
+import pytest
+
+import metrics
+import mlbfetch
+import utils
+from conftest import recorded_text
+from metrics import Metrics, ParseEvent, RequestEvent
+from utils import DiskCache
+
+
+@pytest.fixture
+def events() -> list:
+    events = []
+    metrics.add_hook(events.append)
+    yield events
+    metrics.remove_hook(events.append)
+
+@pytest.fixture
+def collector():
+    collector = Metrics()
+    metrics.add_hook(collector)
+    yield collector
+    metrics.remove_hook(collector)
+
+def test_fetch_emits_a_request_and_a_parse_event(recorded_session, recorded_feeds, events):
+    game_id = next(iter(recorded_feeds))
+    mlbfetch.gamefeed(game_id)
+    assert [type(e) for e in events] == [RequestEvent, ParseEvent]
+    request, parse = events
+    assert (request.endpoint, request.status, request.cache_hit, request.error) == ('gamefeed', 200, False, None)
+    assert request.url == mlbfetch._gamefeed_request(game_id)[0]
+    assert request.bytes == len(recorded_text(request.url).encode('utf-8'))
+    assert (parse.endpoint, parse.error) == ('gamefeed', None)
+    assert parse.duration > 0
+
+def test_cache_hits_are_flagged(recorded_session, recorded_feeds, events, tmp_path):
+    previous = utils.get_cache()
+    utils.set_cache(DiskCache(str(tmp_path / 'cache')))
+    try:
+        game_id = next(iter(recorded_feeds))
+        mlbfetch.gamefeed(game_id)
+        mlbfetch.gamefeed(game_id)
+    finally:
+        utils.set_cache(previous)
+    requests = [e for e in events if isinstance(e, RequestEvent)]
+    assert [(e.status, e.cache_hit) for e in requests] == [(200, False), (None, True)]
+
+def test_parse_errors_are_emitted(events):
+    with pytest.raises(KeyError):
+        metrics.parse('teams', lambda data: data['teams'], {})
+    assert len(events) == 1
+    assert events[0].endpoint == 'teams' and 'KeyError' in events[0].error
+
+def test_no_events_without_hooks(recorded_session, recorded_feeds, monkeypatch):
+    emitted = []
+    monkeypatch.setattr(metrics, 'emit', emitted.append)
+    mlbfetch.gamefeed(next(iter(recorded_feeds)))
+    assert emitted == []
+
+def test_summary_counts(recorded_session, recorded_feeds, collector):
+    game_ids = list(recorded_feeds)
+    mlbfetch.gamefeeds(game_ids + [1], max_workers=2)
+    mlbfetch.schedule('2024-03-28', '2024-03-29')
+    summary = collector.summary()
+    assert sorted(summary.index) == ['gamefeed', 'schedule']
+    gamefeed = summary.loc['gamefeed']
+    assert gamefeed['requests'] == len(game_ids) + 1
+    assert gamefeed['status_200'] == len(game_ids)
+    assert gamefeed['status_404'] == 1
+    assert gamefeed['errors'] == 1
+    assert gamefeed['cache_hits'] == 0
+    assert gamefeed['parse_errors'] == 0
+    assert summary.loc['schedule', 'requests'] == 1
+    assert summary.loc['schedule', 'latency_p50_ms'] >= 0
+    collector.reset()
+    assert collector.summary().empty
+    assert set(metrics.COUNT_COLUMNS) <= set(collector.summary().columns)
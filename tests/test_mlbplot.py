@@ -0,0 +1,38 @@
+import matplotlib
+
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import pandas as pd
+
+import mlbplot
+from mlbplot import PlotJob
+
+
+def test_finish_shows_before_closing(monkeypatch, tmp_path):
+    fig = plt.figure()
+    shown_open = []
+    monkeypatch.setattr(plt, 'show', lambda: shown_open.append(plt.fignum_exists(fig.number)))
+    mlbplot._finish(fig, str(tmp_path / 'chart.png'), show=True)
+    assert shown_open == [True]
+    assert not plt.fignum_exists(fig.number)
+    assert (tmp_path / 'chart.png').exists()
+
+def test_render_batch_submits_a_bounded_window(tmp_path):
+    pulled = []
+    def jobs():
+        for i in range(6):
+            pulled.append(i)
+            yield PlotJob('no_such_chart', str(tmp_path / f'{i}.png'))
+    pulled_at_error = []
+    written = mlbplot.render_batch(jobs(), max_workers=1, on_error=lambda job, e: pulled_at_error.append(len(pulled)))
+    assert written == []
+    assert len(pulled_at_error) == 6
+    # the first failure is seen before more than 2 * max_workers jobs were taken
+    assert pulled_at_error[0] <= 2
+
+def test_render_batch_writes_charts(tmp_path):
+    df = pd.DataFrame({'px': [0.1, -0.4, 0.6], 'pz': [2.5, 3.1, 1.9], 'pitch_type': ['FF', 'SL', 'FF']})
+    path = str(tmp_path / 'out' / 'locations.png')
+    assert mlbplot.render_batch([PlotJob('pitch_locations', path, (df,))], max_workers=1) == [path]
+    assert (tmp_path / 'out' / 'locations.png').exists()
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+import mlbfetch
+import ratelimit
+from ratelimit import RequestScheduler, TokenBucket
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(ratelimit.time, 'monotonic', clock)
+    return clock
+
+def test_token_bucket(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    assert [bucket.take() for _ in range(3)] == [0, 0, 0]
+    assert bucket.take() == pytest.approx(0.5)
+    clock.now += 0.25
+    assert bucket.take() == pytest.approx(0.25)
+    clock.now += 0.25
+    assert bucket.take() == 0
+    # refills up to burst, never beyond
+    clock.now += 60
+    assert [bucket.take() for _ in range(3)] == [0, 0, 0]
+    assert bucket.take() > 0
+
+def test_hosts_without_a_limit_are_not_delayed():
+    scheduler = RequestScheduler(limits={'slow.example.com': (1, 1)})
+    assert [scheduler.acquire('fast.example.com') for _ in range(50)] == [0] * 50
+    scheduler.configure('slow.example.com', None)
+    assert [scheduler.acquire('slow.example.com') for _ in range(50)] == [0] * 50
+
+def test_rate_is_enforced():
+    scheduler = RequestScheduler(limits={'api.example.com': (50, 1)})
+    start = time.monotonic()
+    for _ in range(6):
+        scheduler.acquire('api.example.com')
+    # one request at once, then one every 20 ms
+    assert time.monotonic() - start >= 5 / 50 * 0.9
+
+def wait_for_queue(scheduler: RequestScheduler, host: str, length: int):
+    deadline = time.monotonic() + 5
+    while len(scheduler._queues.get(host, [])) < length:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+def test_waiting_requests_are_served_by_priority():
+    host = 'api.example.com'
+    scheduler = RequestScheduler(limits={host: (20, 1)})
+    scheduler.acquire(host)
+    order = []
+    def request(name, priority):
+        scheduler.acquire(host, priority)
+        order.append(name)
+    threads = []
+    for name, priority in [('backfill 1', ratelimit.PRIORITY_BACKFILL), ('default', ratelimit.PRIORITY_DEFAULT),
+                           ('backfill 2', ratelimit.PRIORITY_BACKFILL), ('live', ratelimit.PRIORITY_LIVE)]:
+        thread = threading.Thread(target=request, args=(name, priority))
+        thread.start()
+        threads.append(thread)
+        wait_for_queue(scheduler, host, len(threads))
+    for thread in threads:
+        thread.join(5)
+    assert order == ['live', 'default', 'backfill 1', 'backfill 2']
+
+def test_priority_carries_over_to_worker_threads():
+    assert ratelimit.current_priority() == ratelimit.PRIORITY_DEFAULT
+    with ratelimit.request_priority(ratelimit.PRIORITY_LIVE):
+        results = mlbfetch._iter_concurrent(lambda _: ratelimit.current_priority(), range(4), max_workers=2)
+        assert [priority for _, priority, _ in results] == [ratelimit.PRIORITY_LIVE] * 4
+    assert ratelimit.current_priority() == ratelimit.PRIORITY_DEFAULT
+
+def test_cancelled_async_request_leaves_the_queue():
+    host = 'api.example.com'
+    scheduler = RequestScheduler(limits={host: (2, 1)})
+
+    async def main():
+        scheduler.acquire(host)
+        waiting = asyncio.ensure_future(scheduler.acquire_async(host, ratelimit.PRIORITY_LIVE))
+        await asyncio.sleep(0.01)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        # the next request is not stuck behind the cancelled one
+        return await scheduler.acquire_async(host)
+
+    assert asyncio.run(main()) < 1
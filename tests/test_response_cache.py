@@ -0,0 +1,109 @@
+import os
+
+import pytest
+
+import utils
+from utils import DiskCache, ResponseCache
+
+
+def test_incomplete_backend_fails_on_construction():
+    class GetOnly(ResponseCache):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnly()
+
+def test_disk_cache_is_a_response_cache(tmp_path):
+    assert isinstance(DiskCache(str(tmp_path)), ResponseCache)
+
+class Clock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(utils.time, 'time', clock)
+    return clock
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = DiskCache(str(tmp_path / 'cache'))
+    previous = utils.get_cache()
+    utils.set_cache(cache)
+    yield cache
+    utils.set_cache(previous)
+
+def test_entries_expire_after_ttl(cache, clock):
+    cache.set('live', '{"a": 1}', 15)
+    cache.set('final', '{"b": 2}', utils.TTL_FOREVER)
+    clock.now += 14
+    assert cache.get('live') == '{"a": 1}'
+    clock.now += 2
+    assert cache.get('live') is None
+    assert not os.path.exists(os.path.join(cache.path, 'live'))
+    clock.now += 10 ** 9
+    assert cache.get('final') == '{"b": 2}'
+
+def test_least_recently_used_entries_are_evicted(tmp_path, clock):
+    cache = DiskCache(str(tmp_path / 'cache'), max_bytes=1000)
+    for key in 'abc':
+        cache.set(key, 'x' * 300, 60)
+    cache.get('a')
+    cache.set('d', 'x' * 300, 60)
+    assert cache.get('b') is None
+    assert [cache.get(key) is not None for key in 'acd'] == [True, True, True]
+    assert sum(os.path.getsize(os.path.join(cache.path, name)) for name in os.listdir(cache.path)) <= 1000
+
+def test_index_is_rebuilt_from_disk(tmp_path, clock):
+    path = str(tmp_path / 'cache')
+    first = DiskCache(path, max_bytes=1000)
+    for key in 'abc':
+        clock.now += 1
+        first.set(key, 'x' * 300, 60)
+    # a new instance orders entries by modification time
+    for key, mtime in zip('abc', (3, 1, 2)):
+        os.utime(os.path.join(path, key), (mtime, mtime))
+    second = DiskCache(path, max_bytes=1000)
+    second.set('d', 'x' * 300, 60)
+    assert second.get('b') is None
+    assert second.get('a') is not None
+
+def test_files_removed_behind_the_index(tmp_path, clock):
+    cache = DiskCache(str(tmp_path / 'cache'), max_bytes=1000)
+    for key in 'abc':
+        cache.set(key, 'x' * 300, 60)
+    os.remove(os.path.join(cache.path, 'a'))
+    assert cache.get('a') is None
+    # the missing entry no longer counts against max_bytes, so nothing is evicted
+    cache.set('d', 'x' * 300, 60)
+    assert [cache.get(key) is not None for key in 'bcd'] == [True, True, True]
+
+def test_clear(cache, clock):
+    cache.set('a', '1', 60)
+    cache.clear()
+    assert cache.get('a') is None
+    assert os.listdir(cache.path) == []
+
+def test_cache_store_ttl(cache, clock):
+    url = 'https://statsapi.mlb.com/api/v1.1/game/1/feed/live'
+    utils.cache_store(url, None, lambda data: 0 if data['live'] else utils.TTL_FOREVER, '{"live": true}', {'live': True})
+    assert utils.cache_lookup(url, None, utils.TTL_FOREVER) is None
+    utils.cache_store(url, None, lambda data: 0 if data['live'] else utils.TTL_FOREVER, '{"live": false}', {'live': False})
+    assert utils.cache_lookup(url, None, utils.TTL_FOREVER) == '{"live": false}'
+    # requests with a ttl of 0 neither read nor write the cache
+    assert utils.cache_lookup(url, None, utils.TTL_NONE) is None
+    utils.cache_store(url, {'x': 1}, utils.TTL_NONE, '{}', {})
+    assert utils.cache_lookup(url, {'x': 1}, 60) is None
+
+def test_cached_requests_skip_the_network(recorded_session, cache, recorded_feeds):
+    import mlbfetch
+    game_id = next(iter(recorded_feeds))
+    first = mlbfetch.gamefeed(game_id)
+    second = mlbfetch.gamefeed(game_id)
+    assert len(recorded_session.requested) == 1
+    assert [p.id for p in first.pitches] == [p.id for p in second.pitches]
@@ -0,0 +1,28 @@
+import mlbfetch
+from conftest import recorded_text
+
+PAGE_URL = mlbfetch._savant_batter_page_request(660271)[0]
+
+
+def test_statcast_ignores_other_scripts():
+    seasons = mlbfetch._savant_statcast(recorded_text(PAGE_URL), 660271)
+    assert seasons and all(season['year'] != 1900 for season in seasons)
+
+def test_statcast_missing_from_server_vals():
+    page = (
+        '<script>var serverVals = {\n    playerId: 660271,\n};</script>\n'
+        '<script>var other = {\n    statcast: [{"year": 1900}]\n};</script>'
+    )
+    assert mlbfetch._savant_statcast(page, 660271) == []
+
+def test_parsed_page():
+    page = mlbfetch._parse_savant_batter_page(recorded_text(PAGE_URL), 660271)
+    assert page.batter_id == 660271
+    assert len(page.savant_seasons) > 0
+
+def test_batter_pages_are_keyed_by_player(recorded_session):
+    errors = []
+    response = mlbfetch.savant_batter_pages([1, 660271, 2], max_workers=2, on_error=lambda p_id, e: errors.append(p_id))
+    assert list(response.pages) == [660271]
+    assert response.pages[660271].batter_id == 660271
+    assert sorted(response.errors) == sorted(errors) == [1, 2]
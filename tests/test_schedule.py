@@ -0,0 +1,21 @@
+import asyncio
+
+import pytest
+
+import aio
+import mlbfetch
+
+
+def test_schedule_chunks():
+    assert mlbfetch._schedule_chunks('2024-03-28', '2024-04-03', None) == [('2024-03-28', '2024-04-03')]
+    assert mlbfetch._schedule_chunks('2024-03-28', '2024-04-03', 3) == [
+        ('2024-03-28', '2024-03-30'), ('2024-03-31', '2024-04-02'), ('2024-04-03', '2024-04-03'),
+    ]
+    assert mlbfetch._schedule_chunks('2024-03-28', '2024-03-28', 1) == [('2024-03-28', '2024-03-28')]
+
+@pytest.mark.parametrize('chunk_days', [0, -1, -30])
+def test_schedule_rejects_chunk_days_below_one(chunk_days):
+    with pytest.raises(ValueError):
+        mlbfetch.schedule('2024-03-28', '2024-04-03', chunk_days=chunk_days)
+    with pytest.raises(ValueError):
+        asyncio.run(aio.schedule('2024-03-28', '2024-04-03', chunk_days=chunk_days))
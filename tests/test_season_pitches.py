@@ -0,0 +1,86 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+import requests
+
+import mlbfetch
+
+START, END = '2024-03-28', '2024-03-29'
+
+
+def schedule_url(hydrate) -> str:
+    url, params, _ = mlbfetch._schedule_request(START, END, 1, hydrate)
+    return requests.Request('GET', url, params=params).prepare().url
+
+@pytest.fixture
+def serve_schedule(recorded_session):
+    # season_pitches asks for the schedule without hydration, answer with the
+    # recorded (hydrated) one and the given status per game
+    from conftest import recorded_text
+    recorded = json.loads(recorded_text(schedule_url(mlbfetch.SCHEDULE_HYDRATE)))
+    def serve(statuses: dict[int, str]):
+        data = json.loads(json.dumps(recorded))
+        for day in data['dates']:
+            for game in day['games']:
+                game['status']['statusCode'] = statuses.get(game['gamePk'], game['status']['statusCode'])
+        recorded_session.responses[schedule_url(())] = json.dumps(data)
+    return serve
+
+def feed_requests(adapter) -> list[str]:
+    return [url for url in adapter.requested if '/feed/live' in url]
+
+def files(dest: str) -> list[str]:
+    return sorted(os.path.relpath(os.path.join(root, name), dest) for root, _, names in os.walk(dest) for name in names)
+
+def test_season_pitches(recorded_session, serve_schedule, recorded_feeds, tmp_path):
+    dest = str(tmp_path / 'mlb')
+    serve_schedule({747060: 'I'})
+    loaded = mlbfetch.season_pitches(2024, dest, START, END, max_workers=2)
+    assert sorted(g.id for g in loaded) == [745444, 746165]
+    assert len(feed_requests(recorded_session)) == 2
+    assert 'games/season=2024/game_date=2024-03-28/745444.parquet' in files(dest)
+    assert 'pitches/season=2024/game_date=2024-03-28/746165.parquet' in files(dest)
+    assert not any(name.endswith('.tmp') for name in files(dest))
+
+    pitches = pd.read_parquet(os.path.join(dest, 'pitches'))
+    expected = sum(len(mlbfetch._parse_gamefeed(recorded_feeds[g], g).pitches) for g in (745444, 746165))
+    assert len(pitches) == expected
+    assert set(pitches['gameid']) == {745444, 746165}
+    assert set(pitches['season'].astype(str)) == {'2024'}
+    assert set(pitches['game_date'].astype(str)) == {'2024-03-28'}
+
+    # a second run finds every final game on disk and downloads nothing
+    assert len(mlbfetch.season_pitches(2024, dest, START, END, max_workers=2)) == 0
+    assert len(feed_requests(recorded_session)) == 2
+
+    # once the last game is final it is the only one fetched
+    serve_schedule({})
+    loaded = mlbfetch.season_pitches(2024, dest, START, END, max_workers=2)
+    assert [g.id for g in loaded] == [747060]
+    assert len(feed_requests(recorded_session)) == 3
+    assert 'pitches/season=2024/game_date=2024-03-29/747060.parquet' in files(dest)
+
+def test_partial_writes_are_reloaded(recorded_session, serve_schedule, tmp_path):
+    dest = str(tmp_path / 'mlb')
+    serve_schedule({})
+    # a run interrupted while writing 747060 leaves only a temporary file
+    partition = os.path.join(dest, 'games', 'season=2024', 'game_date=2024-03-29')
+    os.makedirs(partition)
+    open(os.path.join(partition, '747060.parquet.tmp'), 'w').close()
+    loaded = mlbfetch.season_pitches(2024, dest, START, END)
+    assert sorted(g.id for g in loaded) == [745444, 746165, 747060]
+    assert os.path.exists(os.path.join(partition, '747060.parquet'))
+
+def test_failed_games_are_retried_on_the_next_run(recorded_session, serve_schedule, tmp_path):
+    dest = str(tmp_path / 'mlb')
+    serve_schedule({})
+    failing = mlbfetch._gamefeed_request(746165)[0]
+    recorded_session.responses[failing] = 'Service Unavailable'
+    errors = []
+    loaded = mlbfetch.season_pitches(2024, dest, START, END, on_error=lambda g_id, e: errors.append(g_id))
+    assert sorted(g.id for g in loaded) == [745444, 747060]
+    assert errors == [746165]
+    del recorded_session.responses[failing]
+    assert [g.id for g in mlbfetch.season_pitches(2024, dest, START, END)] == [746165]
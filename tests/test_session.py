@@ -0,0 +1,88 @@
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import metrics
+import ratelimit
+import utils
+
+URL = 'https://statsapi.mlb.com/api/v1/teams'
+
+
+class FlakyAdapter(HTTPAdapter):
+    # answers with the given statuses in turn, then 200
+    def __init__(self, statuses, retry_after='0', **kwargs):
+        super().__init__(**kwargs)
+        self.statuses = list(statuses)
+        self.retry_after = retry_after
+        self.sent = 0
+
+    def send(self, request, **kwargs):
+        self.sent += 1
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        response.status_code = self.statuses.pop(0) if self.statuses else 200
+        response.headers['Retry-After'] = self.retry_after
+        response._content = b'{"teams": []}' if response.status_code == 200 else b'{}'
+        return response
+
+@pytest.fixture
+def acquired(monkeypatch) -> list:
+    hosts = []
+    monkeypatch.setattr(ratelimit, 'acquire', lambda host, priority=None: hosts.append(host) or 0)
+    return hosts
+
+def install(adapter) -> requests.Session:
+    session = requests.Session()
+    session.mount('https://', adapter)
+    utils.set_session(session)
+    return session
+
+@pytest.fixture(autouse=True)
+def restore_session():
+    cache = utils.get_cache()
+    utils.set_cache(None)
+    yield
+    utils.set_session(None)
+    utils.set_cache(cache)
+
+def test_statuses_are_retried_behind_the_rate_limiter(acquired):
+    adapter = FlakyAdapter([503, 429], max_retries=Retry(total=3, backoff_factor=0))
+    install(adapter)
+    events = []
+    metrics.add_hook(events.append)
+    try:
+        assert utils.get_request_json(URL, endpoint='teams') == {'teams': []}
+    finally:
+        metrics.remove_hook(events.append)
+    assert adapter.sent == 3
+    assert acquired == ['statsapi.mlb.com'] * 3
+    assert [(e.endpoint, e.status, e.retries) for e in events] == [('teams', 200, 2)]
+
+def test_last_response_is_returned_when_retries_run_out(acquired):
+    adapter = FlakyAdapter([503, 503, 503], max_retries=Retry(total=1, backoff_factor=0))
+    install(adapter)
+    assert utils.get_request_json(URL) == {}
+    assert adapter.sent == 2
+    assert len(acquired) == 2
+
+def test_sessions_without_retries_send_once(acquired):
+    adapter = FlakyAdapter([503])
+    install(adapter)
+    assert utils.get_request_json(URL) == {}
+    assert adapter.sent == 1
+
+def test_retry_after_is_respected(acquired, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(utils.time, 'sleep', sleeps.append)
+    install(FlakyAdapter([429], retry_after='7', max_retries=Retry(total=2, backoff_factor=0.5)))
+    utils.get_request_json(URL)
+    assert sleeps == [7]
+
+def test_make_session_leaves_statuses_to_get():
+    retry = utils.make_session(max_retries=4).get_adapter(URL).max_retries
+    assert retry.total == 4
+    for status in utils.RETRY_STATUSES:
+        assert not retry.is_retry('GET', status, has_retry_after=True)
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import mlbfetch
+import trajectory
+from datatypes import ColumnEntryList, Pitch
+
+# a fastball's kinematic fit and its metrics, checked against stepping the fit
+# through its flight numerically
+KNOWN_PITCH = {
+    'x0': -1.8, 'y0': 50.0, 'z0': 5.9, 'vx0': 6.5, 'vy0': -137.0, 'vz0': -6.0,
+    'ax': -14.0, 'ay': 30.0, 'az': -16.0, 'extension': 6.5,
+}
+KNOWN_METRICS = {
+    'release_pos_x': -1.995, 'release_pos_y': 54.0, 'release_pos_z': 6.068,
+    'vx_f': 1.326, 'vy_f': -125.913, 'vz_f': -11.913,
+    'plate_speed': 86.238, 'vaa': -5.405, 'haa': 0.603,
+    'plate_time': 0.399, 'pfx_x': -7.359, 'pfx_z': 8.502,
+}
+MISSING_PITCH = dict.fromkeys(KNOWN_PITCH, np.nan)
+
+
+def test_known_pitch():
+    metrics = trajectory.trajectory_metrics(pd.DataFrame([KNOWN_PITCH, MISSING_PITCH]))
+    assert set(metrics) == set(trajectory.METRIC_COLUMNS)
+    for name, expected in KNOWN_METRICS.items():
+        assert metrics[name][0] == pytest.approx(expected, abs=1e-3), name
+        assert np.isnan(metrics[name][1]), name
+
+def test_columnar_and_dataframe_inputs_agree(recorded_feeds):
+    game_id, feed = next(iter(recorded_feeds.items()))
+    pitches = mlbfetch._parse_gamefeed(feed, game_id).pitches
+    from_rows = trajectory.trajectory_metrics(pitches)
+    from_columns = trajectory.trajectory_metrics(ColumnEntryList.from_entries(Pitch, pitches))
+    for name in trajectory.METRIC_COLUMNS:
+        np.testing.assert_allclose(from_rows[name], from_columns[name])
+    assert np.all(from_rows['release_pos_y'] > 50)
+
+def test_add_trajectory_metrics_does_not_modify_input():
+    df = pd.DataFrame([KNOWN_PITCH])
+    added = trajectory.add_trajectory_metrics(df)
+    assert list(df.columns) == list(KNOWN_PITCH)
+    assert list(added.columns) == list(KNOWN_PITCH) + list(trajectory.METRIC_COLUMNS)
+    assert added['vaa'][0] == pytest.approx(KNOWN_METRICS['vaa'], abs=1e-3)
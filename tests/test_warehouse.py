@@ -0,0 +1,42 @@
+import sqlite3
+
+import pytest
+
+import mlbfetch
+import warehouse
+from warehouse import Warehouse
+
+
+def test_pitches_without_play_id_are_upserted_once(recorded_feeds):
+    game_id, feed = next(iter(recorded_feeds.items()))
+    response = mlbfetch._parse_gamefeed(feed, game_id)
+    for pitch in response.pitches[::3]:
+        pitch.id = None
+    wh = Warehouse()
+    wh.upsert(response)
+    wh.upsert(response)
+    assert len(wh.pitches(gameid=game_id)) == len(response.pitches)
+    assert wh.query("SELECT count(*) AS n FROM pitches WHERE id IS NULL")['n'][0] == len(response.pitches[::3])
+
+def test_reopens_current_schema(tmp_path):
+    path = str(tmp_path / 'mlb.sqlite')
+    Warehouse(path).close()
+    with Warehouse(path) as wh:
+        assert wh.game_ids() == set()
+
+def test_older_schema_fails_loudly(tmp_path):
+    path = str(tmp_path / 'old.sqlite')
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE pitches (id TEXT PRIMARY KEY, gameid INTEGER)")
+    conn.close()
+    with pytest.raises(ValueError, match='schema version 0'):
+        Warehouse(path)
+
+def test_newer_schema_fails_loudly(tmp_path):
+    path = str(tmp_path / 'new.sqlite')
+    Warehouse(path).close()
+    conn = sqlite3.connect(path)
+    conn.execute(f"PRAGMA user_version = {warehouse.SCHEMA_VERSION + 1}")
+    conn.close()
+    with pytest.raises(ValueError):
+        Warehouse(path)